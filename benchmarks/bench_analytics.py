@@ -0,0 +1,106 @@
+"""Compare EpisodeColumns aggregations with plain loops over episode dicts.
+
+Generates a catalog of episode dicts spread over several podcasts, then
+times plays per season, duration statistics, top-N and publishing cadence
+computed three ways: a naive loop over the dicts, ``EpisodeColumns`` with
+plain Python loops, and ``EpisodeColumns`` with NumPy (when installed).
+Building the columns is timed separately, since it is paid once per
+catalog and amortized over every query.
+
+Run with ``python benchmarks/bench_analytics.py [episodes] [podcasts]``.
+"""
+import heapq
+import json
+import statistics
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+from buzzsprout_client.analytics import EpisodeColumns, np
+from buzzsprout_client.streaming import parse_datetime
+
+
+def make_catalog(episodes, podcasts):
+    start = datetime(2015, 1, 1, tzinfo=timezone.utc)
+    catalog = defaultdict(list)
+    for i in range(episodes):
+        podcast_id = i % podcasts + 1
+        catalog[podcast_id].append({
+            "id": 1000000 + i,
+            "title": f"Episode {i}",
+            "total_plays": (i * 7919) % 50000,
+            "duration": 600 + (i * 31) % 5400,
+            "season_number": i // (podcasts * 50) + 1,
+            "episode_number": i // podcasts,
+            "published_at": (start + timedelta(days=i // podcasts * 7, hours=i % 24)).isoformat(),
+        })
+    return dict(catalog)
+
+
+def naive(catalog):
+    plays = defaultdict(lambda: defaultdict(int))
+    durations = []
+    candidates = []
+    cadence = {}
+    for podcast_id, episodes in catalog.items():
+        stamps = []
+        for episode in episodes:
+            plays[podcast_id][episode["season_number"]] += episode["total_plays"] or 0
+            if episode["duration"] is not None:
+                durations.append(episode["duration"])
+            candidates.append((episode["total_plays"], episode["id"]))
+            if episode["published_at"]:
+                stamps.append(parse_datetime(episode["published_at"]).timestamp())
+        stamps.sort()
+        gaps = [(b - a) / 86400 for a, b in zip(stamps, stamps[1:])]
+        cadence[podcast_id] = statistics.mean(gaps) if gaps else None
+    durations.sort()
+    stats = (len(durations), sum(durations), durations[len(durations) // 2])
+    top = heapq.nlargest(10, candidates)
+    return plays, stats, top, cadence
+
+
+def columnar(columns):
+    return (
+        columns.plays_by_season(),
+        columns.duration_stats(),
+        columns.top(10),
+        columns.cadence(),
+    )
+
+
+def best_of(func, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return round(min(timings), 5)
+
+
+def main():
+    episodes = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    podcasts = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    catalog = make_catalog(episodes, podcasts)
+
+    results = {"naive_dict_loop": best_of(lambda: naive(catalog))}
+    backends = [False] + ([True] if np is not None else [])
+    for use_numpy in backends:
+        name = "numpy" if use_numpy else "python"
+        results[f"build_columns_{name}"] = best_of(
+            lambda: EpisodeColumns.from_podcasts(catalog, use_numpy=use_numpy), repeat=2
+        )
+        columns = EpisodeColumns.from_podcasts(catalog, use_numpy=use_numpy)
+        results[f"columns_{name}"] = best_of(lambda: columnar(columns))
+
+    print(json.dumps({
+        "episodes": episodes,
+        "podcasts": podcasts,
+        "numpy": np.__version__ if np is not None else None,
+        "seconds": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Compare JSON decoding of episode lists with each codec.
+
+Builds ``get_episodes`` payloads of realistic episodes (as served by the
+benchmark's stand-in API) and times, per payload size:
+
+* ``response_json`` - ``requests.Response.json()``, the default path
+* ``json`` / ``orjson`` - the codecs decoding the raw body bytes
+* ``*_fields`` - the same followed by keeping four fields per episode
+
+Output is JSON with the median milliseconds per decode, MB/s and the
+Python memory still held by the decoded result.
+
+Run with ``python benchmarks/bench_codec.py [sizes] [description_size]``,
+e.g. ``python benchmarks/bench_codec.py 100,1000,10000 500``.
+"""
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fake_server  # noqa: E402
+
+from buzzsprout_client.codec import JSONCodec, OrjsonCodec, orjson, select_fields  # noqa: E402
+
+FIELDS = ("id", "title", "published_at", "duration")
+
+
+def make_response(content):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response._content = content
+    return response
+
+
+def measure(decode, content, budget=1.0):
+    """Median seconds per call, repeating for about ``budget`` seconds."""
+    decode(content)
+    timings = []
+    deadline = time.perf_counter() + budget
+    while time.perf_counter() < deadline or len(timings) < 5:
+        started = time.perf_counter()
+        decode(content)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def retained(decode, content):
+    """Bytes allocated by ``decode`` that are still held by its result."""
+    tracemalloc.start()
+    result = decode(content)
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return held
+
+
+def main():
+    sizes = [int(size) for size in (sys.argv[1] if len(sys.argv) > 1 else "100,1000,10000").split(",")]
+    description_size = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    codecs = {"json": JSONCodec()}
+    if orjson is not None:
+        codecs["orjson"] = OrjsonCodec()
+
+    variants = {"response_json": lambda content: make_response(content).json()}
+    for name, codec in codecs.items():
+        variants[name] = codec.loads
+        variants[f"{name}_fields"] = lambda content, codec=codec: select_fields(codec.loads(content), FIELDS)
+
+    results = []
+    for size in sizes:
+        episodes = [fake_server.make_episode(1, i, description_size) for i in range(1, size + 1)]
+        content = json.dumps(episodes).encode()
+        row = {"episodes": size, "bytes": len(content)}
+        for name, decode in variants.items():
+            seconds = measure(decode, content)
+            row[name] = {
+                "ms": round(seconds * 1000, 3),
+                "mb_per_s": round(len(content) / seconds / 1e6, 1),
+                "retained_bytes": retained(decode, content),
+            }
+        results.append(row)
+    print(json.dumps({"fields": FIELDS, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
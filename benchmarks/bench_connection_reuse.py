@@ -0,0 +1,128 @@
+"""Count TLS handshakes made by a client shared by many threads.
+
+Starts a local HTTPS server (using a throwaway self-signed certificate made
+with the ``openssl`` command line tool), then runs the same concurrent load
+through clients with different pool sizes and reports how many TLS
+handshakes the server saw. Every handshake beyond the thread count is a
+connection that was thrown away and re-established.
+
+Each response is delayed by ``LATENCY`` seconds to stand in for network
+latency, so requests from different threads actually overlap.
+
+Run with ``python benchmarks/bench_connection_reuse.py [threads] [requests]``.
+"""
+import http.server
+import json
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from buzzsprout_client import BuzzsproutClient
+
+LATENCY = 0.05
+BODY = json.dumps({"id": 1, "title": "Podcast"}).encode()
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+class CountingServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address, context):
+        super().__init__(address, Handler)
+        self.context = context
+        self.handshakes = 0
+        self.lock = threading.Lock()
+
+    def finish_request(self, request, client_address):
+        # Handshake in the connection's own thread, not the accept loop
+        request = self.context.wrap_socket(request, server_side=True)
+        with self.lock:
+            self.handshakes += 1
+        super().finish_request(request, client_address)
+
+
+def make_certificate(directory):
+    cert = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+         "-keyout", key, "-out", cert, "-days", "1", "-subj", "/CN=127.0.0.1",
+         "-addext", "subjectAltName=IP:127.0.0.1"],
+        check=True, capture_output=True
+    )
+    return cert, key
+
+
+def run(server, cert, threads, requests_per_thread, **client_options):
+    client = BuzzsproutClient(api_key="bench", **client_options)
+    client.base_url = f"https://127.0.0.1:{server.server_port}/api"
+    client.session.verify = cert
+    # Otherwise REQUESTS_CA_BUNDLE and friends override session.verify
+    client.session.trust_env = False
+    server.handshakes = 0
+
+    def work(_):
+        for _ in range(requests_per_thread):
+            client.get_podcast(1)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(work, range(threads)))
+    elapsed = time.perf_counter() - started
+    client.session.close()
+    total = threads * requests_per_thread
+    return {
+        "options": client_options,
+        "requests": total,
+        "tls_handshakes": server.handshakes,
+        "requests_per_second": round(total / elapsed),
+    }
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    requests_per_thread = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = make_certificate(directory)
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(cert, key)
+        server = CountingServer(("127.0.0.1", 0), context)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            results = [
+                run(server, cert, threads, requests_per_thread, keep_alive=False),
+                # requests' own default pool size
+                run(server, cert, threads, requests_per_thread, pool_maxsize=10),
+                run(server, cert, threads, requests_per_thread, pool_maxsize=threads),
+            ]
+        finally:
+            server.shutdown()
+
+    print(json.dumps({"threads": threads, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compare the memory held by episode dicts and Episode objects.
+
+Run with ``python benchmarks/bench_models.py [count]``.
+"""
+import json
+import sys
+import tracemalloc
+
+from buzzsprout_client import Episode
+
+
+def make_payload(count):
+    return json.dumps([
+        {
+            "id": 1000000 + i,
+            "title": f"Episode {i}",
+            "audio_url": f"https://www.buzzsprout.com/140447/{1000000 + i}-episode.mp3",
+            "artwork_url": "https://storage.buzzsprout.com/variants/NABbMDx7JN5bSLzLPXyj67jA/8d66eb17",
+            "description": "",
+            "summary": "",
+            "artist": "Muffin Man",
+            "tags": "news,weekly",
+            "published_at": "2019-09-12T03:00:00.000-04:00",
+            "duration": 1800 + i,
+            "hq": True,
+            "guid": f"Buzzsprout{1000000 + i}",
+            "inactive_at": None,
+            "episode_number": i,
+            "season_number": i // 50,
+            "explicit": False,
+            "private": False,
+            "total_plays": i * 3,
+        }
+        for i in range(count)
+    ])
+
+
+def measure(build):
+    tracemalloc.start()
+    objects = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, objects
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    payload = make_payload(count)
+
+    dict_size, _ = measure(lambda: json.loads(payload))
+    model_size, _ = measure(lambda: [Episode.from_dict(d) for d in json.loads(payload)])
+
+    print(json.dumps({
+        "episodes": count,
+        "dict_bytes": dict_size,
+        "model_bytes": model_size,
+        "dict_bytes_per_episode": round(dict_size / count),
+        "model_bytes_per_episode": round(model_size / count),
+        "ratio": round(model_size / dict_size, 3),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Compare one client per account with a ClientPool for many tenants.
+
+Every tenant makes one ``get_podcasts`` call against the local stand-in
+API, as an agency dashboard refreshing all accounts would. Reported per
+approach: wall time, peak Python memory while the clients are alive and the
+number of connections left open.
+
+Run with ``python benchmarks/bench_pool.py [tenants] [threads]``.
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fake_server  # noqa: E402
+
+from buzzsprout_client import BuzzsproutClient, ClientPool  # noqa: E402
+
+
+def open_connections(sessions):
+    """Idle keep-alive connections held by the adapters of ``sessions``."""
+    adapters = {id(adapter): adapter for session in sessions for adapter in session.adapters.values()}
+    return sum(
+        pool.pool.qsize() - pool.pool.queue.count(None)
+        for adapter in adapters.values()
+        for pool in adapter.poolmanager.pools._container.values()
+    )
+
+
+def run(tenants, threads, base_url, make_clients):
+    keys = [f"tenant-{i}" for i in range(tenants)]
+    tracemalloc.start()
+    started = time.perf_counter()
+    clients, sessions = make_clients(keys)
+
+    def refresh(key):
+        client = clients(key)
+        client.base_url = base_url
+        return client.get_podcasts()
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(refresh, keys))
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    result = {
+        "elapsed": round(elapsed, 3),
+        "peak_memory_bytes": peak,
+        "open_connections": open_connections(sessions()),
+    }
+    for session in sessions():
+        session.close()
+    return result
+
+
+def separate_clients(keys):
+    clients = {}
+    for key in keys:
+        clients[key] = BuzzsproutClient(key)
+        clients[key].session.trust_env = False
+    return clients.__getitem__, lambda: [client.session for client in clients.values()]
+
+
+def client_pool(keys):
+    pool = ClientPool(max_tenants=64)
+    pool.session.trust_env = False
+    return pool.client, lambda: [pool.session]
+
+
+def main():
+    tenants = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    process, base_url = fake_server.start(fake_server.ServerConfig())
+    try:
+        results = {
+            "tenants": tenants,
+            "threads": threads,
+            "separate_clients": run(tenants, threads, base_url, separate_clients),
+            "client_pool": run(tenants, threads, base_url, client_pool),
+        }
+    finally:
+        process.terminate()
+        process.join()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
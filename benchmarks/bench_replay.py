@@ -0,0 +1,63 @@
+"""Measure client calls per second when replaying a cassette.
+
+Builds a cassette in memory with one podcast, one episode and an episode
+list, then drives ``get_episode``, ``get_episodes`` and ``get_podcast``
+through a ``ReplaySession`` for a fixed time. The result is the client's own
+per-call overhead, with no network involved.
+
+Run with ``python benchmarks/bench_replay.py [seconds] [episodes]``.
+"""
+import json
+import sys
+import time
+
+import requests
+
+from buzzsprout_client import BuzzsproutClient, Cassette, ReplaySession
+
+BASE = "https://www.buzzsprout.com/api"
+
+
+def make_cassette(episodes):
+    cassette = Cassette()
+
+    def add(url, body):
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(body).encode()
+        cassette.record("GET", url, response, 0.0)
+
+    episode = {"id": 1, "title": "Episode", "artist": "Muffin Man", "tags": "news", "duration": 1800}
+    add(f"{BASE}/podcasts/1.json", {"id": 1, "title": "Podcast"})
+    add(f"{BASE}/1/episodes/1.json", episode)
+    add(f"{BASE}/1/episodes.json", [dict(episode, id=i) for i in range(episodes)])
+    return cassette
+
+
+def measure(call, seconds):
+    calls = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(1000):
+            call()
+        calls += 1000
+    return round(calls / seconds)
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    episodes = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    client = BuzzsproutClient(api_key="bench", session=ReplaySession(make_cassette(episodes)))
+    results = {
+        "replay_session_get": measure(lambda: client.session.get(f"{BASE}/1/episodes/1.json"), seconds),
+        "get_podcast": measure(lambda: client.get_podcast(1), seconds),
+        "get_episode": measure(lambda: client.get_episode(1, 1), seconds),
+        "get_episodes": measure(lambda: client.get_episodes(1), seconds),
+    }
+    print(json.dumps({"episodes": episodes, "calls_per_second": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Measure process startup time of the ``buzzsprout`` command.
+
+Runs each command in a fresh interpreter several times and reports the
+median wall time in milliseconds:
+
+* ``python -c pass`` - interpreter startup alone
+* ``python -c "import buzzsprout_client"`` - importing the package
+* ``python -c "import requests"`` - what every command used to pay up front
+* ``python -m buzzsprout_client --help`` - the CLI, up to printing help
+* ``python -m buzzsprout_client list podcasts`` without an API key - the CLI
+  up to argument validation, before any request is made
+
+Run with ``python benchmarks/bench_startup.py [runs]``.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+COMMANDS = {
+    "python": ["-c", "pass"],
+    "import_package": ["-c", "import buzzsprout_client"],
+    "import_requests": ["-c", "import requests"],
+    "cli_help": ["-m", "buzzsprout_client", "--help"],
+    "cli_usage_error": ["-m", "buzzsprout_client", "list", "podcasts"],
+}
+
+
+def measure(args, runs, env):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *args], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - started)
+    return round(statistics.median(timings) * 1000, 1)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    env = dict(os.environ)
+    env.pop("BUZZSPROUT_API_KEY", None)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    results = {name: measure(args, runs, env) for name, args in COMMANDS.items()}
+    print(json.dumps({"runs": runs, "median_ms": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
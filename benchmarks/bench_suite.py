@@ -0,0 +1,232 @@
+"""Benchmark client calls against a local stand-in Buzzsprout API.
+
+Starts ``fake_server.py`` in a child process, then runs each scenario at
+every concurrency level and reports throughput, latency percentiles, peak
+Python memory of the client process and the HTTP statuses seen. Output is
+one JSON document, so results can be stored and compared between releases.
+
+Scenarios:
+
+* ``get_episodes`` - download the episode list of a podcast
+* ``get_episode`` - fetch single episodes
+* ``update_episode`` - metadata-only PUTs
+* ``create_episode`` - POST with an ``audio_file`` read into memory
+* ``create_episode_streaming`` - the same upload with ``stream_uploads=True``
+
+Peak memory is measured with ``tracemalloc`` in a second, separate pass so
+its overhead does not skew the timings.
+
+Examples::
+
+    python benchmarks/bench_suite.py
+    python benchmarks/bench_suite.py --latency 0.05 --concurrency 1,8,32 --output results.json
+    python benchmarks/bench_suite.py --throttle 20 --governor --scenarios get_episode
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fake_server  # noqa: E402
+
+import buzzsprout_client  # noqa: E402
+from buzzsprout_client import BuzzsproutClient, RateGovernor  # noqa: E402
+
+PODCAST_ID = 1
+
+
+def scenarios(audio_path):
+    return {
+        "get_episodes": ({}, lambda client, i: client.get_episodes(PODCAST_ID)),
+        "get_episode": ({}, lambda client, i: client.get_episode(PODCAST_ID, i)),
+        "update_episode": (
+            {}, lambda client, i: client.update_episode(PODCAST_ID, i, title=f"Title {i}")
+        ),
+        "create_episode": (
+            {}, lambda client, i: client.create_episode(PODCAST_ID, f"Episode {i}", audio_file=audio_path)
+        ),
+        "create_episode_streaming": (
+            {"stream_uploads": True},
+            lambda client, i: client.create_episode(PODCAST_ID, f"Episode {i}", audio_file=audio_path)
+        ),
+    }
+
+
+def percentile(ordered, q):
+    if not ordered:
+        return None
+    rank = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def make_client(base_url, concurrency, options, governor_rate, thread_safe=False):
+    governor = RateGovernor(rate=governor_rate, burst=1) if governor_rate else None
+    client = BuzzsproutClient(
+        api_key="bench", pool_maxsize=max(concurrency, 10), governor=governor,
+        thread_safe=thread_safe, **options
+    )
+    client.base_url = base_url
+    client.session.trust_env = False
+    return client
+
+
+def run_load(client, call, concurrency, requests):
+    """Make ``requests`` calls from ``concurrency`` threads.
+
+    Returns:
+        ``(elapsed seconds, latencies, error count)``
+    """
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+    counter = iter(range(requests))
+
+    def work():
+        nonlocal errors
+        while True:
+            with lock:
+                i = next(counter, None)
+            if i is None:
+                return
+            started = time.perf_counter()
+            try:
+                call(client, i + 1)
+            except Exception:
+                with lock:
+                    errors += 1
+                continue
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for _ in range(concurrency):
+            executor.submit(work)
+    return time.perf_counter() - started, latencies, errors
+
+
+def run_scenario(name, options, call, base_url, concurrency, args):
+    statuses = Counter()
+    retries = 0
+
+    def count(event):
+        nonlocal retries
+        statuses[str(event.status)] += 1
+        retries += event.retries
+
+    requests = args.upload_requests if name.startswith("create") else args.requests
+    client = make_client(
+        base_url, concurrency, options, args.throttle if args.governor else 0, args.thread_safe
+    )
+    client.add_hook(count)
+    elapsed, latencies, errors = run_load(client, call, concurrency, requests)
+    client.session.close()
+
+    peak = None
+    if not args.no_memory:
+        client = make_client(
+            base_url, concurrency, options, args.throttle if args.governor else 0, args.thread_safe
+        )
+        tracemalloc.start()
+        run_load(client, call, concurrency, min(requests, concurrency * 2))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        client.session.close()
+
+    latencies.sort()
+    return {
+        "scenario": name,
+        "concurrency": concurrency,
+        "requests": requests,
+        "errors": errors,
+        "elapsed": round(elapsed, 4),
+        "throughput": round(len(latencies) / elapsed, 2) if elapsed else None,
+        "latency": {
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p99": percentile(latencies, 99),
+            "max": latencies[-1] if latencies else None,
+        },
+        "peak_memory_bytes": peak,
+        "statuses": dict(statuses),
+        "retries": retries,
+    }
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--latency", type=float, default=0.0, help="server delay per response in seconds")
+    parser.add_argument("--episodes", type=int, default=200, help="episodes per podcast")
+    parser.add_argument("--description-size", type=int, default=500, help="bytes of description per episode")
+    parser.add_argument("--upload-size", type=int, default=20, help="audio file size in MiB")
+    parser.add_argument("--concurrency", default="1,4,16", help="comma-separated thread counts")
+    parser.add_argument("--requests", type=int, default=200, help="calls per scenario and concurrency level")
+    parser.add_argument("--upload-requests", type=int, default=8, help="calls for upload scenarios")
+    parser.add_argument("--throttle", type=float, default=0.0, help="server requests per second, 0 for unlimited")
+    parser.add_argument("--governor", action="store_true", help="use a RateGovernor at the throttle rate")
+    parser.add_argument("--thread-safe", action="store_true", help="share the client in thread-safe mode")
+    parser.add_argument("--scenarios", help="comma-separated subset of scenarios to run")
+    parser.add_argument("--no-memory", action="store_true", help="skip the peak memory pass")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = fake_server.ServerConfig(
+        latency=args.latency,
+        episodes=args.episodes,
+        description_size=args.description_size,
+        throttle=args.throttle,
+    )
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    with tempfile.NamedTemporaryFile(suffix=".mp3") as audio:
+        audio.truncate(args.upload_size * 1024 * 1024)
+        audio.flush()
+        available = scenarios(audio.name)
+        selected = args.scenarios.split(",") if args.scenarios else list(available)
+        unknown = set(selected) - set(available)
+        if unknown:
+            sys.exit(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+        process, base_url = fake_server.start(config)
+        try:
+            results = [
+                run_scenario(name, *available[name], base_url, level, args)
+                for name in selected
+                for level in levels
+            ]
+        finally:
+            process.terminate()
+            process.join()
+
+    report = {
+        "version": buzzsprout_client.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": dict(vars(args), concurrency=levels),
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
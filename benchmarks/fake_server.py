@@ -0,0 +1,213 @@
+"""Local stand-in for the Buzzsprout API used by the benchmarks.
+
+Serves the endpoints the client uses from generated data:
+
+* ``GET /api/podcasts.json`` and ``GET /api/podcasts/<id>.json``
+* ``GET /api/<podcast_id>/episodes.json`` and ``.../episodes/<id>.json``
+* ``POST /api/<podcast_id>/episodes.json`` and ``PUT .../episodes/<id>.json``
+  (request bodies are read and discarded)
+
+Every response is delayed by ``latency`` seconds. With ``throttle`` set,
+the server admits that many requests per second and answers the rest with
+``429 Too Many Requests`` and ``Retry-After: 1``.
+
+Run standalone with ``python benchmarks/fake_server.py [port]``, or start it
+in a child process with :func:`start` so it does not share the interpreter
+(and its memory accounting) with the client being measured.
+"""
+import http.server
+import json
+import multiprocessing
+import re
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+_EPISODES = re.compile(r"^/api/(\d+)/episodes\.json$")
+_EPISODE = re.compile(r"^/api/(\d+)/episodes/(\d+)\.json$")
+_PODCAST = re.compile(r"^/api/podcasts/(\d+)\.json$")
+
+
+@dataclass
+class ServerConfig:
+    latency: float = 0.0
+    podcasts: int = 1
+    episodes: int = 100
+    description_size: int = 500
+    throttle: float = 0.0
+
+
+def make_episode(podcast_id, episode_id, description_size):
+    return {
+        "id": episode_id,
+        "title": f"Episode {episode_id}",
+        "audio_url": f"https://www.buzzsprout.com/{podcast_id}/{episode_id}-episode.mp3",
+        "artwork_url": "https://storage.buzzsprout.com/variants/artwork.jpg",
+        "description": "x" * description_size,
+        "summary": "",
+        "artist": "Muffin Man",
+        "tags": "news,weekly",
+        "published_at": "2019-09-12T03:00:00.000-04:00",
+        "duration": 1800,
+        "hq": True,
+        "guid": f"Buzzsprout{episode_id}",
+        "inactive_at": None,
+        "episode_number": episode_id % 1000,
+        "season_number": 1,
+        "explicit": False,
+        "private": False,
+        "total_plays": 0,
+    }
+
+
+class Throttle:
+    """Server-side token bucket; ``rate`` of 0 admits everything."""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def admit(self):
+        if not self.rate:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment; otherwise Nagle's algorithm and
+    # delayed ACKs add ~40ms to small responses.
+    disable_nagle_algorithm = True
+    wbufsize = -1
+
+    def _reply(self, status, body=b"", headers=None):
+        time.sleep(self.server.config.latency)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _discard_body(self):
+        remaining = int(self.headers.get("Content-Length") or 0)
+        while remaining:
+            remaining -= len(self.rfile.read(min(remaining, 1024 * 1024)))
+
+    def _throttled(self):
+        if self.server.throttle.admit():
+            return False
+        self._reply(429, b'{"error":"rate limited"}', {"Retry-After": "1"})
+        return True
+
+    def do_GET(self):
+        if self._throttled():
+            return
+        data = self.server.data
+        path = self.path.split("?", 1)[0]
+        if path == "/api/podcasts.json":
+            return self._reply(200, data.podcasts)
+        match = _PODCAST.match(path)
+        if match and int(match.group(1)) in data.podcast_ids:
+            return self._reply(200, json.dumps({"id": int(match.group(1)), "title": "Podcast"}).encode())
+        match = _EPISODES.match(path)
+        if match and int(match.group(1)) in data.podcast_ids:
+            return self._reply(200, data.episodes[int(match.group(1))])
+        match = _EPISODE.match(path)
+        if match and int(match.group(1)) in data.podcast_ids:
+            episode = make_episode(int(match.group(1)), int(match.group(2)), data.config.description_size)
+            return self._reply(200, json.dumps(episode).encode())
+        self._reply(404, b'{"error":"not found"}')
+
+    def do_POST(self):
+        self._discard_body()
+        if self._throttled():
+            return
+        match = _EPISODES.match(self.path)
+        if not match:
+            return self._reply(404, b'{"error":"not found"}')
+        episode = make_episode(int(match.group(1)), 9999999, 0)
+        self._reply(201, json.dumps(episode).encode())
+
+    def do_PUT(self):
+        self._discard_body()
+        if self._throttled():
+            return
+        match = _EPISODE.match(self.path)
+        if not match:
+            return self._reply(404, b'{"error":"not found"}')
+        episode = make_episode(int(match.group(1)), int(match.group(2)), 0)
+        self._reply(200, json.dumps(episode).encode())
+
+    def log_message(self, *args):
+        pass
+
+
+class Data:
+    """Response bodies generated once up front."""
+
+    def __init__(self, config):
+        self.config = config
+        self.podcast_ids = list(range(1, config.podcasts + 1))
+        self.podcasts = json.dumps(
+            [{"id": podcast_id, "title": f"Podcast {podcast_id}"} for podcast_id in self.podcast_ids]
+        ).encode()
+        self.episodes = {
+            podcast_id: json.dumps([
+                make_episode(podcast_id, podcast_id * 1000000 + i, config.description_size)
+                for i in range(config.episodes)
+            ]).encode()
+            for podcast_id in self.podcast_ids
+        }
+
+
+class FakeBuzzsprout(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address, config):
+        super().__init__(address, Handler)
+        self.config = config
+        self.data = Data(config)
+        self.throttle = Throttle(config.throttle)
+
+
+def _serve(config, ready):
+    server = FakeBuzzsprout(("127.0.0.1", 0), ServerConfig(**config))
+    ready.put(server.server_port)
+    server.serve_forever()
+
+
+def start(config):
+    """Start the server in a child process.
+
+    Returns:
+        ``(process, base_url)``; terminate the process when done
+    """
+    ready = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(asdict(config), ready), daemon=True)
+    process.start()
+    port = ready.get(timeout=30)
+    return process, f"http://127.0.0.1:{port}/api"
+
+
+def main():
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+    server = FakeBuzzsprout(("127.0.0.1", port), ServerConfig())
+    print(f"Serving on http://127.0.0.1:{server.server_port}/api")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,76 @@
-from .client import BuzzsproutClient
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-__all__ = ["BuzzsproutClient"]
+# Public names and the modules defining them. Modules are imported on first
+# attribute access, so `import buzzsprout_client` (and the CLI) does not pay
+# for requests/httpx until a client is actually used.
+_EXPORTS = {
+    "BuzzsproutClient": "client",
+    "AsyncBuzzsproutClient": "async_client",
+    "HTTPCache": "cache",
+    "MemoryCache": "cache",
+    "ClientPool": "pool",
+    "Cassette": "cassette",
+    "RecordingSession": "cassette",
+    "ReplaySession": "cassette",
+    "EpisodeMirror": "mirror",
+    "FeedCache": "feeds",
+    "IngestJournal": "ingest",
+    "MetricsCollector": "instrumentation",
+    "RequestEvent": "instrumentation",
+    "Episode": "models",
+    "Podcast": "models",
+    "RateGovernor": "ratelimit",
+    "UploadLedger": "dedup",
+    "EpisodeWatcher": "watch",
+}
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import BuzzsproutClient
+    from .async_client import AsyncBuzzsproutClient
+    from .cache import HTTPCache, MemoryCache
+    from .cassette import Cassette, RecordingSession, ReplaySession
+    from .dedup import UploadLedger
+    from .feeds import FeedCache
+    from .ingest import IngestJournal
+    from .instrumentation import MetricsCollector, RequestEvent
+    from .mirror import EpisodeMirror
+    from .models import Episode, Podcast
+    from .pool import ClientPool
+    from .ratelimit import RateGovernor
+    from .watch import EpisodeWatcher
+
+__all__ = [
+    "BuzzsproutClient",
+    "AsyncBuzzsproutClient",
+    "HTTPCache",
+    "MemoryCache",
+    "ClientPool",
+    "Cassette",
+    "RecordingSession",
+    "ReplaySession",
+    "EpisodeMirror",
+    "FeedCache",
+    "IngestJournal",
+    "MetricsCollector",
+    "RequestEvent",
+    "Episode",
+    "Podcast",
+    "RateGovernor",
+    "UploadLedger",
+    "EpisodeWatcher",
+]
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
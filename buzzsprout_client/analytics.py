@@ -0,0 +1,415 @@
+import csv
+import heapq
+import json
+import math
+import os
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Dict, IO, Iterable, List, Mapping, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .models import as_dict
+from .streaming import parse_datetime
+
+# Missing integers are stored as -1 (plays, durations and numbers are never
+# negative) and missing timestamps as NaN.
+MISSING = -1
+
+INT_COLUMNS = ("podcast_id", "id", "total_plays", "duration", "season_number", "episode_number")
+FLOAT_COLUMNS = ("published_at",)
+CSV_COLUMNS = ("podcast_id", "id", "title", "published_at", "duration",
+               "total_plays", "season_number", "episode_number")
+
+DAY = 86400.0
+
+
+def _int(value: Any) -> int:
+    return MISSING if value is None else int(value)
+
+
+def _timestamp(value: Optional[str]) -> float:
+    return parse_datetime(value).timestamp() if value else math.nan
+
+
+def _nearest_rank(ordered: List[float], q: float) -> float:
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+class EpisodeColumns:
+    """Columnar copy of episode data for fast aggregation.
+
+    Numeric fields live in typed arrays (8 bytes per value) instead of one
+    dictionary per episode. When NumPy is installed, aggregations run
+    vectorized over zero-copy views of those arrays; otherwise they fall
+    back to plain loops over the arrays.
+
+    Columns: ``podcast_id``, ``id``, ``total_plays``, ``duration``,
+    ``season_number``, ``episode_number`` (integers, -1 when missing),
+    ``published_at`` (POSIX timestamp, NaN when missing) and ``title``.
+
+    Args:
+        use_numpy: Force NumPy on or off; defaults to using it when installed
+    """
+
+    def __init__(self, use_numpy: Optional[bool] = None):
+        if use_numpy and np is None:
+            raise ImportError(
+                "NumPy is not installed, install it with "
+                "`pip install buzzsprout-client[analytics]`"
+            )
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        self.columns: Dict[str, array] = {name: array("q") for name in INT_COLUMNS}
+        self.columns.update({name: array("d") for name in FLOAT_COLUMNS})
+        self.titles: List[str] = []
+
+    @classmethod
+    def from_episodes(
+        cls,
+        episodes: Iterable[Any],
+        podcast_id: int,
+        use_numpy: Optional[bool] = None
+    ) -> "EpisodeColumns":
+        """Build columns from the episodes of one podcast."""
+        columns = cls(use_numpy)
+        columns.extend(podcast_id, episodes)
+        return columns
+
+    @classmethod
+    def from_podcasts(
+        cls,
+        episodes_by_podcast: Mapping[int, Iterable[Any]],
+        use_numpy: Optional[bool] = None
+    ) -> "EpisodeColumns":
+        """Build columns from a mapping of podcast ID to episodes.
+
+        ``get_all_episodes().results`` has this shape.
+        """
+        columns = cls(use_numpy)
+        for podcast_id, episodes in episodes_by_podcast.items():
+            columns.extend(podcast_id, episodes)
+        return columns
+
+    def extend(self, podcast_id: int, episodes: Iterable[Any]) -> None:
+        """Append episodes; accepts any iterable, e.g. ``iter_episodes()``."""
+        c = self.columns
+        for episode in episodes:
+            episode = as_dict(episode)
+            c["podcast_id"].append(podcast_id)
+            c["id"].append(episode["id"])
+            c["total_plays"].append(_int(episode.get("total_plays")))
+            c["duration"].append(_int(episode.get("duration")))
+            c["season_number"].append(_int(episode.get("season_number")))
+            c["episode_number"].append(_int(episode.get("episode_number")))
+            c["published_at"].append(_timestamp(episode.get("published_at")))
+            self.titles.append(episode.get("title") or "")
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def column(self, name: str) -> Any:
+        """A column as a NumPy array (zero-copy) or as the stored array."""
+        values = self.columns[name]
+        if self.use_numpy:
+            return np.frombuffer(values, dtype=np.int64 if values.typecode == "q" else np.float64)
+        return values
+
+    def _rows(self, podcast_id: Optional[int]) -> Any:
+        """Indexes of the rows of ``podcast_id``, or None for all rows."""
+        if podcast_id is None:
+            return None
+        if self.use_numpy:
+            return np.flatnonzero(self.column("podcast_id") == podcast_id)
+        return [i for i, value in enumerate(self.columns["podcast_id"]) if value == podcast_id]
+
+    def _select(self, name: str, rows: Any) -> Any:
+        if self.use_numpy:
+            values = self.column(name)
+            return values if rows is None else values[rows]
+        values = self.columns[name]
+        return values if rows is None else [values[i] for i in rows]
+
+    def plays_by_podcast(self) -> Dict[int, int]:
+        """Total plays of each podcast."""
+        if self.use_numpy:
+            podcasts, inverse = np.unique(self.column("podcast_id"), return_inverse=True)
+            plays = np.clip(self.column("total_plays"), 0, None)
+            sums = np.bincount(inverse, weights=plays, minlength=len(podcasts))
+            return {int(p): int(s) for p, s in zip(podcasts, sums)}
+        totals: Dict[int, int] = defaultdict(int)
+        for podcast_id, plays in zip(self.columns["podcast_id"], self.columns["total_plays"]):
+            totals[podcast_id] += max(plays, 0)
+        return dict(sorted(totals.items()))
+
+    def plays_by_season(self) -> Dict[int, Dict[int, int]]:
+        """Total plays per season, grouped by podcast.
+
+        Episodes without a season number are counted under season -1.
+        """
+        if self.use_numpy:
+            if not len(self):
+                return {}
+            seasons = self.column("season_number")
+            low = int(seasons.min())
+            span = int(seasons.max()) - low + 1
+            # One int64 key per (podcast, season); far cheaper to group than
+            # rows of a 2-D array.
+            keys = self.column("podcast_id") * span + (seasons - low)
+            groups, inverse = np.unique(keys, return_inverse=True)
+            plays = np.clip(self.column("total_plays"), 0, None)
+            sums = np.bincount(inverse.reshape(-1), weights=plays, minlength=len(groups))
+            result: Dict[int, Dict[int, int]] = defaultdict(dict)
+            for key, total in zip(groups.tolist(), sums.tolist()):
+                podcast_id, season = divmod(key, span)
+                result[podcast_id][season + low] = int(total)
+            return dict(result)
+        totals: Dict[Tuple[int, int], int] = defaultdict(int)
+        c = self.columns
+        for key in zip(c["podcast_id"], c["season_number"], c["total_plays"]):
+            totals[key[:2]] += max(key[2], 0)
+        result = defaultdict(dict)
+        for (podcast_id, season), total in sorted(totals.items()):
+            result[podcast_id][season] = total
+        return dict(result)
+
+    def duration_stats(self, podcast_id: Optional[int] = None) -> Dict[str, Optional[float]]:
+        """Count, total, mean, min, median, p90 and max of episode durations.
+
+        Episodes without a duration are ignored. Percentiles use the
+        nearest-rank method.
+        """
+        durations = self._select("duration", self._rows(podcast_id))
+        if self.use_numpy:
+            ordered = np.sort(durations[durations >= 0]).tolist()
+        else:
+            ordered = sorted(d for d in durations if d >= 0)
+        if not ordered:
+            return {"count": 0, "total": 0, "mean": None, "min": None,
+                    "median": None, "p90": None, "max": None}
+        total = sum(ordered)
+        return {
+            "count": len(ordered),
+            "total": total,
+            "mean": total / len(ordered),
+            "min": ordered[0],
+            "median": _nearest_rank(ordered, 50),
+            "p90": _nearest_rank(ordered, 90),
+            "max": ordered[-1],
+        }
+
+    def duration_histogram(
+        self,
+        bounds: Iterable[int] = (300, 900, 1800, 2700, 3600, 5400),
+        podcast_id: Optional[int] = None
+    ) -> Dict[str, int]:
+        """Number of episodes per duration bucket.
+
+        Args:
+            bounds: Increasing upper bounds in seconds (inclusive); a final
+                bucket holds everything longer
+        """
+        bounds = sorted(bounds)
+        durations = self._select("duration", self._rows(podcast_id))
+        if self.use_numpy:
+            durations = durations[durations >= 0]
+            counts = np.bincount(
+                np.searchsorted(np.asarray(bounds), durations, side="left"),
+                minlength=len(bounds) + 1
+            ).tolist()
+        else:
+            counts = [0] * (len(bounds) + 1)
+            for duration in durations:
+                if duration >= 0:
+                    counts[bisect_left(bounds, duration)] += 1
+        labels = [f"<={bound}" for bound in bounds] + [f">{bounds[-1]}" if bounds else "all"]
+        return dict(zip(labels, counts))
+
+    def cadence(self) -> Dict[int, Dict[str, Optional[float]]]:
+        """Publishing cadence of each podcast.
+
+        Returns:
+            Per podcast: number of dated episodes, first and last publish
+            timestamps, and the mean and median days between episodes
+        """
+        result = {}
+        if self.use_numpy:
+            podcast_ids = self.column("podcast_id")
+            published = self.column("published_at")
+            dated = ~np.isnan(published)
+            order = np.lexsort((published[dated], podcast_ids[dated]))
+            stamps = published[dated][order]
+            owners = podcast_ids[dated][order]
+            starts = np.flatnonzero(np.diff(owners)) + 1
+            groups = {}
+            if len(owners):
+                firsts = owners[np.r_[0, starts]].tolist()
+                groups = dict(zip(firsts, np.split(stamps, starts)))
+            for podcast_id in np.unique(podcast_ids).tolist():
+                group = groups.get(podcast_id, stamps[:0])
+                result[podcast_id] = self._cadence(group.tolist(), (np.diff(group) / DAY).tolist())
+            return result
+        grouped: Dict[int, List[float]] = {}
+        for podcast_id, stamp in zip(self.columns["podcast_id"], self.columns["published_at"]):
+            stamps = grouped.setdefault(podcast_id, [])
+            if not math.isnan(stamp):
+                stamps.append(stamp)
+        for podcast_id in sorted(grouped):
+            stamps = sorted(grouped[podcast_id])
+            gaps = [(b - a) / DAY for a, b in zip(stamps, stamps[1:])]
+            result[podcast_id] = self._cadence(stamps, gaps)
+        return result
+
+    @staticmethod
+    def _cadence(stamps: List[float], gaps: List[float]) -> Dict[str, Optional[float]]:
+        ordered = sorted(gaps)
+        return {
+            "episodes": len(stamps),
+            "first": stamps[0] if stamps else None,
+            "last": stamps[-1] if stamps else None,
+            "mean_interval_days": sum(gaps) / len(gaps) if gaps else None,
+            "median_interval_days": _nearest_rank(ordered, 50) if ordered else None,
+        }
+
+    def top(
+        self,
+        n: int = 10,
+        by: str = "total_plays",
+        podcast_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """The ``n`` episodes with the highest value in column ``by``.
+
+        Returns:
+            Dictionaries with ``podcast_id``, ``id``, ``title`` and the
+            value, highest first; ties keep catalog order
+        """
+        if by not in INT_COLUMNS + FLOAT_COLUMNS:
+            raise ValueError(f"Unknown column: {by!r}")
+        if n <= 0:
+            return []
+        rows = self._rows(podcast_id)
+        values = self._select(by, rows)
+        if self.use_numpy:
+            indexes = np.arange(len(self)) if rows is None else rows
+            if len(values) > n:
+                # Keep every value tied with the n-th so ties resolve by order
+                threshold = np.partition(values, len(values) - n)[len(values) - n]
+                keep = np.flatnonzero(values >= threshold)
+                values, indexes = values[keep], indexes[keep]
+            order = np.lexsort((indexes, -values))
+            best = [(int(indexes[i]), values[i].item()) for i in order[:n]]
+        else:
+            indexes = range(len(self)) if rows is None else rows
+            best = heapq.nlargest(n, zip(indexes, values), key=lambda item: (item[1], -item[0]))
+        return [
+            {
+                "podcast_id": self.columns["podcast_id"][i],
+                "id": self.columns["id"][i],
+                "title": self.titles[i],
+                by: value,
+            }
+            for i, value in best
+        ]
+
+    def iter_rows(self) -> Iterable[Tuple[Any, ...]]:
+        """Rows in :data:`CSV_COLUMNS` order, missing values as None."""
+        c = self.columns
+        for i in range(len(self)):
+            yield _row(
+                c["podcast_id"][i], c["id"][i], self.titles[i], c["published_at"][i],
+                c["duration"][i], c["total_plays"][i], c["season_number"][i], c["episode_number"][i]
+            )
+
+    def to_csv(self, out: IO[str]) -> int:
+        """Write the columns as CSV rows to a text stream.
+
+        Returns:
+            Number of rows written
+        """
+        writer = csv.writer(out)
+        writer.writerow(CSV_COLUMNS)
+        count = 0
+        for row in self.iter_rows():
+            writer.writerow(row)
+            count += 1
+        return count
+
+    def save(self, directory: str) -> None:
+        """Write each column to its own binary file in ``directory``.
+
+        Numeric columns are raw native-endian 64-bit arrays, readable with
+        ``numpy.fromfile``; titles are stored as JSON lines.
+        """
+        directory = os.path.expanduser(directory)
+        os.makedirs(directory, exist_ok=True)
+        schema = {}
+        for name, values in self.columns.items():
+            with open(os.path.join(directory, f"{name}.bin"), "wb") as f:
+                values.tofile(f)
+            schema[name] = "int64" if values.typecode == "q" else "float64"
+        with open(os.path.join(directory, "title.jsonl"), "w", encoding="utf-8") as f:
+            for title in self.titles:
+                f.write(json.dumps(title) + "\n")
+        with open(os.path.join(directory, "schema.json"), "w") as f:
+            json.dump({"rows": len(self), "columns": schema}, f)
+
+    @classmethod
+    def load(cls, directory: str, use_numpy: Optional[bool] = None) -> "EpisodeColumns":
+        """Read columns written by :meth:`save`."""
+        directory = os.path.expanduser(directory)
+        with open(os.path.join(directory, "schema.json")) as f:
+            schema = json.load(f)
+        columns = cls(use_numpy)
+        for name, values in columns.columns.items():
+            with open(os.path.join(directory, f"{name}.bin"), "rb") as f:
+                values.fromfile(f, schema["rows"])
+        with open(os.path.join(directory, "title.jsonl"), encoding="utf-8") as f:
+            columns.titles = [json.loads(line) for line in f]
+        return columns
+
+
+def _row(podcast_id, episode_id, title, published_at, duration, plays, season, number) -> Tuple:
+    def value(number):
+        return None if number == MISSING else number
+
+    return (
+        podcast_id,
+        episode_id,
+        title,
+        None if math.isnan(published_at) else published_at,
+        value(duration),
+        value(plays),
+        value(season),
+        value(number),
+    )
+
+
+def write_episodes_csv(out: IO[str], episodes: Iterable[Any], podcast_id: int) -> int:
+    """Stream episodes straight to CSV without building columns first.
+
+    Writes the same columns as :meth:`EpisodeColumns.to_csv`, so it can
+    consume :meth:`BuzzsproutClient.iter_episodes` with constant memory.
+
+    Returns:
+        Number of rows written
+    """
+    writer = csv.writer(out)
+    writer.writerow(CSV_COLUMNS)
+    count = 0
+    for episode in episodes:
+        episode = as_dict(episode)
+        writer.writerow(_row(
+            podcast_id,
+            episode["id"],
+            episode.get("title") or "",
+            _timestamp(episode.get("published_at")),
+            _int(episode.get("duration")),
+            _int(episode.get("total_plays")),
+            _int(episode.get("season_number")),
+            _int(episode.get("episode_number")),
+        ))
+        count += 1
+    return count
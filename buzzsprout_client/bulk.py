@@ -0,0 +1,92 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List
+
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a batch of API calls, keyed by the input they were made for.
+
+    Attributes:
+        results: Return values of the calls that succeeded
+        errors: Exceptions raised by the calls that failed
+    """
+
+    results: Dict[Any, Any] = field(default_factory=dict)
+    errors: Dict[Any, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+@dataclass
+class BulkUpdateReport:
+    """Outcome of :meth:`BuzzsproutClient.bulk_update_episodes`.
+
+    Attributes:
+        updated: Changed fields per episode ID that were sent (or, in a dry
+            run, would be sent)
+        skipped: IDs of episodes that already had the requested values
+        failed: Exceptions per episode ID whose update failed or which do
+            not exist
+        dry_run: Whether the PUTs were actually issued
+    """
+
+    updated: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    skipped: List[int] = field(default_factory=list)
+    failed: Dict[int, Exception] = field(default_factory=dict)
+    dry_run: bool = False
+
+
+def same_value(current: Any, wanted: Any) -> bool:
+    """Compare an API value with a requested one.
+
+    Form values are sent as strings, so ``5`` and ``"5"`` are the same.
+    """
+    if current == wanted:
+        return True
+    if current is None or wanted is None:
+        return False
+    return str(current) == str(wanted)
+
+
+def diff_fields(current: Dict[str, Any], wanted: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the entries of ``wanted`` that differ from ``current``."""
+    return {
+        name: value
+        for name, value in wanted.items()
+        if not same_value(current.get(name), value)
+    }
+
+
+def run_batch(
+    func: Callable[[Any], Any],
+    keys: Iterable[Any],
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> BatchResult:
+    """Call ``func(key)`` for every key on a bounded thread pool.
+
+    A failing call is recorded in :attr:`BatchResult.errors` and does not
+    stop the others. Results keep the order of ``keys``.
+
+    Args:
+        func: Function to call for each key
+        keys: Inputs to call ``func`` with
+        max_workers: Maximum number of calls in flight at once
+    """
+    keys = list(dict.fromkeys(keys))
+    outcomes = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(func, key): key for key in keys}
+        for future in as_completed(futures):
+            outcomes[futures[future]] = future
+    batch = BatchResult()
+    for key in keys:
+        try:
+            batch.results[key] = outcomes[key].result()
+        except Exception as exc:
+            batch.errors[key] = exc
+    return batch
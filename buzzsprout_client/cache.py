@@ -0,0 +1,230 @@
+import copy
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 60.0
+
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that ask the server to revalidate this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+
+
+class HTTPCache:
+    """Persistent store for GET responses and their validators.
+
+    Entries live in a SQLite database so they survive process restarts.
+    Every lookup still goes to the server as a conditional request
+    (``If-None-Match`` / ``If-Modified-Since``); on ``304 Not Modified`` the
+    stored body is served instead of downloading it again. The total size of
+    stored bodies is capped at ``max_size`` bytes, evicting the least
+    recently used entries first.
+
+    Counters in :attr:`stats`:
+
+    * ``revalidations`` - conditional requests sent
+    * ``hits`` - responses served from the store after a 304
+    * ``misses`` - full responses downloaded from the server
+
+    Args:
+        path: Path of the SQLite database file, created if missing
+        max_size: Maximum total size of stored bodies in bytes
+    """
+
+    def __init__(self, path: str, max_size: int = DEFAULT_MAX_SIZE):
+        self.path = os.path.expanduser(path)
+        self.max_size = max_size
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " body BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used INTEGER NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+        )
+        self._db.commit()
+
+    def _next_tick(self) -> int:
+        (tick,) = self._db.execute(
+            "SELECT COALESCE(MAX(last_used), 0) + 1 FROM responses"
+        ).fetchone()
+        return tick
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the stored entry for ``key`` and mark it as recently used."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, etag, last_modified FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?",
+                (self._next_tick(), key)
+            )
+            self._db.commit()
+        return CacheEntry(bytes(row[0]), row[1], row[2])
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store ``entry`` under ``key`` and evict entries over the size cap."""
+        size = len(entry.body)
+        with self._lock:
+            if size > self.max_size:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, etag, last_modified, body, size, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, entry.etag, entry.last_modified, entry.body, size,
+                 self._next_tick())
+            )
+            self._evict()
+            self._db.commit()
+
+    def _evict(self) -> None:
+        (total,) = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_size:
+            return
+        rows = self._db.execute(
+            "SELECT key, size FROM responses ORDER BY last_used"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_size:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Remove all stored entries."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def size(self) -> int:
+        """Total size of stored bodies in bytes."""
+        with self._lock:
+            (total,) = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return total
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return count
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class MemoryCache:
+    """Thread-safe in-process cache of decoded GET results.
+
+    Entries expire after a per-resource TTL and the cache holds at most
+    ``max_entries`` entries, dropping the least recently used first. The
+    client invalidates or overwrites affected entries itself when episodes
+    are created or updated.
+
+    Values are deep-copied on the way in and out, so callers can modify
+    returned objects without corrupting the cache.
+
+    Args:
+        max_entries: Maximum number of cached entries
+        ttl: Default time to live in seconds
+        ttls: TTL overrides per resource, keyed by ``"podcasts"``,
+            ``"podcast"``, ``"episodes"`` or ``"episode"``
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL,
+        ttls: Optional[Dict[str, float]] = None
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the live value for ``key``, or None."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None and item[0] <= time.monotonic():
+                del self._entries[key]
+                item = None
+            if item is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            value = item[1]
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any, resource: Optional[str] = None) -> None:
+        """Store ``value`` under ``key`` using the TTL for ``resource``."""
+        ttl = self.ttls.get(resource, self.ttl)
+        if ttl <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
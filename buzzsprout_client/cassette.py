@@ -0,0 +1,220 @@
+import base64
+import gzip
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import requests
+from requests.cookies import RequestsCookieJar, cookiejar_from_dict
+from requests.structures import CaseInsensitiveDict
+
+CASSETTE_VERSION = 1
+
+# Describe the original transfer, not the decoded body that is stored.
+_SKIPPED_HEADERS = frozenset({"content-encoding", "transfer-encoding", "content-length", "set-cookie"})
+
+Interaction = Dict[str, Any]
+
+
+class Cassette:
+    """Recorded API responses, keyed by HTTP method and URL.
+
+    Responses recorded for the same request are replayed in the order they
+    were recorded; once they run out the last one is repeated, so a short
+    recording can drive an arbitrarily long replay. Request bodies are not
+    stored or matched.
+
+    Cassette files are gzip-compressed JSON.
+
+    Args:
+        path: File the cassette is loaded from and saved to
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = os.path.expanduser(path) if path else None
+        self.interactions: List[Interaction] = []
+        self._index: Dict[Tuple[str, str], List[Interaction]] = defaultdict(list)
+        self._positions: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        cassette = cls(path)
+        with gzip.open(cassette.path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version: {data.get('version')!r}")
+        for interaction in data["interactions"]:
+            cassette._add(interaction)
+        return cassette
+
+    def save(self, path: Optional[str] = None) -> None:
+        path = os.path.expanduser(path) if path else self.path
+        if path is None:
+            raise ValueError("No path to save the cassette to")
+        with self._lock:
+            interactions = [
+                {name: value for name, value in interaction.items() if not name.startswith("_")}
+                for interaction in self.interactions
+            ]
+        data = {"version": CASSETTE_VERSION, "interactions": interactions}
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    def _add(self, interaction: Interaction) -> None:
+        content = _decode_body(interaction)
+        headers = CaseInsensitiveDict(interaction["headers"])
+        headers["Content-Length"] = str(len(content))
+        interaction["_content"] = content
+        interaction["_headers"] = headers
+        self.interactions.append(interaction)
+        self._index[(interaction["method"], interaction["url"])].append(interaction)
+
+    def record(self, method: str, url: str, response: requests.Response, elapsed: float) -> None:
+        content = response.content
+        try:
+            body, encoding = content.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode("ascii"), "base64"
+        interaction = {
+            "method": method.upper(),
+            "url": url,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: value for name, value in response.headers.items()
+                if name.lower() not in _SKIPPED_HEADERS
+            },
+            "body": body,
+            "encoding": encoding,
+            "elapsed": round(elapsed, 6),
+        }
+        with self._lock:
+            self._add(interaction)
+
+    def lookup(self, method: str, url: str) -> Interaction:
+        """Next recorded response for ``method`` and ``url``.
+
+        Raises:
+            LookupError: If nothing was recorded for the request
+        """
+        key = (method.upper(), url)
+        recorded = self._index.get(key)
+        if not recorded:
+            raise LookupError(f"No recorded response for {key[0]} {url}")
+        with self._lock:
+            position = self._positions[key]
+            self._positions[key] = position + 1
+        return recorded[min(position, len(recorded) - 1)]
+
+    def rewind(self) -> None:
+        """Replay every request's responses from the first one again."""
+        with self._lock:
+            self._positions.clear()
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+
+def _decode_body(interaction: Interaction) -> bytes:
+    if interaction.get("encoding") == "base64":
+        return base64.b64decode(interaction["body"])
+    return interaction["body"].encode("utf-8")
+
+
+class RecordingSession(requests.Session):
+    """``requests.Session`` that records every response into a cassette.
+
+    Pass it to the client with ``BuzzsproutClient(session=...)`` and call
+    ``cassette.save()`` when done. Streamed responses are read completely
+    so they can be recorded.
+    """
+
+    def __init__(self, cassette: Cassette):
+        super().__init__()
+        self.cassette = cassette
+
+    def request(self, method: str, url: str, *args, **kwargs) -> requests.Response:
+        started = time.perf_counter()
+        response = super().request(method, url, *args, **kwargs)
+        self.cassette.record(method, url, response, time.perf_counter() - started)
+        return response
+
+
+class ReplayResponse(requests.Response):
+    """``requests.Response`` built from a recorded interaction.
+
+    Skips the base constructor, which mostly sets up a cookie jar that is
+    never used here and dominates the cost of a replayed call. The headers
+    object is shared by every replay of the same interaction.
+    """
+
+    raw = None
+    request = None
+    history: List[requests.Response] = []
+    elapsed = timedelta(0)
+    encoding = "utf-8"
+
+    def __init__(self, interaction: Interaction, url: str):
+        self.status_code = interaction["status"]
+        self.reason = interaction.get("reason")
+        self.headers = interaction["_headers"]
+        self.url = url
+        self._content = interaction["_content"]
+        # Lets iter_content() serve the stored body for stream=True
+        self._content_consumed = True
+        self._next = None
+
+    @property
+    def cookies(self) -> RequestsCookieJar:
+        return cookiejar_from_dict({})
+
+
+class ReplaySession:
+    """Stand-in for ``requests.Session`` that serves responses from a cassette.
+
+    No network or connection pool is involved, so replay is limited only by
+    the client's own overhead. Pass it to the client with
+    ``BuzzsproutClient(session=...)``.
+
+    Args:
+        cassette: Recorded responses to serve
+        latency: Seconds to sleep before every response, or ``"recorded"``
+            to sleep as long as the recorded request took
+    """
+
+    def __init__(self, cassette: Cassette, latency: Union[float, str] = 0.0):
+        if latency != "recorded" and not isinstance(latency, (int, float)):
+            raise ValueError("latency must be a number of seconds or 'recorded'")
+        self.cassette = cassette
+        self.latency = latency
+        self.headers = CaseInsensitiveDict()
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        interaction = self.cassette.lookup(method, url)
+        delay = interaction["elapsed"] if self.latency == "recorded" else self.latency
+        if delay:
+            time.sleep(delay)
+        return ReplayResponse(interaction, url)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def mount(self, prefix: str, adapter: Any) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,212 @@
+"""``buzzsprout`` command line interface.
+
+Only the standard library is imported up front; the client (and with it
+``requests``) is imported when a command actually talks to the API, so
+``--help`` and argument errors return immediately.
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO
+
+from .models import EPISODE_FIELDS, parse_episode_field
+
+API_KEY_ENV = "BUZZSPROUT_API_KEY"
+
+def _field_type(name: str) -> Callable[[str], Any]:
+    def convert(value: str) -> Any:
+        try:
+            return parse_episode_field(name, value)
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(str(exc)) from None
+    return convert
+
+
+def _add_episode_fields(parser: argparse.ArgumentParser) -> None:
+    for name in EPISODE_FIELDS:
+        parser.add_argument(f"--{name.replace('_', '-')}", dest=name, type=_field_type(name))
+    parser.add_argument("--audio-file", help="path of the audio file to upload")
+    parser.add_argument("--artwork-file", help="path of the artwork image to upload")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="buzzsprout", description="Buzzsprout API client")
+    parser.add_argument(
+        "--api-key", default=os.environ.get(API_KEY_ENV),
+        help=f"API token, defaults to ${API_KEY_ENV}"
+    )
+    parser.add_argument(
+        "--format", choices=("json", "ndjson"), default="json",
+        help="json prints one document; ndjson prints one object per line"
+    )
+    parser.add_argument("--timeout", type=float, help="request timeout in seconds")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    commands.required = True
+
+    list_parser = commands.add_parser("list", help="list podcasts or the episodes of a podcast")
+    list_parser.add_argument("resource", choices=("podcasts", "episodes"))
+    list_parser.add_argument("podcast_id", type=int, nargs="?", help="required for episodes")
+
+    get_parser = commands.add_parser("get", help="get one podcast or episode")
+    get_parser.add_argument("resource", choices=("podcast", "episode"))
+    get_parser.add_argument("podcast_id", type=int)
+    get_parser.add_argument("episode_id", type=int, nargs="?", help="required for episode")
+
+    create_parser = commands.add_parser("create", help="create an episode")
+    create_parser.add_argument("podcast_id", type=int)
+    _add_episode_fields(create_parser)
+
+    update_parser = commands.add_parser("update", help="update an episode")
+    update_parser.add_argument("podcast_id", type=int)
+    update_parser.add_argument("episode_id", type=int)
+    _add_episode_fields(update_parser)
+    update_parser.add_argument(
+        "--force-upload", action="store_true", help="upload files even if unchanged"
+    )
+
+    ingest_parser = commands.add_parser(
+        "ingest", help="create the episodes listed in a CSV or JSONL manifest"
+    )
+    ingest_parser.add_argument("podcast_id", type=int)
+    ingest_parser.add_argument("manifest", help="CSV or JSON Lines file, one episode per row")
+    ingest_parser.add_argument(
+        "--journal", required=True, help="checkpoint database; rerun with the same one to resume"
+    )
+    ingest_parser.add_argument("--workers", type=int, default=4, help="uploads in flight at once")
+
+    sync_parser = commands.add_parser("sync", help="sync podcasts and episodes into a local mirror")
+    sync_parser.add_argument("--db", required=True, help="path of the SQLite mirror database")
+    sync_parser.add_argument(
+        "--podcast", dest="podcast_ids", type=int, action="append",
+        help="podcast to sync, may be repeated; defaults to all"
+    )
+    return parser
+
+
+def _client(args: argparse.Namespace):
+    from .client import BuzzsproutClient
+
+    return BuzzsproutClient(
+        api_key=args.api_key, timeout=args.timeout, thread_safe=args.command == "ingest"
+    )
+
+
+def _episode_fields(args: argparse.Namespace) -> Dict[str, Any]:
+    fields = {name: getattr(args, name) for name in EPISODE_FIELDS}
+    fields["audio_file"] = args.audio_file
+    fields["artwork_file"] = args.artwork_file
+    return {name: value for name, value in fields.items() if value is not None}
+
+
+def write_output(result: Any, fmt: str, out: TextIO) -> None:
+    """Print ``result`` as JSON, or as one JSON object per line."""
+    if fmt == "ndjson":
+        items: Iterable[Any] = result if isinstance(result, list) else [result]
+        for item in items:
+            out.write(json.dumps(item, separators=(",", ":")) + "\n")
+    else:
+        json.dump(result, out, indent=2)
+        out.write("\n")
+
+
+def _stream_ndjson(items: Iterable[Any], out: TextIO) -> None:
+    for item in items:
+        out.write(json.dumps(item, separators=(",", ":")) + "\n")
+
+
+def _ingest(client: Any, args: argparse.Namespace, out: TextIO) -> int:
+    from .ingest import IngestJournal, ingest_episodes, read_manifest
+
+    entries = read_manifest(args.manifest)
+    journal = IngestJournal(args.journal)
+    try:
+        # One line per episode as it completes, then a summary line
+        report = ingest_episodes(
+            client, args.podcast_id, entries, journal, args.workers,
+            on_episode=lambda episode: _stream_ndjson([vars(episode)], out)
+        )
+    finally:
+        journal.close()
+    _stream_ndjson([{
+        "created": len(report.created),
+        "already_done": len(report.already_done),
+        "recovered": len(report.recovered),
+        "failed": {guid: str(exc) for guid, exc in report.failed.items()},
+        "bytes_uploaded": report.bytes_uploaded,
+        "elapsed": round(report.elapsed, 3),
+        "mb_per_second": round(report.mb_per_second, 3),
+    }], out)
+    return 0 if report.ok else 1
+
+
+def run(args: argparse.Namespace, parser: argparse.ArgumentParser, out: TextIO) -> int:
+    if not args.api_key:
+        parser.error(f"an API key is required, pass --api-key or set ${API_KEY_ENV}")
+    command = args.command
+
+    if command == "list" and args.resource == "episodes" and args.podcast_id is None:
+        parser.error("list episodes needs a podcast_id")
+    if command == "get" and args.resource == "episode" and args.episode_id is None:
+        parser.error("get episode needs an episode_id")
+
+    client = _client(args)
+    if command == "list" and args.resource == "episodes" and args.format == "ndjson":
+        # Print episodes as they are parsed instead of after the download
+        _stream_ndjson(client.iter_episodes(args.podcast_id), out)
+        return 0
+
+    if command == "list":
+        if args.resource == "podcasts":
+            result = client.get_podcasts()
+        else:
+            result = client.get_episodes(args.podcast_id)
+    elif command == "get":
+        if args.resource == "podcast":
+            result = client.get_podcast(args.podcast_id)
+        else:
+            result = client.get_episode(args.podcast_id, args.episode_id)
+        if result is None:
+            print(f"{args.resource} not found", file=sys.stderr)
+            return 1
+    elif command == "create":
+        fields = _episode_fields(args)
+        if "title" not in fields:
+            parser.error("create needs --title")
+        result = client.create_episode(args.podcast_id, **fields)
+    elif command == "ingest":
+        return _ingest(client, args, out)
+    elif command == "update":
+        result = client.update_episode(
+            args.podcast_id, args.episode_id, force_upload=args.force_upload, **_episode_fields(args)
+        )
+    else:
+        from dataclasses import asdict
+        from .mirror import EpisodeMirror
+
+        mirror = EpisodeMirror(client, args.db)
+        try:
+            result = asdict(mirror.sync(args.podcast_ids))
+        finally:
+            mirror.close()
+    write_output(result, args.format, out)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return run(args, parser, sys.stdout)
+    except Exception as exc:
+        # requests is imported lazily, so match its errors by module
+        if type(exc).__module__.startswith("requests") or isinstance(exc, LookupError):
+            print(f"buzzsprout: {exc}", file=sys.stderr)
+            return 1
+        if isinstance(exc, ValueError):
+            parser.error(str(exc))
+        raise
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,522 @@
+import copy
+import hashlib
+import json
+import threading
+import time
 import requests
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from typing import Any, Callable, Collection, Iterable, Iterator, List, Dict, Mapping, Optional, Tuple, Union
 
-class BuzzsproutClient:
-    def __init__(self, api_key: str):
+from .bulk import (
+    DEFAULT_MAX_WORKERS,
+    BatchResult,
+    BulkUpdateReport,
+    diff_fields,
+    run_batch,
+)
+from .cache import CacheEntry, HTTPCache, MemoryCache
+from .codec import JSONCodec, get_codec, select_fields
+from .dedup import UploadLedger, file_digest
+from .instrumentation import Hook, RequestEvent, content_length, endpoint_template
+from .models import EPISODE_FIELDS, Episode, Podcast
+from .ratelimit import RateGovernor
+from .singleflight import SingleFlight
+from .streaming import DEFAULT_STREAM_CHUNK_SIZE, iter_json_array
+from .uploads import DEFAULT_CHUNK_SIZE, MultipartEncoder, ProgressCallback
+
+BASE_URL = "https://www.buzzsprout.com/api"
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+def clone_session(template: requests.Session) -> requests.Session:
+    """New session with ``template``'s settings mounting the same adapters.
+
+    The adapters, and therefore their connection pools, are shared; the
+    per-session state that is not thread safe (cookies, header merging,
+    hooks) is not.
+    """
+    session = requests.Session()
+    session.headers = CaseInsensitiveDict(template.headers)
+    for name in ("auth", "proxies", "verify", "cert", "params", "trust_env", "max_redirects"):
+        setattr(session, name, copy.copy(getattr(template, name)))
+    session.adapters.clear()
+    for prefix, adapter in template.adapters.items():
+        session.mount(prefix, adapter)
+    return session
+
+
+class BaseClient:
+    """Transport independent pieces shared by the sync and async clients.
+
+    Subclasses own the HTTP session; this class only knows how to build
+    URLs, headers and episode payloads and how to interpret responses.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        stream_uploads: bool = False,
+        upload_chunk_size: int = DEFAULT_CHUNK_SIZE,
+        models: bool = False,
+        codec: Union[str, JSONCodec, None] = None
+    ):
         self.api_key = api_key
-        self.base_url = "https://www.buzzsprout.com/api"
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.base_url = BASE_URL
+        self.stream_uploads = stream_uploads
+        self.upload_chunk_size = upload_chunk_size
+        self.models = models
+        self.codec = get_codec(codec)
+        # Replaced rather than mutated so requests in flight can iterate the
+        # old tuple safely.
+        self.hooks: Tuple[Hook, ...] = ()
+
+    def add_hook(self, hook: Hook) -> None:
+        """Call ``hook`` with a :class:`RequestEvent` after every API call.
+
+        Hooks run on the thread that made the call and must not raise.
+        """
+        self.hooks = self.hooks + (hook,)
+
+    def remove_hook(self, hook: Hook) -> None:
+        self.hooks = tuple(h for h in self.hooks if h != hook)
+
+    def _emit(
+        self,
+        method: str,
+        url: str,
+        started: float,
+        response: Any = None,
+        streamed: bool = False,
+        **fields
+    ) -> None:
+        """Build a :class:`RequestEvent` and pass it to every hook."""
+        path = url[len(self.base_url):] if url.startswith(self.base_url) else url
+        event = RequestEvent(
+            method=method.upper(),
+            endpoint=endpoint_template(path.split("?", 1)[0]),
+            url=url,
+            duration=time.perf_counter() - started,
+            **fields
+        )
+        if response is not None:
+            event.status = response.status_code
+            if event.status == 304:
+                event.cache = "http"
+            event.request_bytes = content_length(getattr(response.request, "headers", None))
+            event.response_bytes = content_length(response.headers)
+            if event.response_bytes is None and not streamed:
+                event.response_bytes = len(response.content)
+        for hook in self.hooks:
+            hook(event)
+
+    def _auth_headers(self) -> Dict[str, str]:
+        return {
             "Authorization": f"Token token={self.api_key}",
             "Accept": "application/json"
-        })
+        }
+
+    def _cache_key(self, url: str) -> str:
+        # Scope cached responses to the account so caches can be shared
+        # between clients using different API keys.
+        account = hashlib.sha256(self.api_key.encode()).hexdigest()[:16]
+        return f"{account} {url}"
+
+    def _podcasts_url(self) -> str:
+        return f"{self.base_url}/podcasts.json"
+
+    def _podcast_url(self, podcast_id: int) -> str:
+        return f"{self.base_url}/podcasts/{podcast_id}.json"
+
+    def _episodes_url(self, podcast_id: int) -> str:
+        return f"{self.base_url}/{podcast_id}/episodes.json"
+
+    def _episode_url(self, podcast_id: int, episode_id: int) -> str:
+        return f"{self.base_url}/{podcast_id}/episodes/{episode_id}.json"
+
+    @staticmethod
+    def _episode_data(fields: Dict[str, Any], drop_none: bool = False) -> Dict:
+        """Pick the episode form fields out of ``fields``.
+
+        Args:
+            fields: Mapping containing the episode field values, typically
+                the calling method's ``locals()``
+            drop_none: Remove fields whose value is None
+
+        Returns:
+            Dictionary of form fields to send. Booleans become ``"true"`` or
+            ``"false"``, because requests and httpx would otherwise encode
+            them differently.
+        """
+        data = {name: fields.get(name) for name in EPISODE_FIELDS}
+        if drop_none:
+            # Remove None values to avoid sending nulls
+            data = {k: v for k, v in data.items() if v is not None}
+        return {k: ("true" if v else "false") if isinstance(v, bool) else v for k, v in data.items()}
+
+    @staticmethod
+    def _open_files(
+        audio_file: Optional[str] = None,
+        artwork_file: Optional[str] = None
+    ) -> Dict:
+        files = {}
+        if audio_file:
+            files["audio_file"] = open(audio_file, "rb")
+        if artwork_file:
+            files["artwork_file"] = open(artwork_file, "rb")
+        return files
+
+    def _multipart_encoder(
+        self,
+        data: Dict,
+        audio_file: Optional[str] = None,
+        artwork_file: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> Optional[MultipartEncoder]:
+        """Build a streaming body for uploads, if streaming applies.
+
+        Returns None when there is nothing to upload or streaming is off
+        (it is turned on by ``stream_uploads`` or by passing ``progress``).
+        """
+        if not (self.stream_uploads or progress):
+            return None
+        files = {}
+        if audio_file:
+            files["audio_file"] = audio_file
+        if artwork_file:
+            files["artwork_file"] = artwork_file
+        if not files:
+            return None
+        return MultipartEncoder(
+            data, files, chunk_size=self.upload_chunk_size, progress=progress
+        )
+
+    @staticmethod
+    def _rewind_files(files: Optional[Dict]) -> None:
+        for f in (files or {}).values():
+            f.seek(0)
+
+    @staticmethod
+    def _check_audio(audio_file: Optional[str], audio_url: Optional[str]):
+        if not audio_file and not audio_url:
+            raise ValueError("Either audio_file or audio_url must be provided")
+
+    def _to_model(self, value: Any, model: type) -> Any:
+        """Wrap decoded JSON in ``model`` objects when models are enabled."""
+        if not self.models or value is None:
+            return value
+        if isinstance(value, list):
+            return [model.from_dict(item) for item in value]
+        return model.from_dict(value)
+
+    def _loads(self, data: bytes) -> Any:
+        return json.loads(data) if self.codec is None else self.codec.loads(data)
+
+    def _parse_response(self, response, allow_not_found: bool = False) -> Any:
+        """Turn an HTTP response into the decoded JSON body.
+
+        Works with both ``requests`` and ``httpx`` responses. With a codec
+        the raw body bytes are decoded directly.
+
+        Args:
+            response: Response object
+            allow_not_found: Return None instead of raising on 404
+
+        Returns:
+            Decoded JSON body, or None for a permitted 404
+        """
+        if allow_not_found and response.status_code == 404:
+            return None
+        response.raise_for_status()
+        if self.codec is None:
+            return response.json()
+        return self.codec.loads(response.content)
+
+
+class BuzzsproutClient(BaseClient):
+    """Client for the Buzzsprout API.
+
+    Args:
+        api_key: Buzzsprout API token
+        stream_uploads: Stream file uploads from disk instead of building
+            the request body in memory
+        upload_chunk_size: Bytes read per chunk when streaming uploads
+        http_cache: Persistent conditional-request cache for GET requests
+        cache: In-memory cache for GET results
+        models: Return :class:`Episode`/:class:`Podcast` objects instead of
+            dictionaries
+        governor: Rate limiter and retry policy applied to every request
+        hooks: Callables receiving a :class:`RequestEvent` after every API
+            call, see :meth:`add_hook`
+        upload_ledger: Record of uploaded file hashes used to skip
+            re-uploading unchanged files in :meth:`update_episode`
+        coalesce: Let concurrent identical GET requests share one HTTP
+            request; counters are in ``client.singleflight.stats``
+        session: Pre-configured session to use instead of creating one;
+            its adapters are left alone unless ``adapter`` is given
+        adapter: Transport adapter mounted for http(s) URLs, replacing the
+            pooled ``HTTPAdapter`` built from the pool options
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Maximum connections kept alive per host; should be
+            at least the number of threads sharing the client
+        pool_block: Wait for a free connection instead of opening a
+            throwaway one when the pool is exhausted
+        keep_alive: Reuse connections between requests
+        timeout: Timeout for metadata requests in seconds, either one value
+            or a ``(connect, read)`` tuple
+        upload_timeout: Timeout for requests that upload files
+        codec: Decode responses from their raw bytes with this
+            :class:`JSONCodec`, or ``"auto"`` for the fastest one installed
+            (orjson when available); by default ``response.json()`` is used
+        thread_safe: Allow one client to be shared by many threads. Each
+            thread sends through its own session, created on first use from
+            ``session``'s headers and settings, while all of them share
+            ``session``'s adapters and therefore one connection pool. Upload
+            files are opened per call and closed once the request finishes.
+            A ``session`` that is not a plain ``requests.Session``, such as
+            a :class:`ReplaySession`, is shared by all threads as it is and
+            must be thread safe itself.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        stream_uploads: bool = False,
+        upload_chunk_size: int = DEFAULT_CHUNK_SIZE,
+        http_cache: Optional[HTTPCache] = None,
+        cache: Optional[MemoryCache] = None,
+        models: bool = False,
+        governor: Optional[RateGovernor] = None,
+        hooks: Iterable[Hook] = (),
+        upload_ledger: Optional[UploadLedger] = None,
+        coalesce: bool = False,
+        session: Optional[requests.Session] = None,
+        adapter: Optional[HTTPAdapter] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        timeout: Optional[Timeout] = None,
+        upload_timeout: Optional[Timeout] = None,
+        codec: Union[str, JSONCodec, None] = None,
+        thread_safe: bool = False
+    ):
+        super().__init__(api_key, stream_uploads, upload_chunk_size, models, codec)
+        self.http_cache = http_cache
+        self.cache = cache
+        self.governor = governor
+        self.hooks = tuple(hooks)
+        self.upload_ledger = upload_ledger
+        self.singleflight = SingleFlight() if coalesce else None
+        self.timeout = timeout
+        self.upload_timeout = upload_timeout
+        if session is None:
+            session = requests.Session()
+            if adapter is None:
+                adapter = HTTPAdapter(
+                    pool_connections=pool_connections,
+                    pool_maxsize=pool_maxsize,
+                    pool_block=pool_block
+                )
+        if adapter is not None:
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+        self.session.headers.update(self._auth_headers())
+        self.thread_safe = thread_safe
+        self._local = threading.local()
+
+    def _thread_session(self) -> requests.Session:
+        """The session requests on the current thread are sent through.
+
+        Without ``thread_safe`` this is :attr:`session`, except on the
+        worker threads of the batch helpers. Otherwise each thread gets a
+        :func:`clone_session` of it; urllib3's pool manager is thread safe,
+        so connections are reused across threads. Other session objects,
+        including ``requests.Session`` subclasses that may override
+        ``request``, are used as they are.
+        """
+        if type(self.session) is not requests.Session:
+            return self.session
+        if not (self.thread_safe or getattr(self._local, "batch_worker", False)):
+            return self.session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = clone_session(self.session)
+        return session
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        if "timeout" not in kwargs:
+            uploading = kwargs.get("files") or isinstance(kwargs.get("data"), MultipartEncoder)
+            timeout = self.upload_timeout if uploading else self.timeout
+            if timeout is not None:
+                kwargs["timeout"] = timeout
+        send = getattr(self._thread_session(), method.lower())
+        if not self.hooks:
+            return self._send(method, lambda: send(url, **kwargs), kwargs.get("files"))
+
+        attempts = 0
+
+        def attempt():
+            nonlocal attempts
+            attempts += 1
+            return send(url, **kwargs)
+
+        started = time.perf_counter()
+        try:
+            response = self._send(method, attempt, kwargs.get("files"))
+        except Exception as exc:
+            self._emit(method, url, started, retries=max(0, attempts - 1), error=exc)
+            raise
+        self._emit(
+            method, url, started, response,
+            streamed=kwargs.get("stream", False), retries=attempts - 1
+        )
+        return response
+
+    def _send(self, method: str, attempt: Callable[[], Any], files: Optional[Dict]) -> Any:
+        if self.governor is None:
+            return attempt()
+        return self.governor.send(
+            method,
+            attempt,
+            retry_exceptions=(requests.ConnectionError, requests.Timeout),
+            before_retry=lambda: self._rewind_files(files)
+        )
+
+    def _get(
+        self,
+        url: str,
+        resource: str,
+        allow_not_found: bool = False,
+        **kwargs
+    ) -> Any:
+        if self.cache is not None:
+            key = self._cache_key(url)
+            started = time.perf_counter()
+            result = self.cache.get(key)
+            if result is not None:
+                if self.hooks:
+                    self._emit("GET", url, started, cache="memory")
+                return result
+        if self.singleflight is None:
+            result = self._fetch(url, allow_not_found, **kwargs)
+        else:
+            result = self.singleflight.do(
+                (url, allow_not_found), lambda: self._fetch(url, allow_not_found, **kwargs)
+            )
+        if self.cache is not None and result is not None:
+            self.cache.set(key, result, resource)
+        return result
+
+    def _fetch(self, url: str, allow_not_found: bool = False, **kwargs) -> Any:
+        if self.http_cache is None:
+            response = self._request("GET", url, **kwargs)
+            return self._parse_response(response, allow_not_found)
+        return self._cached_get(url, allow_not_found, **kwargs)
+
+    def _after_episode_write(self, podcast_id: int, episode: Dict) -> None:
+        """Keep the in-memory cache consistent after a create or update."""
+        if self.cache is None:
+            return
+        self.cache.delete(self._cache_key(self._episodes_url(podcast_id)))
+        if isinstance(episode, dict) and "id" in episode:
+            url = self._episode_url(podcast_id, episode["id"])
+            self.cache.set(self._cache_key(url), episode, "episode")
+
+    def _cached_get(self, url: str, allow_not_found: bool = False, **kwargs) -> Any:
+        cache = self.http_cache
+        key = self._cache_key(url)
+        entry = cache.get(key)
+        if entry is None:
+            response = self._request("GET", url, **kwargs)
+        else:
+            cache.stats.revalidations += 1
+            headers = dict(kwargs.pop("headers", None) or {}, **entry.conditional_headers())
+            response = self._request("GET", url, headers=headers, **kwargs)
+            if response.status_code == 304:
+                cache.stats.hits += 1
+                return self._loads(entry.body)
+        cache.stats.misses += 1
+        result = self._parse_response(response, allow_not_found)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if result is None:
+            cache.delete(key)
+        elif etag or last_modified:
+            cache.set(key, CacheEntry(response.content, etag, last_modified))
+        return result
+
+    def _hash_uploads(
+        self,
+        podcast_id: int,
+        episode_id: Optional[int],
+        files: Dict[str, Optional[str]],
+        force: bool = False
+    ) -> Dict[str, Tuple[str, int]]:
+        """Hash the files about to be uploaded and drop unchanged ones.
+
+        Files whose hash matches the ledger entry for ``episode_id`` are
+        removed from ``files`` (set to None) unless ``force`` is set.
+
+        Returns:
+            Mapping of field to ``(digest, size)`` for the files still sent
+        """
+        pending = {}
+        if self.upload_ledger is None:
+            return pending
+        for field, path in files.items():
+            if not path:
+                continue
+            digest, size = file_digest(path)
+            if (
+                not force
+                and episode_id is not None
+                and self.upload_ledger.get(podcast_id, episode_id, field) == digest
+            ):
+                self.upload_ledger.skip(size)
+                files[field] = None
+            else:
+                pending[field] = (digest, size)
+        return pending
+
+    def _record_uploads(
+        self,
+        podcast_id: int,
+        episode: Any,
+        uploaded: Dict[str, Tuple[str, int]]
+    ) -> None:
+        if not uploaded or not isinstance(episode, dict) or "id" not in episode:
+            return
+        for field, (digest, size) in uploaded.items():
+            self.upload_ledger.record(podcast_id, episode["id"], field, digest, size)
+
+    def _send_episode(
+        self,
+        method: str,
+        url: str,
+        data: Dict,
+        audio_file: Optional[str],
+        artwork_file: Optional[str],
+        progress: Optional[ProgressCallback]
+    ) -> Dict:
+        encoder = self._multipart_encoder(data, audio_file, artwork_file, progress)
+        if encoder is not None:
+            response = self._request(method, url, data=encoder, headers=encoder.headers)
+        else:
+            files = self._open_files(audio_file, artwork_file)
+            try:
+                response = self._request(method, url, data=data, files=files or None)
+            finally:
+                for f in files.values():
+                    f.close()
+        return self._parse_response(response)
 
     def get_podcasts(self) -> List[Dict]:
         """Get all podcasts associated with the account.
@@ -17,10 +524,7 @@ class BuzzsproutClient:
         Returns:
             List of podcast dictionaries containing podcast details
         """
-        url = f"{self.base_url}/podcasts.json"
-        response = self.session.get(url)
-        response.raise_for_status()
-        return response.json()
+        return self._to_model(self._get(self._podcasts_url(), "podcasts"), Podcast)
 
     def get_podcast(self, podcast_id: int) -> Optional[Dict]:
         """Get details for a specific podcast.
@@ -31,43 +535,153 @@ class BuzzsproutClient:
         Returns:
             Dictionary containing podcast details or None if not found
         """
-        url = f"{self.base_url}/podcasts/{podcast_id}.json"
-        response = self.session.get(url)
-        if response.status_code == 404:
-            return None
-        response.raise_for_status()
-        return response.json()
+        url = self._podcast_url(podcast_id)
+        return self._to_model(self._get(url, "podcast", allow_not_found=True), Podcast)
 
-    def get_episodes(self, podcast_id: int) -> List[Dict]:
+    def get_episodes(
+        self,
+        podcast_id: int,
+        fields: Optional[Collection[str]] = None
+    ) -> List[Dict]:
         """Get all episodes for a specific podcast.
         
         Args:
             podcast_id: ID of the podcast to retrieve episodes for
+            fields: Keep only these fields of each episode, releasing the
+                rest (e.g. descriptions) as soon as the list is decoded
             
         Returns:
             List of episode dictionaries containing episode details
         """
-        url = f"{self.base_url}/{podcast_id}/episodes.json"
-        response = self.session.get(url)
-        response.raise_for_status()
-        return response.json()
+        episodes = self._get(self._episodes_url(podcast_id), "episodes")
+        return self._to_model(select_fields(episodes, fields), Episode)
+
+    def _run_batch(
+        self,
+        func: Callable[[Any], Any],
+        keys: Iterable[Any],
+        max_workers: int
+    ) -> BatchResult:
+        """:func:`run_batch` with each worker sending through its own session."""
+        def call(key: Any) -> Any:
+            # Workers are threads of this batch only, so the flag (and the
+            # session cloned for the worker) go away with them.
+            self._local.batch_worker = True
+            return func(key)
+
+        return run_batch(call, keys, max_workers)
+
+    def get_episodes_many(
+        self,
+        podcast_ids: Iterable[int],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: Optional[float] = None
+    ) -> BatchResult:
+        """Get the episodes of several podcasts concurrently.
+
+        Requests run on a pool of ``max_workers`` threads, each sending
+        through its own copy of this client's session that shares its
+        connection pool. A failure for one podcast is recorded and does not
+        abort the others.
+
+        Args:
+            podcast_ids: IDs of the podcasts to retrieve episodes for
+            max_workers: Maximum number of requests in flight at once
+            timeout: Timeout in seconds for each request
+
+        Returns:
+            BatchResult whose ``results`` map podcast ID to its episode list
+            and whose ``errors`` map podcast ID to the exception raised
+        """
+        kwargs = {} if timeout is None else {"timeout": timeout}
+
+        def fetch(podcast_id: int) -> List[Dict]:
+            url = self._episodes_url(podcast_id)
+            return self._to_model(self._get(url, "episodes", **kwargs), Episode)
+
+        return self._run_batch(fetch, podcast_ids, max_workers)
+
+    def get_all_episodes(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: Optional[float] = None
+    ) -> BatchResult:
+        """Get the episodes of every podcast on the account concurrently.
+
+        Args:
+            max_workers: Maximum number of requests in flight at once
+            timeout: Timeout in seconds for each request
+
+        Returns:
+            BatchResult keyed by podcast ID, see :meth:`get_episodes_many`
+
+        Raises:
+            requests.HTTPError: If the podcast list cannot be retrieved
+        """
+        podcasts = self.get_podcasts()
+        podcast_ids = [
+            podcast["id"] if isinstance(podcast, dict) else podcast.id
+            for podcast in podcasts
+        ]
+        return self.get_episodes_many(podcast_ids, max_workers, timeout)
+
+    def iter_episodes(
+        self,
+        podcast_id: int,
+        stop_when: Optional[Callable[[Dict], bool]] = None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        fields: Optional[Collection[str]] = None
+    ) -> Iterator[Dict]:
+        """Iterate over the episodes of a podcast as they are downloaded.
+
+        The response body is parsed incrementally, so memory use does not
+        grow with the number of episodes and the first episode is available
+        before the whole list has arrived. Caches are bypassed.
+
+        Args:
+            podcast_id: ID of the podcast to retrieve episodes for
+            stop_when: Stop (without yielding the episode) as soon as this
+                returns True for an episode, e.g.
+                ``published_before(datetime(2020, 1, 1))``
+            chunk_size: Number of bytes read from the response at a time
+            fields: Keep only these fields of each episode; ``stop_when``
+                still sees the whole episode
+
+        Yields:
+            Episode dictionaries in the order returned by the API
+
+        Raises:
+            requests.HTTPError: If API request fails
+        """
+        response = self._request("GET", self._episodes_url(podcast_id), stream=True)
+        try:
+            response.raise_for_status()
+            for episode in iter_json_array(response.iter_content(chunk_size)):
+                if stop_when is not None and stop_when(episode):
+                    return
+                yield self._to_model(select_fields(episode, fields), Episode)
+        finally:
+            response.close()
 
-    def get_episode(self, podcast_id: int, episode_id: int) -> Optional[Dict]:
+    def get_episode(
+        self,
+        podcast_id: int,
+        episode_id: int,
+        fields: Optional[Collection[str]] = None
+    ) -> Optional[Dict]:
         """Get details for a specific episode.
         
         Args:
             podcast_id: ID of the podcast containing the episode
             episode_id: ID of the episode to retrieve
+            fields: Keep only these fields of the episode
             
         Returns:
             Dictionary containing episode details or None if not found
         """
-        url = f"{self.base_url}/{podcast_id}/episodes/{episode_id}.json"
-        response = self.session.get(url)
-        if response.status_code == 404:
-            return None
-        response.raise_for_status()
-        return response.json()
+        url = self._episode_url(podcast_id, episode_id)
+        episode = self._get(url, "episode", allow_not_found=True)
+        return self._to_model(select_fields(episode, fields), Episode)
 
     def update_episode(
         self,
@@ -90,7 +704,9 @@ class BuzzsproutClient:
         season_number: Optional[int] = None,
         explicit: Optional[bool] = None,
         private: Optional[bool] = None,
-        email_user_after_audio_processed: Optional[bool] = None
+        email_user_after_audio_processed: Optional[bool] = None,
+        progress: Optional[ProgressCallback] = None,
+        force_upload: bool = False
     ) -> Dict:
         """Update an existing episode.
         
@@ -115,6 +731,10 @@ class BuzzsproutClient:
             explicit: Whether episode contains explicit content
             private: Whether episode is private
             email_user_after_audio_processed: Whether to email user after processing
+            progress: Called as ``progress(bytes_sent, total_bytes)`` for every
+                uploaded chunk; implies a streaming upload
+            force_upload: Upload files even if the upload ledger says they
+                are unchanged
             
         Returns:
             Dictionary containing updated episode details
@@ -122,38 +742,18 @@ class BuzzsproutClient:
         Raises:
             requests.HTTPError: If API request fails
         """
-        url = f"{self.base_url}/{podcast_id}/episodes/{episode_id}.json"
-        data = {
-            "title": title,
-            "description": description,
-            "summary": summary,
-            "artist": artist,
-            "tags": tags,
-            "published_at": published_at,
-            "duration": duration,
-            "guid": guid,
-            "inactive_at": inactive_at,
-            "episode_number": episode_number,
-            "season_number": season_number,
-            "explicit": explicit,
-            "private": private,
-            "email_user_after_audio_processed": email_user_after_audio_processed,
-            "audio_url": audio_url,
-            "artwork_url": artwork_url
-        }
-        
-        # Remove None values to avoid sending nulls
-        data = {k: v for k, v in data.items() if v is not None}
-        
-        files = {}
-        if audio_file:
-            files["audio_file"] = open(audio_file, "rb")
-        if artwork_file:
-            files["artwork_file"] = open(artwork_file, "rb")
-            
-        response = self.session.put(url, data=data, files=files or None)
-        response.raise_for_status()
-        return response.json()
+        data = self._episode_data(locals(), drop_none=True)
+        url = self._episode_url(podcast_id, episode_id)
+        if self.cache is not None:
+            self.cache.delete(self._cache_key(url))
+        files = {"audio_file": audio_file, "artwork_file": artwork_file}
+        uploads = self._hash_uploads(podcast_id, episode_id, files, force_upload)
+        episode = self._send_episode(
+            "PUT", url, data, files["audio_file"], files["artwork_file"], progress
+        )
+        self._record_uploads(podcast_id, episode, uploads)
+        self._after_episode_write(podcast_id, episode)
+        return self._to_model(episode, Episode)
 
     def create_episode(
         self,
@@ -175,7 +775,8 @@ class BuzzsproutClient:
         season_number: Optional[int] = None,
         explicit: bool = False,
         private: bool = False,
-        email_user_after_audio_processed: bool = True
+        email_user_after_audio_processed: bool = True,
+        progress: Optional[ProgressCallback] = None
     ) -> Dict:
         """Create a new episode.
         
@@ -199,6 +800,8 @@ class BuzzsproutClient:
             explicit: Whether episode contains explicit content
             private: Whether episode is private
             email_user_after_audio_processed: Whether to email user after processing
+            progress: Called as ``progress(bytes_sent, total_bytes)`` for every
+                uploaded chunk; implies a streaming upload
             
         Returns:
             Dictionary containing created episode details
@@ -207,35 +810,81 @@ class BuzzsproutClient:
             ValueError: If neither audio_file nor audio_url is provided
             requests.HTTPError: If API request fails
         """
-        if not audio_file and not audio_url:
-            raise ValueError("Either audio_file or audio_url must be provided")
-            
-        url = f"{self.base_url}/{podcast_id}/episodes.json"
-        data = {
-            "title": title,
-            "description": description,
-            "summary": summary,
-            "artist": artist,
-            "tags": tags,
-            "published_at": published_at,
-            "duration": duration,
-            "guid": guid,
-            "inactive_at": inactive_at,
-            "episode_number": episode_number,
-            "season_number": season_number,
-            "explicit": explicit,
-            "private": private,
-            "email_user_after_audio_processed": email_user_after_audio_processed,
-            "audio_url": audio_url,
-            "artwork_url": artwork_url
-        }
-        
-        files = {}
-        if audio_file:
-            files["audio_file"] = open(audio_file, "rb")
-        if artwork_file:
-            files["artwork_file"] = open(artwork_file, "rb")
-            
-        response = self.session.post(url, data=data, files=files or None)
-        response.raise_for_status()
-        return response.json()
+        self._check_audio(audio_file, audio_url)
+        data = self._episode_data(locals())
+        url = self._episodes_url(podcast_id)
+        files = {"audio_file": audio_file, "artwork_file": artwork_file}
+        uploads = self._hash_uploads(podcast_id, None, files)
+        episode = self._send_episode("POST", url, data, audio_file, artwork_file, progress)
+        self._record_uploads(podcast_id, episode, uploads)
+        self._after_episode_write(podcast_id, episode)
+        return self._to_model(episode, Episode)
+
+    def bulk_update_episodes(
+        self,
+        podcast_id: int,
+        changes: Union[Mapping[int, Dict[str, Any]], Callable[[Dict], Dict[str, Any]]],
+        dry_run: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> BulkUpdateReport:
+        """Update many episodes, sending only fields that actually change.
+
+        The current episodes are fetched once, bypassing the in-memory
+        cache; each requested change is compared with them field by field and episodes that already match
+        are skipped. The remaining PUTs run concurrently and carry only the
+        changed fields.
+
+        Args:
+            podcast_id: ID of the podcast containing the episodes
+            changes: Either a mapping of episode ID to the field values it
+                should have, or a function that takes an episode dictionary
+                and returns the values it should have (applied to every
+                episode of the podcast)
+            dry_run: Compute the report without sending any PUTs
+            max_workers: Maximum number of PUTs in flight at once
+
+        Returns:
+            BulkUpdateReport listing updated, skipped and failed episodes
+
+        Raises:
+            ValueError: If a change names a field update_episode does not accept
+            requests.HTTPError: If the episode list cannot be retrieved
+        """
+        # Diff against the server's state, not a possibly stale memory
+        # cache entry; an HTTP cache still revalidates.
+        episodes = self._fetch(self._episodes_url(podcast_id))
+        current = {episode["id"]: episode for episode in episodes}
+        if callable(changes):
+            wanted = {episode_id: changes(episode) for episode_id, episode in current.items()}
+        else:
+            wanted = dict(changes)
+
+        report = BulkUpdateReport(dry_run=dry_run)
+        pending = {}
+        for episode_id, fields in wanted.items():
+            unknown = set(fields) - set(EPISODE_FIELDS)
+            if unknown:
+                raise ValueError(f"Cannot bulk update fields: {', '.join(sorted(unknown))}")
+            if episode_id not in current:
+                report.failed[episode_id] = LookupError(
+                    f"Episode {episode_id} not found in podcast {podcast_id}"
+                )
+                continue
+            changed = diff_fields(current[episode_id], fields)
+            if changed:
+                pending[episode_id] = changed
+            else:
+                report.skipped.append(episode_id)
+
+        if dry_run:
+            report.updated = pending
+            return report
+
+        batch = self._run_batch(
+            lambda episode_id: self.update_episode(podcast_id, episode_id, **pending[episode_id]),
+            pending,
+            max_workers
+        )
+        report.updated = {episode_id: pending[episode_id] for episode_id in batch.results}
+        report.failed.update(batch.errors)
+        return report
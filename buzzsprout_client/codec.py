@@ -0,0 +1,82 @@
+import json
+from typing import Any, Collection, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+AUTO = "auto"
+
+
+class JSONCodec:
+    """Decodes response bodies with the standard library.
+
+    :meth:`loads` takes the raw bytes of the body. ``json.loads`` detects
+    UTF-8/16/32 itself, so this skips the character set guessing and the
+    intermediate ``str`` that ``response.json()`` builds.
+    """
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Decodes response bodies with `orjson`_, several times faster.
+
+    .. _orjson: https://github.com/ijl/orjson
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError(
+                "OrjsonCodec requires orjson, install it with "
+                "`pip install buzzsprout-client[fast-json]`"
+            )
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+_CODECS = {
+    JSONCodec.name: JSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+
+def get_codec(codec: Union[str, JSONCodec, None] = AUTO) -> Optional[JSONCodec]:
+    """Resolve a codec name to a codec instance.
+
+    Args:
+        codec: ``"auto"`` for the fastest installed decoder, ``"orjson"`` or
+            ``"json"`` for a specific one, a :class:`JSONCodec` instance
+            (returned as is) or None (returned as is)
+
+    Raises:
+        ValueError: If the name is not a known codec
+        ImportError: If the named codec is not installed
+    """
+    if codec is None or isinstance(codec, JSONCodec):
+        return codec
+    if codec == AUTO:
+        return OrjsonCodec() if orjson is not None else JSONCodec()
+    if codec not in _CODECS:
+        raise ValueError(f"Unknown JSON codec: {codec!r}")
+    return _CODECS[codec]()
+
+
+def select_fields(value: Any, fields: Optional[Collection[str]]) -> Any:
+    """Keep only ``fields`` of a decoded object or list of objects.
+
+    The rest of each object is released right away, so large unused
+    values such as descriptions do not stay in memory.
+    """
+    if fields is None or value is None:
+        return value
+    if isinstance(value, list):
+        return [{name: item[name] for name in fields if name in item} for item in value]
+    return {name: value[name] for name in fields if name in value}
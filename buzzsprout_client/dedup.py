@@ -0,0 +1,106 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class UploadStats:
+    uploaded: int = 0
+    skipped: int = 0
+    bytes_uploaded: int = 0
+    bytes_saved: int = 0
+
+
+def file_digest(path: str, chunk_size: int = HASH_CHUNK_SIZE) -> Tuple[str, int]:
+    """Hash a file without loading it into memory.
+
+    Returns:
+        ``(hex digest, size in bytes)``
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    size = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+class UploadLedger:
+    """Persistent record of the files last uploaded to each episode.
+
+    The client consults the ledger before updating an episode: an
+    ``audio_file`` or ``artwork_file`` whose content hash matches the last
+    successful upload for that episode and field is left out of the
+    request, while metadata fields are still sent. Files are hashed in
+    chunks, so memory use does not depend on file size.
+
+    Counters in :attr:`stats`:
+
+    * ``uploaded`` / ``bytes_uploaded`` - files sent and their total size
+    * ``skipped`` / ``bytes_saved`` - unchanged files left out
+
+    Args:
+        path: Path of the SQLite database file, created if missing
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self.stats = UploadStats()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS uploads ("
+            " podcast_id INTEGER NOT NULL,"
+            " episode_id INTEGER NOT NULL,"
+            " field TEXT NOT NULL,"
+            " digest TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " PRIMARY KEY (podcast_id, episode_id, field))"
+        )
+        self._db.commit()
+
+    def get(self, podcast_id: int, episode_id: int, field: str) -> Optional[str]:
+        """Digest of the last file uploaded to ``field``, if any."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT digest FROM uploads WHERE podcast_id = ? AND episode_id = ? AND field = ?",
+                (podcast_id, episode_id, field)
+            ).fetchone()
+        return row[0] if row else None
+
+    def record(self, podcast_id: int, episode_id: int, field: str, digest: str, size: int) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO uploads (podcast_id, episode_id, field, digest, size)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (podcast_id, episode_id, field, digest, size)
+            )
+            self._db.commit()
+            self.stats.uploaded += 1
+            self.stats.bytes_uploaded += size
+
+    def skip(self, size: int) -> None:
+        with self._lock:
+            self.stats.skipped += 1
+            self.stats.bytes_saved += size
+
+    def forget(self, podcast_id: int, episode_id: Optional[int] = None) -> None:
+        """Drop the records of an episode, or of a whole podcast."""
+        with self._lock:
+            if episode_id is None:
+                self._db.execute("DELETE FROM uploads WHERE podcast_id = ?", (podcast_id,))
+            else:
+                self._db.execute(
+                    "DELETE FROM uploads WHERE podcast_id = ? AND episode_id = ?",
+                    (podcast_id, episode_id)
+                )
+            self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,321 @@
+import json
+import os
+import secrets
+import sqlite3
+import threading
+from dataclasses import dataclass
+from email.utils import format_datetime
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Optional, Set, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from .mirror import fingerprint
+from .models import as_dict
+from .streaming import parse_datetime
+
+RSS = "rss"
+JSON_FEED = "json"
+
+_ITUNES_NS = "http://www.itunes.com/dtds/podcast-1.0.dtd"
+
+
+@dataclass
+class FeedStats:
+    rendered: int = 0
+    reused: int = 0
+    skipped: int = 0
+
+
+class FeedCache:
+    """Rendered feed items from previous exports, stored in SQLite.
+
+    Each item is stored with a fingerprint of the episode data it was
+    rendered from; the next export reuses the stored item when the
+    fingerprint still matches and renders it again otherwise. Items of
+    episodes missing from an export are removed afterwards.
+
+    Args:
+        path: Path of the SQLite database file, created if missing
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            " format TEXT NOT NULL,"
+            " podcast_id INTEGER NOT NULL,"
+            " episode_id INTEGER NOT NULL,"
+            " fingerprint TEXT NOT NULL,"
+            " fragment BLOB NOT NULL,"
+            " PRIMARY KEY (format, podcast_id, episode_id))"
+        )
+        self._db.commit()
+
+    def get(self, fmt: str, podcast_id: int, episode_id: int) -> Optional[Tuple[str, bytes]]:
+        """Stored ``(fingerprint, fragment)`` of an item, if any."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT fingerprint, fragment FROM items"
+                " WHERE format = ? AND podcast_id = ? AND episode_id = ?",
+                (fmt, podcast_id, episode_id)
+            ).fetchone()
+
+    def put(self, fmt: str, podcast_id: int, episode_id: int, digest: str, fragment: bytes) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO items (format, podcast_id, episode_id, fingerprint, fragment)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (fmt, podcast_id, episode_id, digest, fragment)
+            )
+
+    def finish(self, fmt: str, podcast_id: int, seen: Set[int]) -> None:
+        """Drop items not in ``seen`` and commit the export's changes."""
+        with self._lock:
+            stored = [
+                episode_id for (episode_id,) in self._db.execute(
+                    "SELECT episode_id FROM items WHERE format = ? AND podcast_id = ?",
+                    (fmt, podcast_id)
+                )
+            ]
+            self._db.executemany(
+                "DELETE FROM items WHERE format = ? AND podcast_id = ? AND episode_id = ?",
+                [(fmt, podcast_id, episode_id) for episode_id in stored if episode_id not in seen]
+            )
+            self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def _element(name: str, value: Any) -> str:
+    if value is None or value == "":
+        return ""
+    return f"<{name}>{escape(str(value))}</{name}>"
+
+
+def _rfc2822(value: Optional[str]) -> Optional[str]:
+    return format_datetime(parse_datetime(value)) if value else None
+
+
+def _explicit(value: Any) -> Optional[str]:
+    return None if value is None else ("true" if value else "false")
+
+
+def render_rss_item(episode: Dict) -> bytes:
+    """Render one episode as an RSS ``<item>`` with iTunes tags."""
+    parts = [
+        "<item>",
+        _element("title", episode.get("title")),
+        _element("description", episode.get("description")),
+        _element("itunes:summary", episode.get("summary")),
+        _element("itunes:author", episode.get("artist")),
+        _element("itunes:keywords", episode.get("tags")),
+        f"<guid isPermaLink=\"false\">{escape(str(episode.get('guid') or episode['id']))}</guid>",
+        _element("pubDate", _rfc2822(episode.get("published_at"))),
+    ]
+    if episode.get("audio_url"):
+        # The API does not report file sizes; 0 is the customary placeholder.
+        parts.append(
+            f"<enclosure url={quoteattr(episode['audio_url'])} length=\"0\" type=\"audio/mpeg\"/>"
+        )
+    if episode.get("artwork_url"):
+        parts.append(f"<itunes:image href={quoteattr(episode['artwork_url'])}/>")
+    parts += [
+        _element("itunes:duration", episode.get("duration")),
+        _element("itunes:explicit", _explicit(episode.get("explicit"))),
+        _element("itunes:episode", episode.get("episode_number")),
+        _element("itunes:season", episode.get("season_number")),
+        "</item>\n",
+    ]
+    return "".join(parts).encode("utf-8")
+
+
+def _rss_header(podcast: Dict) -> bytes:
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n',
+        f'<rss version="2.0" xmlns:itunes="{_ITUNES_NS}">\n<channel>\n',
+        _element("title", podcast.get("title")),
+        _element("link", podcast.get("website_address")),
+        _element("description", podcast.get("description")),
+        _element("language", podcast.get("language")),
+        _element("itunes:author", podcast.get("author")),
+        _element("itunes:explicit", _explicit(podcast.get("explicit"))),
+    ]
+    if podcast.get("artwork_url"):
+        parts.append(f"<itunes:image href={quoteattr(podcast['artwork_url'])}/>")
+    if podcast.get("contact_email"):
+        parts.append(
+            "<itunes:owner>"
+            + _element("itunes:name", podcast.get("author"))
+            + _element("itunes:email", podcast["contact_email"])
+            + "</itunes:owner>"
+        )
+    parts.append("\n")
+    return "".join(parts).encode("utf-8")
+
+
+def render_json_feed_item(episode: Dict) -> bytes:
+    """Render one episode as a JSON Feed item."""
+    item = {
+        "id": str(episode.get("guid") or episode["id"]),
+        "title": episode.get("title"),
+        "content_html": episode.get("description") or "",
+        "summary": episode.get("summary") or None,
+        "date_published": episode.get("published_at"),
+        "image": episode.get("artwork_url"),
+        "tags": [tag.strip() for tag in (episode.get("tags") or "").split(",") if tag.strip()] or None,
+        "authors": [{"name": episode["artist"]}] if episode.get("artist") else None,
+        "_itunes": {
+            "duration": episode.get("duration"),
+            "explicit": episode.get("explicit"),
+            "episode": episode.get("episode_number"),
+            "season": episode.get("season_number"),
+        },
+    }
+    if episode.get("audio_url"):
+        item["attachments"] = [{
+            "url": episode["audio_url"],
+            "mime_type": "audio/mpeg",
+            "duration_in_seconds": episode.get("duration"),
+        }]
+    item = {key: value for key, value in item.items() if value is not None}
+    return json.dumps(item, separators=(",", ":")).encode("utf-8")
+
+
+def _json_feed_header(podcast: Dict) -> bytes:
+    feed = {
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": podcast.get("title"),
+        "home_page_url": podcast.get("website_address"),
+        "description": podcast.get("description"),
+        "icon": podcast.get("artwork_url"),
+        "language": podcast.get("language"),
+        "authors": [{"name": podcast["author"]}] if podcast.get("author") else None,
+    }
+    feed = {key: value for key, value in feed.items() if value is not None}
+    # Everything but the closing brace, so items can be streamed after it.
+    return json.dumps(feed, separators=(",", ":"))[:-1].encode("utf-8") + b',"items":['
+
+
+# format -> (header, render item, separator, footer)
+_FORMATS: Dict[str, Tuple[Callable[[Dict], bytes], Callable[[Dict], bytes], bytes, bytes]] = {
+    RSS: (_rss_header, render_rss_item, b"", b"</channel>\n</rss>\n"),
+    JSON_FEED: (_json_feed_header, render_json_feed_item, b",", b"]}\n"),
+}
+
+
+def write_feed(
+    out: BinaryIO,
+    podcast: Any,
+    episodes: Iterable[Any],
+    fmt: str = RSS,
+    cache: Optional[FeedCache] = None,
+    include_private: bool = False
+) -> FeedStats:
+    """Write a feed for ``podcast`` to ``out`` while consuming ``episodes``.
+
+    Items are written one at a time as episodes arrive, so the episodes can
+    come straight from :meth:`BuzzsproutClient.iter_episodes` and the whole
+    feed is never held in memory. For sockets, pass ``sock.makefile("wb")``.
+
+    Args:
+        out: Binary stream the UTF-8 encoded feed is written to
+        podcast: Podcast dictionary or :class:`Podcast`
+        episodes: Episode dictionaries or :class:`Episode` objects
+        fmt: ``"rss"`` for podcast RSS with iTunes tags, ``"json"`` for
+            JSON Feed 1.1
+        cache: Reuse items rendered by earlier exports when the episode
+            data has not changed
+        include_private: Include private episodes
+
+    Returns:
+        Counts of rendered, reused and skipped episodes
+
+    Raises:
+        ValueError: If ``fmt`` is not a supported format
+    """
+    if fmt not in _FORMATS:
+        raise ValueError(f"Unknown feed format: {fmt!r}")
+    header, render, separator, footer = _FORMATS[fmt]
+    podcast = as_dict(podcast)
+    podcast_id = podcast.get("id")
+    stats = FeedStats()
+    seen = set()
+
+    out.write(header(podcast))
+    first = True
+    for episode in episodes:
+        episode = as_dict(episode)
+        if episode.get("private") and not include_private:
+            stats.skipped += 1
+            continue
+        if cache is None:
+            fragment = render(episode)
+            stats.rendered += 1
+        else:
+            seen.add(episode["id"])
+            digest = fingerprint(episode)
+            stored = cache.get(fmt, podcast_id, episode["id"])
+            if stored is not None and stored[0] == digest:
+                fragment = stored[1]
+                stats.reused += 1
+            else:
+                fragment = render(episode)
+                cache.put(fmt, podcast_id, episode["id"], digest, fragment)
+                stats.rendered += 1
+        if not first:
+            out.write(separator)
+        out.write(fragment)
+        first = False
+    out.write(footer)
+
+    if cache is not None:
+        cache.finish(fmt, podcast_id, seen)
+    return stats
+
+
+def _create_temporary(directory: str) -> Tuple[int, str]:
+    """Like ``tempfile.mkstemp``, but with the mode ``open`` would use.
+
+    mkstemp creates files readable by their owner only. Passing 0o666 to
+    ``os.open`` lets the kernel apply the umask, without changing the
+    process-wide umask to read it.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        temporary = os.path.join(directory, f".feed-{secrets.token_hex(8)}")
+        try:
+            return os.open(temporary, flags, 0o666), temporary
+        except FileExistsError:
+            continue
+
+
+def export_feed(
+    path: str,
+    podcast: Any,
+    episodes: Iterable[Any],
+    fmt: str = RSS,
+    cache: Optional[FeedCache] = None,
+    include_private: bool = False
+) -> FeedStats:
+    """Write a feed to ``path``, replacing the file only once it is complete.
+
+    Takes the same arguments as :func:`write_feed`.
+    """
+    path = os.path.expanduser(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temporary = _create_temporary(directory)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            stats = write_feed(out, podcast, episodes, fmt, cache, include_private)
+        try:
+            # Keep the mode of the feed being replaced
+            os.chmod(temporary, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return stats
@@ -0,0 +1,303 @@
+import csv
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .bulk import run_batch
+from .models import EPISODE_FIELDS, as_dict, parse_episode_field
+
+DEFAULT_INGEST_WORKERS = 4
+
+FILE_FIELDS = ("audio_file", "artwork_file")
+MANIFEST_FIELDS = set(EPISODE_FIELDS) | set(FILE_FIELDS)
+
+PENDING = "pending"
+DONE = "done"
+
+
+@dataclass
+class IngestedEpisode:
+    """Timing of one episode created by :func:`ingest_episodes`."""
+
+    guid: str
+    episode_id: Optional[int]
+    bytes: int
+    seconds: float
+
+
+@dataclass
+class IngestReport:
+    """Outcome of :func:`ingest_episodes`.
+
+    Attributes:
+        created: Episodes created by this run, in completion order
+        already_done: GUIDs the journal had recorded as created before
+        recovered: GUIDs interrupted mid-upload by an earlier run that
+            turned out to exist on the server, so were not sent again
+        failed: Exceptions per GUID whose creation failed; these are
+            retried by the next run
+        bytes_uploaded: Total size of the files uploaded by this run
+        elapsed: Wall-clock seconds the run took
+    """
+
+    created: List[IngestedEpisode] = field(default_factory=list)
+    already_done: List[str] = field(default_factory=list)
+    recovered: List[str] = field(default_factory=list)
+    failed: Dict[str, Exception] = field(default_factory=dict)
+    bytes_uploaded: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    @property
+    def mb_per_second(self) -> float:
+        """Aggregate upload rate of the run in megabytes (10**6) per second."""
+        return self.bytes_uploaded / self.elapsed / 1e6 if self.elapsed else 0.0
+
+
+def _coerce(name: str, value: str) -> Any:
+    try:
+        return parse_episode_field(name, value)
+    except ValueError as exc:
+        raise ValueError(f"{name}: {exc}") from None
+
+
+def read_manifest(path: str, fmt: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Read episode entries from a CSV or JSON Lines manifest.
+
+    Columns (or keys) are the keyword arguments of
+    :meth:`BuzzsproutClient.create_episode`. Empty CSV cells are left out
+    and numeric and boolean columns are converted. Relative
+    ``audio_file``/``artwork_file`` paths are resolved against the
+    manifest's directory.
+
+    Args:
+        path: Path of the manifest file
+        fmt: ``"csv"`` or ``"jsonl"``; guessed from the file extension
+            when omitted
+
+    Returns:
+        List of entries in manifest order
+
+    Raises:
+        ValueError: If the format is unknown or an entry has unknown fields
+            or malformed values
+    """
+    path = os.path.expanduser(path)
+    if fmt is None:
+        fmt = "csv" if path.lower().endswith(".csv") else "jsonl"
+    entries = []
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            for row in csv.DictReader(f):
+                entries.append({
+                    name: _coerce(name, value)
+                    for name, value in row.items()
+                    if value not in (None, "")
+                })
+        elif fmt == "jsonl":
+            entries = [json.loads(line) for line in f if line.strip()]
+        else:
+            raise ValueError(f"Unknown manifest format: {fmt!r}")
+
+    base = os.path.dirname(os.path.abspath(path))
+    for number, entry in enumerate(entries, 1):
+        unknown = set(entry) - MANIFEST_FIELDS
+        if unknown:
+            raise ValueError(f"Entry {number}: unknown fields {', '.join(sorted(unknown))}")
+        for name in FILE_FIELDS:
+            if entry.get(name):
+                entry[name] = os.path.join(base, os.path.expanduser(entry[name]))
+    return entries
+
+
+class IngestJournal:
+    """Checkpoint journal of a bulk ingest, stored in SQLite.
+
+    Entries are keyed by podcast and episode GUID. An entry is written as
+    pending before its upload starts and marked done, with the new episode
+    ID, as soon as the API confirms it; every change is committed right
+    away so the journal survives a crash.
+
+    Args:
+        path: Path of the SQLite database file, created if missing
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " podcast_id INTEGER NOT NULL,"
+            " guid TEXT NOT NULL,"
+            " state TEXT NOT NULL,"
+            " episode_id INTEGER,"
+            " bytes INTEGER,"
+            " seconds REAL,"
+            " error TEXT,"
+            " PRIMARY KEY (podcast_id, guid))"
+        )
+        self._db.commit()
+
+    def entries(self, podcast_id: int) -> Dict[str, Tuple[str, Optional[int]]]:
+        """``(state, episode_id)`` of every journaled GUID of a podcast."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT guid, state, episode_id FROM entries WHERE podcast_id = ?",
+                (podcast_id,)
+            ).fetchall()
+        return {guid: (state, episode_id) for guid, state, episode_id in rows}
+
+    def begin(self, podcast_id: int, guid: str) -> None:
+        self._write(
+            "INSERT OR REPLACE INTO entries (podcast_id, guid, state) VALUES (?, ?, ?)",
+            (podcast_id, guid, PENDING)
+        )
+
+    def finish(
+        self,
+        podcast_id: int,
+        guid: str,
+        episode_id: Optional[int],
+        size: Optional[int] = None,
+        seconds: Optional[float] = None
+    ) -> None:
+        self._write(
+            "INSERT OR REPLACE INTO entries (podcast_id, guid, state, episode_id, bytes, seconds)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (podcast_id, guid, DONE, episode_id, size, seconds)
+        )
+
+    def fail(self, podcast_id: int, guid: str, error: Exception) -> None:
+        """Note why an upload failed; the entry stays pending."""
+        self._write(
+            "UPDATE entries SET error = ? WHERE podcast_id = ? AND guid = ?",
+            (f"{type(error).__name__}: {error}", podcast_id, guid)
+        )
+
+    def _write(self, sql: str, params: tuple) -> None:
+        with self._lock:
+            self._db.execute(sql, params)
+            self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def _upload_size(entry: Dict[str, Any]) -> int:
+    return sum(os.path.getsize(entry[name]) for name in FILE_FIELDS if entry.get(name))
+
+
+def ingest_episodes(
+    client: Any,
+    podcast_id: int,
+    entries: List[Dict[str, Any]],
+    journal: IngestJournal,
+    max_workers: int = DEFAULT_INGEST_WORKERS,
+    on_episode: Optional[Callable[[IngestedEpisode], None]] = None
+) -> IngestReport:
+    """Create many episodes, resuming from ``journal`` after an interruption.
+
+    Entries the journal records as done are skipped. Entries an earlier
+    run started but did not confirm are looked up on the server by GUID
+    (one episode list request) and only sent again if missing, so a
+    restarted run never creates duplicates. The remaining entries are
+    uploaded on ``max_workers`` threads, largest files first, so the big
+    uploads overlap and small ones fill the gaps at the end.
+
+    Share the client between threads safely by creating it with
+    ``thread_safe=True``.
+
+    Args:
+        client: :class:`BuzzsproutClient` to create the episodes with
+        podcast_id: ID of the podcast to add the episodes to
+        entries: Keyword arguments for
+            :meth:`BuzzsproutClient.create_episode`, each with a unique
+            ``guid``, e.g. from :func:`read_manifest`
+        journal: Journal recording progress of this and earlier runs
+        max_workers: Maximum number of uploads in flight at once
+        on_episode: Called with each :class:`IngestedEpisode` as soon as
+            it is created; calls never overlap
+
+    Returns:
+        IngestReport with per-episode timings and the aggregate rate
+
+    Raises:
+        ValueError: If an entry has no GUID, a GUID appears twice or a file
+            is missing; nothing is uploaded in that case
+        requests.HTTPError: If the episode list needed to check interrupted
+            uploads cannot be retrieved
+    """
+    started = time.perf_counter()
+    by_guid: Dict[str, Dict[str, Any]] = {}
+    sizes: Dict[str, int] = {}
+    for number, entry in enumerate(entries, 1):
+        guid = entry.get("guid")
+        if not guid:
+            raise ValueError(f"Entry {number} has no guid")
+        guid = str(guid)
+        if guid in by_guid:
+            raise ValueError(f"Duplicate guid {guid!r}")
+        try:
+            sizes[guid] = _upload_size(entry)
+        except OSError as exc:
+            raise ValueError(f"Entry {number} ({guid}): {exc}") from exc
+        by_guid[guid] = dict(entry, guid=guid)
+
+    report = IngestReport()
+    journaled = journal.entries(podcast_id)
+    pending = []
+    interrupted = []
+    for guid in by_guid:
+        state, _ = journaled.get(guid, (None, None))
+        if state == DONE:
+            report.already_done.append(guid)
+        elif state == PENDING:
+            interrupted.append(guid)
+        else:
+            pending.append(guid)
+
+    if interrupted:
+        existing = {
+            str(episode["guid"]): episode["id"]
+            for episode in map(as_dict, client.iter_episodes(podcast_id))
+            if episode.get("guid")
+        }
+        for guid in interrupted:
+            if guid in existing:
+                journal.finish(podcast_id, guid, existing[guid])
+                report.recovered.append(guid)
+            else:
+                pending.append(guid)
+
+    lock = threading.Lock()
+
+    def create(guid: str) -> IngestedEpisode:
+        journal.begin(podcast_id, guid)
+        began = time.perf_counter()
+        try:
+            episode = as_dict(client.create_episode(podcast_id, **by_guid[guid]))
+        except Exception as exc:
+            journal.fail(podcast_id, guid, exc)
+            raise
+        result = IngestedEpisode(guid, episode.get("id"), sizes[guid], time.perf_counter() - began)
+        journal.finish(podcast_id, guid, result.episode_id, result.bytes, result.seconds)
+        with lock:
+            report.created.append(result)
+            report.bytes_uploaded += result.bytes
+            if on_episode is not None:
+                on_episode(result)
+        return result
+
+    pending.sort(key=lambda guid: sizes[guid], reverse=True)
+    batch = run_batch(create, pending, max_workers)
+    report.failed = batch.errors
+    report.elapsed = time.perf_counter() - started
+    return report
@@ -0,0 +1,181 @@
+import bisect
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+# Upper bounds in seconds of the latency histogram buckets; the last bucket
+# collects everything slower.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DEFAULT_SAMPLE_SIZE = 2048
+
+
+@dataclass
+class RequestEvent:
+    """One API call as seen by the client.
+
+    Attributes:
+        method: HTTP method
+        endpoint: URL path with IDs replaced by placeholders, e.g.
+            ``/{podcast_id}/episodes/{episode_id}.json``
+        url: Full request URL
+        status: HTTP status, None if no response was received
+        duration: Seconds spent in the call, including retries and
+            rate-limit waits
+        request_bytes: Size of the request body, when known
+        response_bytes: Size of the response body, when known
+        retries: Number of retries made by the governor
+        cache: ``"memory"`` when served from the in-memory cache without a
+            request, ``"http"`` when the server confirmed a stored response
+            with 304 Not Modified, otherwise None
+        error: Exception raised by the call, if any
+    """
+
+    method: str
+    endpoint: str
+    url: str
+    status: Optional[int] = None
+    duration: float = 0.0
+    request_bytes: Optional[int] = None
+    response_bytes: Optional[int] = None
+    retries: int = 0
+    cache: Optional[str] = None
+    error: Optional[BaseException] = None
+
+
+Hook = Callable[[RequestEvent], None]
+
+
+def endpoint_template(path: str) -> str:
+    """Replace numeric IDs in an API path with named placeholders."""
+    parts = path.split("/")
+    for i, part in enumerate(parts):
+        stem, dot, extension = part.partition(".")
+        if stem.isdigit():
+            name = "episode_id" if i and parts[i - 1] == "episodes" else "podcast_id"
+            parts[i] = f"{{{name}}}{dot}{extension}"
+    return "/".join(parts)
+
+
+def content_length(headers: Optional[Mapping[str, str]]) -> Optional[int]:
+    """Read the ``Content-Length`` header, if present and valid."""
+    if not headers:
+        return None
+    try:
+        return int(headers.get("Content-Length"))
+    except (TypeError, ValueError):
+        return None
+
+
+class EndpointMetrics:
+    """Counters and latency distribution for one endpoint."""
+
+    def __init__(self, buckets: Sequence[float], sample_size: int):
+        self.buckets = tuple(buckets)
+        self.histogram = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.total_time = 0.0
+        self.first_seen: Optional[float] = None
+        self.last_seen: Optional[float] = None
+        self._samples = deque(maxlen=sample_size)
+
+    def add(self, event: RequestEvent, now: float) -> None:
+        self.count += 1
+        if event.error is not None or (event.status or 0) >= 400:
+            self.errors += 1
+        if event.cache is not None:
+            self.cache_hits += 1
+        self.retries += event.retries
+        self.request_bytes += event.request_bytes or 0
+        self.response_bytes += event.response_bytes or 0
+        self.total_time += event.duration
+        self.histogram[bisect.bisect_left(self.buckets, event.duration)] += 1
+        self._samples.append(event.duration)
+        if self.first_seen is None:
+            self.first_seen = now
+        self.last_seen = now
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Latency below which ``q`` percent of recent calls completed."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered))) - 1))
+        return ordered[rank]
+
+    def snapshot(self) -> Dict[str, Any]:
+        elapsed = (self.last_seen or 0) - (self.first_seen or 0)
+        histogram = {f"le_{bound:g}": n for bound, n in zip(self.buckets, self.histogram)}
+        histogram["inf"] = self.histogram[-1]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
+            "retries": self.retries,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "mean": self.total_time / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": max(self._samples) if self._samples else None,
+            "per_second": self.count / elapsed if elapsed > 0 else None,
+            "histogram": histogram,
+        }
+
+
+class MetricsCollector:
+    """Hook that aggregates :class:`RequestEvent` objects per endpoint.
+
+    Register it with ``client.add_hook(collector)``. Latency histograms use
+    fixed ``buckets``; percentiles are computed from the most recent
+    ``sample_size`` calls of each endpoint.
+
+    Args:
+        buckets: Upper bounds in seconds of the histogram buckets
+        sample_size: Number of recent latencies kept per endpoint
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.sample_size = sample_size
+        self._clock = clock
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        key = f"{event.method} {event.endpoint}"
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = EndpointMetrics(self.buckets, self.sample_size)
+            metrics.add(event, self._clock())
+
+    def endpoints(self) -> List[str]:
+        with self._lock:
+            return sorted(self._endpoints)
+
+    def get(self, key: str) -> Optional[EndpointMetrics]:
+        """Metrics for ``"<METHOD> <endpoint>"``, e.g. ``"GET /podcasts.json"``."""
+        with self._lock:
+            return self._endpoints.get(key)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Summaries of every endpoint seen, keyed by ``"<METHOD> <endpoint>"``."""
+        with self._lock:
+            return {key: metrics.snapshot() for key, metrics in sorted(self._endpoints.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
@@ -0,0 +1,297 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .models import Episode, Podcast, as_dict
+from .streaming import parse_datetime
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS podcasts (
+    id INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS episodes (
+    id INTEGER PRIMARY KEY,
+    podcast_id INTEGER NOT NULL,
+    guid TEXT,
+    episode_number INTEGER,
+    season_number INTEGER,
+    published_at TEXT,
+    private INTEGER,
+    fingerprint TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS episodes_podcast ON episodes (podcast_id, published_at);
+CREATE INDEX IF NOT EXISTS episodes_guid ON episodes (guid);
+CREATE INDEX IF NOT EXISTS episodes_number
+    ON episodes (podcast_id, season_number, episode_number);
+CREATE INDEX IF NOT EXISTS episodes_published_at ON episodes (published_at);
+CREATE INDEX IF NOT EXISTS episodes_private ON episodes (private, podcast_id);
+CREATE TABLE IF NOT EXISTS episode_tags (
+    episode_id INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (tag, episode_id)
+);
+CREATE INDEX IF NOT EXISTS episode_tags_episode ON episode_tags (episode_id);
+"""
+
+
+@dataclass
+class SyncStats:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+
+
+def fingerprint(data: Dict) -> str:
+    """Stable hash of an API object, used to detect changed rows."""
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+def _utc(value: Union[str, datetime, None]) -> Optional[str]:
+    """Normalize a timestamp to UTC ISO 8601 so it sorts as text."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        value = parse_datetime(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _split_tags(tags: Optional[str]) -> List[str]:
+    return sorted({tag.strip() for tag in (tags or "").split(",") if tag.strip()})
+
+
+class EpisodeMirror:
+    """Local SQLite copy of podcasts and episodes with indexed lookups.
+
+    :meth:`sync` downloads the account (or selected podcasts) and writes
+    only rows whose content changed since the previous sync, removing
+    episodes that disappeared. Query methods read from the local database
+    only and never touch the API.
+
+    Results are dictionaries, or :class:`Episode`/:class:`Podcast` objects
+    when the client was created with ``models=True``.
+
+    Args:
+        client: Client used to download data
+        path: Path of the SQLite database file, created if missing
+    """
+
+    def __init__(self, client, path: str):
+        self.client = client
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def sync(self, podcast_ids: Optional[Iterable[int]] = None) -> SyncStats:
+        """Bring the mirror up to date with the API.
+
+        Args:
+            podcast_ids: Podcasts to sync, defaults to every podcast on the
+                account
+
+        Returns:
+            Counts of inserted, updated, unchanged and deleted episodes
+
+        Raises:
+            LookupError: If one of ``podcast_ids`` does not exist; nothing
+                is synced in that case
+        """
+        stats = SyncStats()
+        if podcast_ids is None:
+            podcasts = [as_dict(podcast) for podcast in self.client.get_podcasts()]
+        else:
+            podcasts = []
+            for podcast_id in podcast_ids:
+                podcast = self.client.get_podcast(podcast_id)
+                if podcast is None:
+                    raise LookupError(f"Podcast {podcast_id} not found")
+                podcasts.append(as_dict(podcast))
+        for podcast in podcasts:
+            self._upsert_podcast(podcast)
+            episodes = (as_dict(episode) for episode in self.client.iter_episodes(podcast["id"]))
+            self._sync_episodes(podcast["id"], episodes, stats)
+        return stats
+
+    def _upsert_podcast(self, podcast: Dict) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO podcasts (id, fingerprint, data) VALUES (?, ?, ?)"
+                " ON CONFLICT (id) DO UPDATE SET fingerprint = excluded.fingerprint,"
+                " data = excluded.data WHERE fingerprint != excluded.fingerprint",
+                (podcast["id"], fingerprint(podcast), json.dumps(podcast))
+            )
+            self._db.commit()
+
+    def _sync_episodes(self, podcast_id: int, episodes: Iterable[Dict], stats: SyncStats) -> None:
+        with self._lock:
+            known = dict(self._db.execute(
+                "SELECT id, fingerprint FROM episodes WHERE podcast_id = ?", (podcast_id,)
+            ))
+        seen = set()
+        for episode in episodes:
+            episode_id = episode["id"]
+            seen.add(episode_id)
+            digest = fingerprint(episode)
+            previous = known.get(episode_id)
+            if previous == digest:
+                stats.unchanged += 1
+                continue
+            with self._lock:
+                self._write_episode(podcast_id, episode, digest)
+            if previous is None:
+                stats.inserted += 1
+            else:
+                stats.updated += 1
+        gone = [episode_id for episode_id in known if episode_id not in seen]
+        with self._lock:
+            for episode_id in gone:
+                self._db.execute("DELETE FROM episodes WHERE id = ?", (episode_id,))
+                self._db.execute("DELETE FROM episode_tags WHERE episode_id = ?", (episode_id,))
+            self._db.commit()
+        stats.deleted += len(gone)
+
+    def _write_episode(self, podcast_id: int, episode: Dict, digest: str) -> None:
+        private = episode.get("private")
+        self._db.execute(
+            "INSERT OR REPLACE INTO episodes (id, podcast_id, guid, episode_number,"
+            " season_number, published_at, private, fingerprint, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                episode["id"],
+                podcast_id,
+                episode.get("guid"),
+                episode.get("episode_number"),
+                episode.get("season_number"),
+                _utc(episode.get("published_at")),
+                None if private is None else int(bool(private)),
+                digest,
+                json.dumps(episode),
+            )
+        )
+        self._db.execute("DELETE FROM episode_tags WHERE episode_id = ?", (episode["id"],))
+        self._db.executemany(
+            "INSERT INTO episode_tags (episode_id, tag) VALUES (?, ?)",
+            [(episode["id"], tag) for tag in _split_tags(episode.get("tags"))]
+        )
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> List[Any]:
+        with self._lock:
+            rows = self._db.execute(sql, tuple(params)).fetchall()
+        episodes = [json.loads(data) for (data,) in rows]
+        if self.client.models:
+            return [Episode.from_dict(episode) for episode in episodes]
+        return episodes
+
+    @staticmethod
+    def _where(clauses: List[str]) -> str:
+        return f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    def podcasts(self) -> List[Any]:
+        """All mirrored podcasts."""
+        with self._lock:
+            rows = self._db.execute("SELECT data FROM podcasts ORDER BY id").fetchall()
+        podcasts = [json.loads(data) for (data,) in rows]
+        if self.client.models:
+            return [Podcast.from_dict(podcast) for podcast in podcasts]
+        return podcasts
+
+    def episode(self, episode_id: int) -> Optional[Any]:
+        """Look up an episode by ID."""
+        found = self._query("SELECT data FROM episodes WHERE id = ?", (episode_id,))
+        return found[0] if found else None
+
+    def episode_by_guid(self, guid: str) -> Optional[Any]:
+        """Look up an episode by its GUID."""
+        found = self._query("SELECT data FROM episodes WHERE guid = ? LIMIT 1", (guid,))
+        return found[0] if found else None
+
+    def episodes(
+        self,
+        podcast_id: Optional[int] = None,
+        private: Optional[bool] = None
+    ) -> List[Any]:
+        """Episodes, newest first, optionally filtered by podcast and privacy."""
+        clauses, params = [], []
+        if podcast_id is not None:
+            clauses.append("podcast_id = ?")
+            params.append(podcast_id)
+        if private is not None:
+            clauses.append("private = ?")
+            params.append(int(private))
+        return self._query(
+            f"SELECT data FROM episodes{self._where(clauses)} ORDER BY published_at DESC",
+            params
+        )
+
+    def episodes_by_number(
+        self,
+        podcast_id: int,
+        episode_number: Optional[int] = None,
+        season_number: Optional[int] = None
+    ) -> List[Any]:
+        """Episodes of a podcast with the given episode and/or season number."""
+        clauses, params = ["podcast_id = ?"], [podcast_id]
+        if season_number is not None:
+            clauses.append("season_number = ?")
+            params.append(season_number)
+        if episode_number is not None:
+            clauses.append("episode_number = ?")
+            params.append(episode_number)
+        return self._query(
+            f"SELECT data FROM episodes{self._where(clauses)}"
+            " ORDER BY season_number, episode_number",
+            params
+        )
+
+    def episodes_published_between(
+        self,
+        start: Union[str, datetime, None] = None,
+        end: Union[str, datetime, None] = None,
+        podcast_id: Optional[int] = None
+    ) -> List[Any]:
+        """Episodes published in ``[start, end)``, newest first.
+
+        Naive datetimes are taken to be UTC; either bound may be omitted.
+        """
+        clauses, params = ["published_at IS NOT NULL"], []
+        if start is not None:
+            clauses.append("published_at >= ?")
+            params.append(_utc(start))
+        if end is not None:
+            clauses.append("published_at < ?")
+            params.append(_utc(end))
+        if podcast_id is not None:
+            clauses.append("podcast_id = ?")
+            params.append(podcast_id)
+        return self._query(
+            f"SELECT data FROM episodes{self._where(clauses)} ORDER BY published_at DESC",
+            params
+        )
+
+    def episodes_tagged(self, tag: str, podcast_id: Optional[int] = None) -> List[Any]:
+        """Episodes carrying ``tag``, newest first."""
+        clauses, params = ["t.tag = ?"], [tag.strip()]
+        if podcast_id is not None:
+            clauses.append("e.podcast_id = ?")
+            params.append(podcast_id)
+        return self._query(
+            "SELECT e.data FROM episode_tags t JOIN episodes e ON e.id = t.episode_id"
+            f"{self._where(clauses)} ORDER BY e.published_at DESC",
+            params
+        )
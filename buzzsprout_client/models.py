@@ -0,0 +1,227 @@
+import sys
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from .streaming import parse_datetime
+
+# Form fields accepted by the create/update episode endpoints, in the order
+# they are sent.
+EPISODE_FIELDS = (
+    "title",
+    "description",
+    "summary",
+    "artist",
+    "tags",
+    "published_at",
+    "duration",
+    "guid",
+    "inactive_at",
+    "episode_number",
+    "season_number",
+    "explicit",
+    "private",
+    "email_user_after_audio_processed",
+    "audio_url",
+    "artwork_url",
+)
+
+# Episode fields that are not plain text, for converting values typed on
+# the command line or read from a manifest.
+EPISODE_INT_FIELDS = frozenset({"duration", "episode_number", "season_number"})
+EPISODE_BOOL_FIELDS = frozenset({"explicit", "private", "email_user_after_audio_processed"})
+
+_TRUE = {"1", "true", "yes", "on"}
+_FALSE = {"0", "false", "no", "off"}
+
+_UNSET = object()
+
+
+def parse_episode_field(name: str, value: str) -> Any:
+    """Convert the text ``value`` to the type of episode field ``name``.
+
+    Booleans accept 1/0, true/false, yes/no and on/off in any case.
+
+    Raises:
+        ValueError: If the value is not valid for the field
+    """
+    if name in EPISODE_INT_FIELDS:
+        try:
+            return int(value)
+        except ValueError:
+            raise ValueError(f"expected an integer, got {value!r}") from None
+    if name in EPISODE_BOOL_FIELDS:
+        lowered = value.lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+        raise ValueError(f"expected true or false, got {value!r}")
+    return value
+
+
+def as_dict(item: Any) -> Dict:
+    """Dictionary form of an API object, whether or not it is a model."""
+    return item if isinstance(item, dict) else item.to_dict()
+
+
+class Model:
+    """Compact, attribute-style view of an API object.
+
+    Known fields are stored in ``__slots__`` instead of a per-object dict.
+    String fields that repeat across objects (artist, tags, ...) are interned
+    so all objects share one copy. Timestamps are kept as the raw strings
+    from the API and only parsed into datetimes the first time they are
+    read. Unknown fields are kept aside so :meth:`to_dict` gives back
+    everything the API returned.
+    """
+
+    __slots__ = ("_extra",)
+
+    _fields: Tuple[str, ...] = ()
+    _interned: Tuple[str, ...] = ()
+    _datetimes: Tuple[str, ...] = ()
+
+    def __init__(self, **fields: Any):
+        for name in self._fields:
+            value = fields.pop(name, None)
+            if name in self._interned and isinstance(value, str):
+                value = sys.intern(value)
+            if name in self._datetimes:
+                setattr(self, f"_{name}_raw", value)
+                setattr(self, f"_{name}_parsed", _UNSET)
+            else:
+                setattr(self, name, value)
+        self._extra = fields or None
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Model":
+        return cls(**data)
+
+    def _datetime(self, name: str) -> Optional[datetime]:
+        parsed = getattr(self, f"_{name}_parsed")
+        if parsed is _UNSET:
+            raw = getattr(self, f"_{name}_raw")
+            parsed = parse_datetime(raw) if raw else None
+            setattr(self, f"_{name}_parsed", parsed)
+        return parsed
+
+    def to_dict(self) -> Dict:
+        """Return the object as the dictionary the API returned."""
+        data = {}
+        for name in self._fields:
+            if name in self._datetimes:
+                data[name] = getattr(self, f"_{name}_raw")
+            else:
+                data[name] = getattr(self, name)
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names missing from the slots: fall back to fields
+        # the model does not know about.
+        extra = object.__getattribute__(self, "_extra")
+        if extra and name in extra:
+            return extra[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={getattr(self, 'id', None)!r}, title={getattr(self, 'title', None)!r})"
+
+
+class Episode(Model):
+    """A podcast episode."""
+
+    _fields = (
+        "id",
+        "title",
+        "audio_url",
+        "artwork_url",
+        "description",
+        "summary",
+        "artist",
+        "tags",
+        "published_at",
+        "duration",
+        "hq",
+        "guid",
+        "inactive_at",
+        "episode_number",
+        "season_number",
+        "explicit",
+        "private",
+        "total_plays",
+    )
+    _interned = ("artist", "tags", "artwork_url")
+    _datetimes = ("published_at", "inactive_at")
+
+    __slots__ = (
+        "id",
+        "title",
+        "audio_url",
+        "artwork_url",
+        "description",
+        "summary",
+        "artist",
+        "tags",
+        "_published_at_raw",
+        "_published_at_parsed",
+        "duration",
+        "hq",
+        "guid",
+        "_inactive_at_raw",
+        "_inactive_at_parsed",
+        "episode_number",
+        "season_number",
+        "explicit",
+        "private",
+        "total_plays",
+    )
+
+    @property
+    def published_at(self) -> Optional[datetime]:
+        return self._datetime("published_at")
+
+    @property
+    def inactive_at(self) -> Optional[datetime]:
+        return self._datetime("inactive_at")
+
+    def to_payload(self) -> Dict:
+        """Return the fields accepted by ``create_episode``/``update_episode``.
+
+        None values are left out, so the result can be passed straight to
+        ``client.update_episode(podcast_id, episode.id, **episode.to_payload())``.
+        """
+        data = self.to_dict()
+        return {
+            name: data[name]
+            for name in EPISODE_FIELDS
+            if data.get(name) is not None
+        }
+
+
+class Podcast(Model):
+    """A podcast."""
+
+    _fields = (
+        "id",
+        "title",
+        "author",
+        "description",
+        "website_address",
+        "contact_email",
+        "artwork_url",
+        "background_color",
+        "language",
+        "explicit",
+        "private",
+        "timezone",
+    )
+    _interned = ("author", "language", "timezone", "background_color")
+
+    __slots__ = _fields
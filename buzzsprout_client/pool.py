@@ -0,0 +1,214 @@
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .client import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    BuzzsproutClient,
+    clone_session,
+)
+from .ratelimit import DEFAULT_BURST, RateGovernor
+
+DEFAULT_MAX_TENANTS = 256
+
+
+@dataclass
+class PoolStats:
+    hits: int = 0
+    created: int = 0
+    evicted: int = 0
+
+
+class TenantSession:
+    """Session-like facade sending one tenant's requests over a shared pool.
+
+    It holds only the tenant's headers. Each request merges them into the
+    request headers and goes out through the :class:`ClientPool`'s session
+    for the current thread, so tenants cost no connections of their own.
+    That session is shared by all tenants and keeps no cookies.
+    """
+
+    def __init__(self, pool: "ClientPool"):
+        self.pool = pool
+        self.headers: Dict[str, str] = {}
+
+    def request(self, method: str, url: str, headers: Optional[Dict] = None, **kwargs) -> Any:
+        merged = dict(self.headers, **headers) if headers else self.headers
+        with self.pool._slots:
+            return self.pool._thread_session().request(method, url, headers=merged, **kwargs)
+
+    def get(self, url: str, **kwargs) -> Any:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Any:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> Any:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> Any:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        # Connections belong to the pool
+        pass
+
+
+class _NoLimit:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class ClientPool:
+    """Clients for many Buzzsprout accounts sharing one connection pool.
+
+    :meth:`client` returns a :class:`BuzzsproutClient` for an API key. All
+    of them send through a single set of pooled connections; each request
+    carries its account's ``Authorization`` header, so a tenant only costs
+    the client object itself. Clients are kept in LRU order and dropped when
+    more than ``max_tenants`` are held or when unused for ``idle_timeout``
+    seconds; a dropped client keeps working for whoever still holds it, and
+    the next :meth:`client` call for its key builds a fresh one.
+
+    Clients are safe to share between threads.
+
+    Args:
+        max_tenants: Most clients kept at once
+        idle_timeout: Drop clients not requested for this many seconds
+        rate: Requests per second allowed per tenant; each client gets its
+            own :class:`RateGovernor` (which starts afresh if the client is
+            dropped and rebuilt)
+        burst: Requests a tenant may send back to back
+        max_concurrency: Most requests in flight across all tenants; further
+            requests wait for a slot. For streamed responses the slot is
+            released once the headers have arrived.
+        session: Session whose settings and adapters the pool sends
+            through, instead of creating one
+        adapter: Transport adapter mounted for http(s) URLs, replacing the
+            pooled ``HTTPAdapter`` built from the pool options
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Maximum connections kept alive per host
+        pool_block: Wait for a free connection instead of opening a
+            throwaway one when the pool is exhausted
+        clock: Returns the current time in seconds
+        **client_options: Passed to every :class:`BuzzsproutClient`, e.g.
+            ``models``, ``timeout`` or a shared ``cache``/``http_cache``
+            (cache entries are scoped by account)
+
+    Raises:
+        ValueError: If ``client_options`` include options the pool sets
+            itself (``session``, ``adapter``, ``governor``, ``thread_safe``)
+    """
+
+    def __init__(
+        self,
+        max_tenants: int = DEFAULT_MAX_TENANTS,
+        idle_timeout: Optional[float] = None,
+        rate: Optional[float] = None,
+        burst: int = DEFAULT_BURST,
+        max_concurrency: Optional[int] = None,
+        session: Optional[requests.Session] = None,
+        adapter: Optional[HTTPAdapter] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+        **client_options
+    ):
+        reserved = {"session", "adapter", "governor", "thread_safe"} & set(client_options)
+        if reserved:
+            raise ValueError(f"ClientPool manages {', '.join(sorted(reserved))} itself")
+        self.max_tenants = max_tenants
+        self.idle_timeout = idle_timeout
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.client_options = client_options
+        self.clock = clock
+        self.stats = PoolStats()
+        if session is None:
+            session = requests.Session()
+            if adapter is None:
+                adapter = HTTPAdapter(
+                    pool_connections=pool_connections,
+                    pool_maxsize=pool_maxsize,
+                    pool_block=pool_block
+                )
+        if adapter is not None:
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self._slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else _NoLimit()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # api key -> (client, last used)
+        self._clients: "OrderedDict[str, list]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, api_key: str) -> bool:
+        return api_key in self._clients
+
+    def _thread_session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = clone_session(self.session)
+            # Every tenant on this thread sends through this session, so it
+            # must not keep cookies one account's responses set.
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return session
+
+    def client(self, api_key: str) -> BuzzsproutClient:
+        """Client for the account owning ``api_key``, created if needed."""
+        now = self.clock()
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._clients.get(api_key)
+            if entry is not None:
+                entry[1] = now
+                self._clients.move_to_end(api_key)
+                self.stats.hits += 1
+                return entry[0]
+            governor = RateGovernor(rate=self.rate, burst=self.burst) if self.rate else None
+            client = BuzzsproutClient(
+                api_key, session=TenantSession(self), governor=governor, **self.client_options
+            )
+            self._clients[api_key] = [client, now]
+            self.stats.created += 1
+            while len(self._clients) > self.max_tenants:
+                self._clients.popitem(last=False)
+                self.stats.evicted += 1
+            return client
+
+    def _evict_idle(self, now: float) -> None:
+        if self.idle_timeout is None:
+            return
+        while self._clients:
+            _, last_used = next(iter(self._clients.values()))
+            if now - last_used < self.idle_timeout:
+                break
+            self._clients.popitem(last=False)
+            self.stats.evicted += 1
+
+    def evict(self, api_key: str) -> None:
+        """Drop the client for ``api_key``, e.g. after revoking the key."""
+        with self._lock:
+            if self._clients.pop(api_key, None) is not None:
+                self.stats.evicted += 1
+
+    def close(self) -> None:
+        """Drop every client and close the pooled connections."""
+        with self._lock:
+            self._clients.clear()
+        self.session.close()
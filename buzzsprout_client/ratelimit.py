@@ -0,0 +1,231 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Collection, Optional, Tuple, Type
+
+DEFAULT_RATE = 5.0
+DEFAULT_BURST = 10
+DEFAULT_MAX_RETRIES = 3
+
+# Responses that mean "slow down" rather than "this request is broken".
+THROTTLE_STATUSES = frozenset({429, 503})
+# Transient server errors worth retrying for idempotent requests.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+
+@dataclass
+class GovernorStats:
+    requests: int = 0
+    retries: int = 0
+    throttled: int = 0
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Args:
+        rate: Tokens added per second
+        burst: Maximum number of tokens held
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = rate
+
+    def block(self, seconds: float) -> None:
+        """Hand out no tokens for the next ``seconds`` seconds."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+
+class RateGovernor:
+    """Client-side rate limit with retries and adaptive throughput.
+
+    Every request first takes a token from a bucket shared by all threads
+    using the governor. Throttling responses (429/503) halve the rate down
+    to ``min_rate`` and, when the server sends ``Retry-After``, pause all
+    requests for that long; every other response raises the rate again by
+    ``rate_increase`` up to ``max_rate``. This keeps throughput close to
+    what the server allows instead of collapsing into error storms.
+
+    Failed requests are retried up to ``max_retries`` times with jittered
+    exponential backoff, or after ``Retry-After`` when given. A
+    ``Retry-After`` longer than ``max_backoff`` is not waited for: the
+    response is returned as is and nobody is paused. 429 responses
+    are retried for every method since the request was rejected before
+    being processed; 5xx responses and connection errors are only retried
+    for idempotent methods (GET and PUT).
+
+    Args:
+        rate: Initial requests per second
+        burst: Number of requests that may be sent back to back
+        min_rate: Lowest rate to adapt down to
+        max_rate: Highest rate to adapt up to, defaults to ``rate``
+        rate_increase: Requests per second added after each healthy response
+        rate_decrease: Factor applied to the rate after a throttling response
+        max_retries: Maximum number of retries per request
+        backoff_factor: Base delay in seconds, doubled after every attempt
+        max_backoff: Longest delay between attempts in seconds, also the
+            longest ``Retry-After`` that is honoured
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        min_rate: float = 0.5,
+        max_rate: Optional[float] = None,
+        rate_increase: float = 0.1,
+        rate_decrease: float = 0.5,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        retry_statuses: Collection[int] = RETRY_STATUSES,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.rate_increase = rate_increase
+        self.rate_decrease = rate_decrease
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.stats = GovernorStats()
+        self.bucket = TokenBucket(rate, burst, clock=clock, sleep=sleep)
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self.bucket.rate
+
+    def _adapt(self, status: int) -> None:
+        with self._lock:
+            if status in THROTTLE_STATUSES:
+                self.stats.throttled += 1
+                rate = max(self.min_rate, self.bucket.rate * self.rate_decrease)
+            else:
+                rate = min(self.max_rate, self.bucket.rate + self.rate_increase)
+            if rate != self.bucket.rate:
+                self.bucket.set_rate(rate)
+
+    def _should_retry(self, method: str, status: int) -> bool:
+        if status not in self.retry_statuses:
+            return False
+        return status == 429 or method.upper() in IDEMPOTENT_METHODS
+
+    def backoff(self, attempt: int) -> float:
+        """Jittered exponential delay before retry number ``attempt + 1``."""
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        return random.uniform(delay / 2, delay)
+
+    @staticmethod
+    def retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a ``Retry-After`` header into seconds."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+    def send(
+        self,
+        method: str,
+        attempt: Callable[[], Any],
+        retry_exceptions: Tuple[Type[BaseException], ...] = (),
+        before_retry: Optional[Callable[[], None]] = None
+    ) -> Any:
+        """Run ``attempt`` under the rate limit, retrying when allowed.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Sends the request once and returns the response
+            retry_exceptions: Exceptions from ``attempt`` that are retried
+                for idempotent methods
+            before_retry: Called before every retry, e.g. to rewind files
+
+        Returns:
+            The last response received
+        """
+        tries = 0
+        while True:
+            self.bucket.acquire()
+            with self._lock:
+                self.stats.requests += 1
+            try:
+                response = attempt()
+            except retry_exceptions:
+                if tries >= self.max_retries or method.upper() not in IDEMPOTENT_METHODS:
+                    raise
+                delay = self.backoff(tries)
+            else:
+                status = response.status_code
+                self._adapt(status)
+                if tries >= self.max_retries or not self._should_retry(method, status):
+                    return response
+                delay = self.retry_after(response.headers.get("Retry-After"))
+                if delay is not None and delay > self.max_backoff:
+                    # Too long to hold this call, let alone everyone else.
+                    return response
+                if delay is not None:
+                    # Everyone sharing the governor waits, not just this call.
+                    self.bucket.block(delay)
+                else:
+                    delay = self.backoff(tries)
+                response.close()
+            tries += 1
+            with self._lock:
+                self.stats.retries += 1
+            self._sleep(delay)
+            if before_retry is not None:
+                before_retry()
@@ -0,0 +1,95 @@
+import asyncio
+import copy
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+@dataclass
+class CoalesceStats:
+    # Calls that sent a request
+    requests: int = 0
+    # Calls that waited for another caller's request instead
+    coalesced: int = 0
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        # Pristine copy for the waiters, never handed out itself
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers with the same key.
+
+    The first caller for a key runs the function; callers arriving while it
+    is running wait for it and get their own deep copy of its result, taken
+    before the first caller gets it back, or the same exception. Once the call finishes the key is forgotten, so later calls
+    run again - this removes duplicate concurrent requests, it is not a
+    cache.
+    """
+
+    def __init__(self):
+        self.stats = CoalesceStats()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats.requests += 1
+            else:
+                self.stats.coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+        try:
+            result = func()
+            call.result = copy.deepcopy(result)
+            return result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """asyncio version of :class:`SingleFlight` for a single event loop.
+
+    The shared call runs as a task of its own, so cancelling any caller,
+    including the first, leaves it running for the others.
+    """
+
+    def __init__(self):
+        self.stats = CoalesceStats()
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+            return copy.deepcopy(await asyncio.shield(task))
+        self.stats.requests += 1
+        task = self._calls[key] = asyncio.ensure_future(func())
+        task.add_done_callback(lambda done: self._finish(key, done))
+        # The task's result is shared, so every caller gets a copy of it
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _finish(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark retrieved so an exception nobody waited for is not logged
+            task.exception()
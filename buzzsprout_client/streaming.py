@@ -0,0 +1,134 @@
+import codecs
+import json
+import re
+from datetime import datetime, timezone
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Iterator, List
+
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JSONArrayParser:
+    """Incremental parser for a top-level JSON array.
+
+    Feed it the response body piece by piece and it returns the array
+    elements as soon as they are complete, so only the element currently
+    being received is buffered rather than the whole document.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = "start"
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Add ``data`` and return the elements completed by it."""
+        self._buffer += self._text.decode(data)
+        return self._parse(final=False)
+
+    def close(self) -> List[Any]:
+        """Signal the end of input and return any remaining elements.
+
+        Raises:
+            ValueError: If the input is not a complete JSON array
+        """
+        self._buffer += self._text.decode(b"", final=True)
+        items = self._parse(final=True)
+        if self._state != "done":
+            raise ValueError("Incomplete JSON array")
+        return items
+
+    def _parse(self, final: bool) -> List[Any]:
+        items = []
+        buffer = self._buffer
+        pos = 0
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos >= len(buffer):
+                break
+            if self._state == "start":
+                if buffer[pos] != "[":
+                    raise ValueError("Expected a JSON array")
+                pos += 1
+                self._state = "first"
+            elif self._state in ("first", "value"):
+                if self._state == "first" and buffer[pos] == "]":
+                    pos += 1
+                    self._state = "done"
+                    continue
+                try:
+                    item, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                # A number at the end of the buffer may still be growing, so
+                # only accept an element once something follows it.
+                if not final and _WHITESPACE.match(buffer, end).end() >= len(buffer):
+                    break
+                items.append(item)
+                pos = end
+                self._state = "separator"
+            elif self._state == "separator":
+                if buffer[pos] == ",":
+                    self._state = "value"
+                elif buffer[pos] == "]":
+                    self._state = "done"
+                else:
+                    raise ValueError(f"Unexpected {buffer[pos]!r} in JSON array")
+                pos += 1
+            else:
+                raise ValueError("Unexpected data after JSON array")
+        self._buffer = buffer[pos:]
+        return items
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Yield the elements of a JSON array delivered as byte chunks."""
+    parser = JSONArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Async version of :func:`iter_json_array`."""
+    parser = JSONArrayParser()
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
+
+
+def parse_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp as returned by the API."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def published_before(cutoff: datetime) -> Callable[[Dict], bool]:
+    """Build a ``stop_when`` predicate for :meth:`iter_episodes`.
+
+    The predicate is true for episodes published before ``cutoff``. Naive
+    datetimes are taken to be UTC.
+
+    Args:
+        cutoff: Oldest publish date of interest
+    """
+    if cutoff.tzinfo is None:
+        cutoff = cutoff.replace(tzinfo=timezone.utc)
+
+    def predicate(episode: Dict) -> bool:
+        published_at = episode.get("published_at")
+        if not published_at:
+            return False
+        published = parse_datetime(published_at)
+        if published.tzinfo is None:
+            published = published.replace(tzinfo=timezone.utc)
+        return published < cutoff
+
+    return predicate
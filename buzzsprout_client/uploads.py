@@ -0,0 +1,151 @@
+import asyncio
+import mimetypes
+import os
+import uuid
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+ProgressCallback = Callable[[int, int], None]
+
+# Percent-encode the characters that would end a quoted header parameter or
+# the header itself, as browsers (and urllib3) do for multipart names.
+_PARAM_ESCAPES = {ord('"'): "%22", ord("\r"): "%0D", ord("\n"): "%0A"}
+
+
+def _quote_param(value: str) -> str:
+    return value.translate(_PARAM_ESCAPES)
+
+
+class MultipartEncoder:
+    """Streaming ``multipart/form-data`` body.
+
+    The body is produced incrementally: form fields are encoded up front
+    (they are small) while file parts are read from disk ``chunk_size``
+    bytes at a time, so memory use is bounded by the chunk size no matter
+    how large the files are. Files are opened only while their part is
+    being sent and are always closed, even if the upload is aborted. When
+    iterated asynchronously the disk reads run in the default executor, so
+    they do not block the event loop.
+
+    The total length is known before sending, so the body goes out with a
+    regular ``Content-Length`` instead of chunked transfer encoding. The
+    encoder can be iterated more than once, which lets a failed request be
+    retried.
+
+    Args:
+        fields: Form fields; None values are skipped like ``requests`` does
+        files: Mapping of form field name to the path of the file to send
+        chunk_size: Number of bytes read from disk per chunk
+        progress: Called as ``progress(bytes_sent, total_bytes)`` once
+            each chunk has been handed to the transport
+        boundary: Multipart boundary, generated when not given
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, Any],
+        files: Dict[str, str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+        boundary: Optional[str] = None
+    ):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self._parts = self._build_parts(fields, files)
+        self._trailer = f"--{self.boundary}--\r\n".encode()
+        self.len = sum(
+            len(head) + (os.path.getsize(path) if path else 0) + 2
+            for head, path in self._parts
+        ) + len(self._trailer)
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Headers to send along with the body."""
+        return {
+            "Content-Type": self.content_type,
+            "Content-Length": str(self.len)
+        }
+
+    def __len__(self) -> int:
+        return self.len
+
+    def _build_parts(
+        self,
+        fields: Dict[str, Any],
+        files: Dict[str, str]
+    ) -> List[Tuple[bytes, Optional[str]]]:
+        parts = []
+        for name, value in fields.items():
+            if value is None:
+                continue
+            if not isinstance(value, bytes):
+                value = str(value).encode()
+            head = (
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{_quote_param(name)}"\r\n\r\n'
+            ).encode()
+            parts.append((head + value, None))
+        for name, path in files.items():
+            filename = os.path.basename(path)
+            content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            head = (
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{_quote_param(name)}"; '
+                f'filename="{_quote_param(filename)}"\r\n'
+                f"Content-Type: {content_type}\r\n\r\n"
+            ).encode()
+            parts.append((head, path))
+        return parts
+
+    def _chunks(self) -> Iterator[bytes]:
+        for head, path in self._parts:
+            yield head
+            if path:
+                with open(path, "rb") as f:
+                    while True:
+                        chunk = f.read(self.chunk_size)
+                        if not chunk:
+                            break
+                        yield chunk
+            yield b"\r\n"
+        yield self._trailer
+
+    async def _achunks(self) -> AsyncIterator[bytes]:
+        # Same as _chunks, with the disk reads off the event loop
+        loop = asyncio.get_running_loop()
+        for head, path in self._parts:
+            yield head
+            if path:
+                with open(path, "rb") as f:
+                    while True:
+                        chunk = await loop.run_in_executor(None, f.read, self.chunk_size)
+                        if not chunk:
+                            break
+                        yield chunk
+            yield b"\r\n"
+        yield self._trailer
+
+    def __iter__(self) -> Iterator[bytes]:
+        sent = 0
+        for chunk in self._chunks():
+            yield chunk
+            # Resumed once the transport has taken the chunk
+            sent += len(chunk)
+            if self.progress is not None:
+                self.progress(sent, self.len)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        sent = 0
+        async for chunk in self._achunks():
+            yield chunk
+            sent += len(chunk)
+            if self.progress is not None:
+                self.progress(sent, self.len)
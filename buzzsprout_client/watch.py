@@ -0,0 +1,266 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .mirror import fingerprint
+from .models import as_dict
+
+CREATED = "created"
+UPDATED = "updated"
+DELETED = "deleted"
+
+DEFAULT_MIN_INTERVAL = 30.0
+DEFAULT_MAX_INTERVAL = 900.0
+DEFAULT_BACKOFF = 2.0
+# Play counts move constantly and would turn every poll into updates.
+DEFAULT_IGNORE_FIELDS = ("total_plays",)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS podcasts (
+    podcast_id INTEGER PRIMARY KEY,
+    interval REAL NOT NULL,
+    next_poll REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS episodes (
+    podcast_id INTEGER NOT NULL,
+    episode_id INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (podcast_id, episode_id)
+);
+"""
+
+
+@dataclass
+class EpisodeEvent:
+    """A change to one episode seen by :class:`EpisodeWatcher`.
+
+    Attributes:
+        kind: ``"created"``, ``"updated"`` or ``"deleted"``
+        podcast_id: ID of the podcast the episode belongs to
+        episode_id: ID of the episode
+        changes: New values of the fields that changed; every field for
+            created episodes and none for deleted ones. Fields that
+            disappeared are None.
+        previous: Values the changed fields had before; every field for
+            deleted episodes and none for created ones
+    """
+
+    kind: str
+    podcast_id: int
+    episode_id: int
+    changes: Dict[str, Any] = field(default_factory=dict)
+    previous: Dict[str, Any] = field(default_factory=dict)
+
+
+def diff_episode(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields of ``new`` whose value differs from ``old``."""
+    return {
+        name: new.get(name)
+        for name in set(old) | set(new)
+        if old.get(name) != new.get(name)
+    }
+
+
+class EpisodeWatcher:
+    """Poll podcasts for new, changed and removed episodes.
+
+    Each poll downloads a podcast's episode list, fingerprints every
+    episode and compares it with the state stored by the previous poll;
+    only episodes whose fingerprint changed are diffed field by field. The
+    state lives in SQLite, so a restarted watcher picks up where it left
+    off instead of reporting the whole catalog again.
+
+    Every podcast has its own polling interval. It starts at
+    ``min_interval``, is multiplied by ``backoff`` after every poll that
+    finds nothing new, up to ``max_interval``, and drops back to
+    ``min_interval`` as soon as something changes. Podcasts that rarely
+    change are therefore polled rarely, while bursts of activity (an upload
+    followed by processing updates) are followed closely.
+
+    Give the watcher a client with an :class:`HTTPCache` to turn unchanged
+    lists into 304 responses; an in-memory cache would hide changes until
+    its entries expire.
+
+    Args:
+        client: Client used to download episodes
+        path: Path of the SQLite state database, created if missing
+        podcast_ids: Podcasts to watch
+        min_interval: Shortest time between polls of a podcast, in seconds
+        max_interval: Longest time between polls of a podcast, in seconds
+        backoff: Factor the interval grows by after a quiet poll
+        ignore_fields: Episode fields whose changes are not reported
+        emit_existing: Report the episodes of a podcast seen for the first
+            time as created; by default they become the silent baseline
+        clock: Returns the current time in seconds since the epoch
+    """
+
+    def __init__(
+        self,
+        client,
+        path: str,
+        podcast_ids: Iterable[int],
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        backoff: float = DEFAULT_BACKOFF,
+        ignore_fields: Iterable[str] = DEFAULT_IGNORE_FIELDS,
+        emit_existing: bool = False,
+        clock: Callable[[], float] = time.time
+    ):
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval")
+        self.client = client
+        self.path = os.path.expanduser(path)
+        self.podcast_ids = list(dict.fromkeys(podcast_ids))
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.ignore_fields = frozenset(ignore_fields)
+        self.emit_existing = emit_existing
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def interval(self, podcast_id: int) -> float:
+        """Current polling interval of a podcast in seconds."""
+        return self._schedule(podcast_id)[0]
+
+    def next_poll(self, podcast_id: int) -> float:
+        """Time (seconds since the epoch) a podcast is next due for a poll."""
+        return self._schedule(podcast_id)[1]
+
+    def _schedule(self, podcast_id: int) -> Tuple[float, float]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT interval, next_poll FROM podcasts WHERE podcast_id = ?", (podcast_id,)
+            ).fetchone()
+        # Podcasts never polled are due immediately.
+        return row if row else (self.min_interval, 0.0)
+
+    def poll(self, podcast_id: int) -> List[EpisodeEvent]:
+        """Poll one podcast now and return what changed since the last poll.
+
+        The new state and schedule are committed before returning, so the
+        events are reported once.
+
+        Raises:
+            requests.HTTPError: If the episode list cannot be retrieved
+        """
+        episodes = [as_dict(episode) for episode in self.client.get_episodes(podcast_id)]
+        now = self.clock()
+        with self._lock:
+            first_poll = self._db.execute(
+                "SELECT 1 FROM podcasts WHERE podcast_id = ?", (podcast_id,)
+            ).fetchone() is None
+            known = dict(self._db.execute(
+                "SELECT episode_id, fingerprint FROM episodes WHERE podcast_id = ?", (podcast_id,)
+            ))
+            events = []
+            upserts = []
+            seen = set()
+            for episode in episodes:
+                if self.ignore_fields:
+                    episode = {k: v for k, v in episode.items() if k not in self.ignore_fields}
+                episode_id = episode["id"]
+                seen.add(episode_id)
+                digest = fingerprint(episode)
+                stored = known.get(episode_id)
+                if stored == digest:
+                    continue
+                upserts.append((podcast_id, episode_id, digest, json.dumps(episode)))
+                if stored is None:
+                    if not first_poll or self.emit_existing:
+                        events.append(EpisodeEvent(CREATED, podcast_id, episode_id, dict(episode)))
+                    continue
+                (data,) = self._db.execute(
+                    "SELECT data FROM episodes WHERE podcast_id = ? AND episode_id = ?",
+                    (podcast_id, episode_id)
+                ).fetchone()
+                old = json.loads(data)
+                changes = diff_episode(old, episode)
+                events.append(EpisodeEvent(
+                    UPDATED, podcast_id, episode_id, changes, {name: old.get(name) for name in changes}
+                ))
+            for episode_id in set(known) - seen:
+                (data,) = self._db.execute(
+                    "SELECT data FROM episodes WHERE podcast_id = ? AND episode_id = ?",
+                    (podcast_id, episode_id)
+                ).fetchone()
+                events.append(EpisodeEvent(DELETED, podcast_id, episode_id, {}, json.loads(data)))
+
+            interval, _ = self._db.execute(
+                "SELECT interval, next_poll FROM podcasts WHERE podcast_id = ?", (podcast_id,)
+            ).fetchone() or (self.min_interval, 0.0)
+            if events or first_poll:
+                interval = self.min_interval
+            else:
+                interval = min(interval * self.backoff, self.max_interval)
+
+            self._db.executemany(
+                "INSERT OR REPLACE INTO episodes (podcast_id, episode_id, fingerprint, data)"
+                " VALUES (?, ?, ?, ?)",
+                upserts
+            )
+            self._db.executemany(
+                "DELETE FROM episodes WHERE podcast_id = ? AND episode_id = ?",
+                [(podcast_id, event.episode_id) for event in events if event.kind == DELETED]
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO podcasts (podcast_id, interval, next_poll) VALUES (?, ?, ?)",
+                (podcast_id, interval, now + interval)
+            )
+            self._db.commit()
+        return events
+
+    def poll_due(self) -> List[EpisodeEvent]:
+        """Poll every watched podcast whose next poll is due."""
+        now = self.clock()
+        events = []
+        for podcast_id in self.podcast_ids:
+            if self.next_poll(podcast_id) <= now:
+                events.extend(self.poll(podcast_id))
+        return events
+
+    def watch(
+        self,
+        stop: Optional[threading.Event] = None,
+        sleep: Optional[Callable[[float], Any]] = None
+    ) -> Iterator[EpisodeEvent]:
+        """Poll podcasts as they become due and yield their events, forever.
+
+        Args:
+            stop: Set this event to end the iteration; it also interrupts
+                the wait between polls
+            sleep: Waits the given number of seconds, defaults to waiting
+                on ``stop``
+
+        Yields:
+            EpisodeEvent for every change, in the order they were found
+
+        Raises:
+            requests.HTTPError: If an episode list cannot be retrieved;
+                use a client with a :class:`RateGovernor` to retry
+                transient failures first
+        """
+        stop = stop or threading.Event()
+        sleep = sleep or stop.wait
+        while not stop.is_set():
+            for podcast_id in self.podcast_ids:
+                if self.next_poll(podcast_id) <= self.clock():
+                    yield from self.poll(podcast_id)
+                if stop.is_set():
+                    return
+            if not self.podcast_ids:
+                return
+            wait = min(self.next_poll(podcast_id) for podcast_id in self.podcast_ids) - self.clock()
+            if wait > 0:
+                sleep(wait)
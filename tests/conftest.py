@@ -0,0 +1,25 @@
+import json
+from unittest.mock import Mock, patch
+
+import requests
+
+from buzzsprout_client import BuzzsproutClient
+
+
+def make_response(body=None, status_code=200, headers=None):
+    """Mock ``requests.Response`` carrying ``body`` as JSON."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = dict(headers or {})
+    response.content = json.dumps(body).encode() if body is not None else b""
+    response.request.headers = {}
+    response.json.return_value = body
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(f"{status_code} Error")
+    return response
+
+
+def make_client(session, **kwargs):
+    """:class:`BuzzsproutClient` sending through the mock ``session``."""
+    with patch('buzzsprout_client.client.requests.Session', return_value=session):
+        return BuzzsproutClient(api_key="test_key", **kwargs)
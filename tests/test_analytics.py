@@ -0,0 +1,97 @@
+import io
+import csv
+
+import pytest
+
+from buzzsprout_client.analytics import EpisodeColumns, np, write_episodes_csv
+
+BACKENDS = [False, pytest.param(True, marks=pytest.mark.skipif(np is None, reason="NumPy not installed"))]
+
+
+def catalog():
+    return {
+        1: [
+            {"id": 10, "title": "A", "total_plays": 100, "duration": 600, "season_number": 1,
+             "episode_number": 1, "published_at": "2024-01-01T00:00:00Z"},
+            {"id": 11, "title": "B", "total_plays": 300, "duration": 1800, "season_number": 1,
+             "episode_number": 2, "published_at": "2024-01-08T00:00:00Z"},
+            {"id": 12, "title": "C", "total_plays": 50, "duration": None, "season_number": 2,
+             "episode_number": 1, "published_at": "2024-01-22T00:00:00+00:00"},
+        ],
+        2: [
+            {"id": 20, "title": "D", "total_plays": 300, "duration": 3600, "season_number": None,
+             "episode_number": None, "published_at": None},
+            {"id": 21, "title": "E", "total_plays": None, "duration": 7200},
+        ],
+    }
+
+
+@pytest.fixture(params=BACKENDS)
+def columns(request):
+    return EpisodeColumns.from_podcasts(catalog(), use_numpy=request.param)
+
+
+def test_plays_aggregations(columns):
+    assert len(columns) == 5
+    assert columns.plays_by_podcast() == {1: 450, 2: 300}
+    assert columns.plays_by_season() == {1: {1: 400, 2: 50}, 2: {-1: 300}}
+
+
+def test_duration_stats_and_histogram(columns):
+    stats = columns.duration_stats()
+    assert stats == {"count": 4, "total": 13200, "mean": 3300, "min": 600,
+                     "median": 1800, "p90": 7200, "max": 7200}
+    assert columns.duration_stats(podcast_id=1)["count"] == 2
+    assert columns.duration_stats(podcast_id=3)["count"] == 0
+    assert columns.duration_histogram(bounds=(600, 3600)) == {"<=600": 1, "<=3600": 2, ">3600": 1}
+
+
+def test_cadence(columns):
+    cadence = columns.cadence()
+
+    assert cadence[1]["episodes"] == 3
+    assert cadence[1]["mean_interval_days"] == 10.5
+    assert cadence[1]["median_interval_days"] == 7
+    assert cadence[2] == {"episodes": 0, "first": None, "last": None,
+                          "mean_interval_days": None, "median_interval_days": None}
+
+
+def test_top(columns):
+    assert [(e["id"], e["total_plays"]) for e in columns.top(3)] == [(11, 300), (20, 300), (10, 100)]
+    assert [e["title"] for e in columns.top(1, by="duration", podcast_id=1)] == ["B"]
+    assert columns.top(0) == []
+    with pytest.raises(ValueError):
+        columns.top(by="title")
+
+
+def test_csv_export_matches_streaming_writer(columns):
+    out = io.StringIO()
+    assert columns.to_csv(out) == 5
+
+    streamed = io.StringIO()
+    write_episodes_csv(streamed, iter(catalog()[1]), podcast_id=1)
+    write_episodes_csv(streamed, iter(catalog()[2]), podcast_id=2)
+
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows[0][:3] == ["podcast_id", "id", "title"]
+    assert rows[1][:5] == ["1", "10", "A", "1704067200.0", "600"]
+    assert rows[4] == ["2", "20", "D", "", "3600", "300", "", ""]
+    assert streamed.getvalue().replace("podcast_id,id,title,published_at,duration,total_plays,"
+                                       "season_number,episode_number\r\n", "") == \
+        out.getvalue().split("\r\n", 1)[1]
+
+
+def test_save_and_load(columns, tmp_path):
+    columns.save(str(tmp_path / "catalog"))
+
+    loaded = EpisodeColumns.load(str(tmp_path / "catalog"), use_numpy=columns.use_numpy)
+
+    assert list(loaded.iter_rows()) == list(columns.iter_rows())
+    assert loaded.plays_by_season() == columns.plays_by_season()
+
+
+def test_numpy_required_when_forced():
+    if np is not None:
+        pytest.skip("NumPy is installed")
+    with pytest.raises(ImportError):
+        EpisodeColumns(use_numpy=True)
@@ -0,0 +1,206 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from buzzsprout_client import AsyncBuzzsproutClient
+
+
+def make_client(handler):
+    client = AsyncBuzzsproutClient(api_key="test_key")
+    client.session = httpx.AsyncClient(
+        headers=client.session.headers,
+        transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_get_episodes():
+    podcast_id = 12345
+    episodes = [{"id": 788881, "title": "Test Episode"}]
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json=episodes)
+
+    async def main():
+        async with make_client(handler) as client:
+            return await client.get_episodes(podcast_id)
+
+    assert run(main()) == episodes
+    assert str(seen[0].url) == f"https://www.buzzsprout.com/api/{podcast_id}/episodes.json"
+    assert seen[0].headers["Authorization"] == "Token token=test_key"
+
+
+def test_get_episode_not_found():
+    async def main():
+        async with make_client(lambda request: httpx.Response(404)) as client:
+            return await client.get_episode(12345, 999999)
+
+    assert run(main()) is None
+
+
+def test_get_podcasts_error_raises():
+    async def main():
+        async with make_client(lambda request: httpx.Response(500)) as client:
+            await client.get_podcasts()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        run(main())
+
+
+def test_concurrent_requests():
+    def handler(request):
+        podcast_id = int(request.url.path.rsplit("/", 1)[1].split(".")[0])
+        return httpx.Response(200, json={"id": podcast_id})
+
+    async def main():
+        async with make_client(handler) as client:
+            return await asyncio.gather(
+                *(client.get_podcast(podcast_id) for podcast_id in range(50))
+            )
+
+    results = run(main())
+    assert [podcast["id"] for podcast in results] == list(range(50))
+
+
+def test_create_episode_with_files(tmp_path):
+    audio_file = tmp_path / "audio.mp3"
+    audio_file.write_text("test audio")
+    seen = []
+
+    def handler(request):
+        seen.append(request.read())
+        return httpx.Response(201, json={"id": 1, "title": "New"})
+
+    async def main():
+        async with make_client(handler) as client:
+            return await client.create_episode(
+                podcast_id=12345,
+                title="New",
+                audio_file=str(audio_file)
+            )
+
+    assert run(main()) == {"id": 1, "title": "New"}
+    assert b"test audio" in seen[0]
+    assert b'name="title"' in seen[0]
+    assert b'name="published_at"' not in seen[0]
+
+
+def test_update_episode_sends_only_given_fields():
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={"id": 1, "title": "Updated"})
+
+    async def main():
+        async with make_client(handler) as client:
+            return await client.update_episode(12345, 1, title="Updated")
+
+    assert run(main())["title"] == "Updated"
+    assert seen[0].method == "PUT"
+    assert seen[0].content == b"title=Updated"
+
+
+def test_form_body_matches_sync_client():
+    import requests
+    from requests.adapters import BaseAdapter
+
+    from buzzsprout_client import BuzzsproutClient
+
+    fields = dict(title="Episode", audio_url="https://example.com/a.mp3", episode_number=3,
+                  explicit=False, private=True, email_user_after_audio_processed=True)
+    sync_bodies, async_bodies = [], []
+
+    class CapturingAdapter(BaseAdapter):
+        def send(self, request, **kwargs):
+            sync_bodies.append(request.body)
+            response = requests.Response()
+            response.status_code = 200
+            response._content = b'{"id": 1}'
+            return response
+
+        def close(self):
+            pass
+
+    BuzzsproutClient(api_key="test_key", adapter=CapturingAdapter()).create_episode(12345, **fields)
+
+    def handler(request):
+        async_bodies.append(request.content.decode())
+        return httpx.Response(200, json={"id": 1})
+
+    async def main():
+        async with make_client(handler) as client:
+            await client.create_episode(12345, **fields)
+
+    run(main())
+    assert async_bodies == sync_bodies
+    assert "explicit=false" in sync_bodies[0] and "private=true" in sync_bodies[0]
+
+
+def test_create_episode_missing_audio():
+    async def main():
+        async with make_client(lambda request: httpx.Response(200, json={})) as client:
+            await client.create_episode(podcast_id=12345, title="No audio")
+
+    with pytest.raises(ValueError):
+        run(main())
+
+
+def test_hooks_receive_events():
+    events = []
+
+    async def main():
+        async with make_client(lambda request: httpx.Response(200, json={"id": 1})) as client:
+            client.add_hook(events.append)
+            await client.get_episode(12345, 1)
+
+    run(main())
+    assert [(e.method, e.endpoint, e.status) for e in events] == [
+        ("GET", "/{podcast_id}/episodes/{episode_id}.json", 200)
+    ]
+    assert events[0].response_bytes == len(b'{"id":1}')
+
+
+def test_iter_episodes_emits_event():
+    events = []
+
+    async def main():
+        handler = lambda request: httpx.Response(200, json=[{"id": 1}, {"id": 2}])
+        async with make_client(handler) as client:
+            client.add_hook(events.append)
+            return [episode async for episode in client.iter_episodes(12345)]
+
+    assert run(main()) == [{"id": 1}, {"id": 2}]
+    assert [(e.method, e.endpoint, e.status) for e in events] == [
+        ("GET", "/{podcast_id}/episodes.json", 200)
+    ]
+
+
+def test_timeouts(tmp_path):
+    audio = tmp_path / "audio.mp3"
+    audio.write_bytes(b"test audio")
+    seen = []
+
+    def handler(request):
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(200, json={"id": 1})
+
+    async def main():
+        async with make_client(handler) as client:
+            await client.get_podcasts()
+            client.timeout, client.upload_timeout = (3, 30), 900
+            await client.get_podcasts()
+            await client.create_episode(12345, title="New", audio_file=str(audio))
+
+    run(main())
+    assert seen[0] == {"connect": None, "read": None, "write": None, "pool": None}
+    assert seen[1] == {"connect": 3, "read": 30, "write": 30, "pool": 30}
+    assert seen[2] == {"connect": 900, "read": 900, "write": 900, "pool": 900}
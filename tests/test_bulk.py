@@ -0,0 +1,231 @@
+import json
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from buzzsprout_client import BuzzsproutClient, MemoryCache
+from buzzsprout_client.bulk import run_batch
+
+from .conftest import make_response
+
+
+def podcast_id_from(url):
+    return int(url.split("/")[-2])
+
+
+def episodes_response(url, **kwargs):
+    podcast_id = podcast_id_from(url)
+    return make_response([{"id": podcast_id * 10}], 500 if podcast_id == 13 else 200)
+
+
+def test_run_batch_keeps_order_and_errors():
+    def func(key):
+        time.sleep(0.01 * (5 - key))
+        if key == 3:
+            raise ValueError(key)
+        return key * 2
+
+    batch = run_batch(func, [1, 2, 3, 4], max_workers=4)
+
+    assert list(batch.results) == [1, 2, 4]
+    assert batch.results[4] == 8
+    assert isinstance(batch.errors[3], ValueError)
+    assert not batch.ok
+
+
+def test_run_batch_bounds_concurrency():
+    lock = threading.Lock()
+    active = [0]
+    peak = [0]
+
+    def func(key):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+
+    run_batch(func, range(20), max_workers=3)
+
+    assert peak[0] <= 3
+
+
+def test_get_episodes_many():
+    mock_session = Mock()
+    mock_session.get.side_effect = episodes_response
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key")
+        batch = client.get_episodes_many([1, 13, 2], max_workers=2, timeout=5)
+
+    assert batch.results == {1: [{"id": 10}], 2: [{"id": 20}]}
+    assert isinstance(batch.errors[13], requests.HTTPError)
+    for call in mock_session.get.call_args_list:
+        assert call.kwargs == {"timeout": 5}
+
+
+def test_get_all_episodes():
+    mock_session = Mock()
+    podcasts = Mock()
+    podcasts.json.return_value = [{"id": 1}, {"id": 2}]
+
+    def get(url, **kwargs):
+        if url.endswith("/podcasts.json"):
+            return podcasts
+        return episodes_response(url)
+
+    mock_session.get.side_effect = get
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        batch = BuzzsproutClient(api_key="test_key").get_all_episodes()
+
+    assert batch.ok
+    assert batch.results == {1: [{"id": 10}], 2: [{"id": 20}]}
+
+
+EPISODES = [
+    {"id": 1, "title": "One", "season_number": 2, "tags": "news"},
+    {"id": 2, "title": "Two", "season_number": 1, "tags": "news"},
+    {"id": 3, "title": "Three", "season_number": 2, "tags": ""},
+]
+
+
+def make_update_session(fail_id=None):
+    mock_session = Mock()
+    mock_session.get.return_value.json.return_value = EPISODES
+
+    def put(url, data=None, files=None):
+        episode_id = int(url.split("/")[-1].split(".")[0])
+        response = Mock()
+        if episode_id == fail_id:
+            response.raise_for_status.side_effect = requests.HTTPError("422")
+        response.json.return_value = dict(data, id=episode_id)
+        return response
+
+    mock_session.put.side_effect = put
+    return mock_session
+
+
+def test_bulk_update_skips_no_op_puts():
+    mock_session = make_update_session()
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key")
+        report = client.bulk_update_episodes(12345, {
+            1: {"season_number": 2, "tags": "news"},
+            2: {"season_number": "2", "title": "Two"},
+            3: {"tags": "weekly"},
+        })
+
+    assert report.skipped == [1]
+    assert report.updated == {2: {"season_number": "2"}, 3: {"tags": "weekly"}}
+    assert not report.failed
+    sent = {call.args[0]: call.kwargs["data"] for call in mock_session.put.call_args_list}
+    assert sent == {
+        "https://www.buzzsprout.com/api/12345/episodes/2.json": {"season_number": "2"},
+        "https://www.buzzsprout.com/api/12345/episodes/3.json": {"tags": "weekly"},
+    }
+    assert mock_session.get.call_count == 1
+
+
+def test_bulk_update_with_function_and_failures():
+    mock_session = make_update_session(fail_id=2)
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key")
+        report = client.bulk_update_episodes(12345, lambda episode: {"season_number": 2})
+
+    assert report.skipped == [1, 3]
+    assert report.updated == {}
+    assert isinstance(report.failed[2], requests.HTTPError)
+
+
+def test_bulk_update_dry_run_and_missing_episode():
+    mock_session = make_update_session()
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key")
+        report = client.bulk_update_episodes(
+            12345, {3: {"title": "Third"}, 99: {"title": "Nope"}}, dry_run=True
+        )
+
+    assert report.dry_run
+    assert report.updated == {3: {"title": "Third"}}
+    assert isinstance(report.failed[99], LookupError)
+    mock_session.put.assert_not_called()
+
+
+def test_bulk_update_rejects_unknown_fields():
+    mock_session = make_update_session()
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key")
+        with pytest.raises(ValueError):
+            client.bulk_update_episodes(12345, {1: {"audio_file": "a.mp3"}})
+
+
+def test_bulk_update_ignores_stale_memory_cache():
+    mock_session = make_update_session()
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key", cache=MemoryCache())
+        client.get_episodes(12345)
+        # Changed on the server after it was cached
+        mock_session.get.return_value.json.return_value = [
+            dict(EPISODES[0], season_number=1), *EPISODES[1:]
+        ]
+        report = client.bulk_update_episodes(12345, {1: {"season_number": 2}})
+
+    assert report.skipped == []
+    assert report.updated == {1: {"season_number": 2}}
+    assert mock_session.get.call_count == 2
+
+
+class JSONAdapter(BaseAdapter):
+    """Answers GETs with EPISODES and PUTs with the id from the URL."""
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.sent.append(request.method)
+        response = requests.Response()
+        response.status_code = 200
+        if request.method == "GET":
+            response._content = json.dumps(EPISODES).encode()
+        else:
+            episode_id = int(request.url.split("/")[-1].split(".")[0])
+            response._content = f'{{"id": {episode_id}}}'.encode()
+        return response
+
+    def close(self):
+        pass
+
+
+def test_batch_workers_do_not_share_the_session():
+    adapter = JSONAdapter()
+    client = BuzzsproutClient(api_key="test_key", adapter=adapter)
+    # Only the calling thread may use the client's own session
+    caller = threading.get_ident()
+    request = client.session.request
+
+    def guarded(*args, **kwargs):
+        assert threading.get_ident() == caller
+        return request(*args, **kwargs)
+
+    client.session.request = guarded
+
+    batch = client.get_episodes_many([1, 2, 3], max_workers=3)
+    report = client.bulk_update_episodes(12345, {1: {"title": "New"}, 2: {"title": "Newer"}})
+
+    assert batch.ok and sorted(report.updated) == [1, 2] and not report.failed
+    assert adapter.sent.count("PUT") == 2
+    assert client._thread_session() is client.session
@@ -0,0 +1,110 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from buzzsprout_client import BuzzsproutClient, HTTPCache
+from buzzsprout_client.cache import CacheEntry
+
+from .conftest import make_response
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "cache.sqlite")
+
+
+def test_revalidates_and_serves_stored_body(cache_path):
+    episodes = [{"id": 1, "title": "Episode"}]
+    mock_session = Mock()
+    mock_session.get.side_effect = [
+        make_response(episodes, headers={"ETag": '"abc"', "Last-Modified": "Wed, 01 May 2024 00:00:00 GMT"}),
+        make_response(status_code=304),
+    ]
+    cache = HTTPCache(cache_path)
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key", http_cache=cache)
+        assert client.get_episodes(12345) == episodes
+        assert client.get_episodes(12345) == episodes
+
+    url = "https://www.buzzsprout.com/api/12345/episodes.json"
+    assert mock_session.get.call_args_list[0].args == (url,)
+    assert mock_session.get.call_args_list[1].kwargs["headers"] == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 01 May 2024 00:00:00 GMT",
+    }
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.revalidations == 1
+
+
+def test_changed_response_replaces_entry(cache_path):
+    mock_session = Mock()
+    mock_session.get.side_effect = [
+        make_response({"id": 1, "title": "Old"}, headers={"ETag": '"v1"'}),
+        make_response({"id": 1, "title": "New"}, headers={"ETag": '"v2"'}),
+        make_response(status_code=304),
+    ]
+    cache = HTTPCache(cache_path)
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key", http_cache=cache)
+        client.get_podcast(12345)
+        assert client.get_podcast(12345)["title"] == "New"
+        assert client.get_podcast(12345)["title"] == "New"
+
+    assert mock_session.get.call_args_list[2].kwargs["headers"] == {"If-None-Match": '"v2"'}
+    assert cache.stats.misses == 2
+
+
+def test_responses_without_validators_are_not_stored(cache_path):
+    mock_session = Mock()
+    mock_session.get.return_value = make_response([{"id": 1}])
+    cache = HTTPCache(cache_path)
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key", http_cache=cache)
+        client.get_podcasts()
+
+    assert len(cache) == 0
+
+
+def test_not_found_returns_none(cache_path):
+    mock_session = Mock()
+    mock_session.get.return_value = make_response(status_code=404)
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key", http_cache=HTTPCache(cache_path))
+        assert client.get_episode(12345, 1) is None
+
+
+def test_survives_restart(cache_path):
+    cache = HTTPCache(cache_path)
+    cache.set("key", CacheEntry(b"[1]", etag='"abc"'))
+    cache.close()
+
+    entry = HTTPCache(cache_path).get("key")
+
+    assert entry == CacheEntry(b"[1]", etag='"abc"')
+
+
+def test_lru_eviction(cache_path):
+    cache = HTTPCache(cache_path, max_size=10)
+    cache.set("a", CacheEntry(b"aaaa"))
+    cache.set("b", CacheEntry(b"bbbb"))
+    cache.get("a")
+    cache.set("c", CacheEntry(b"cccc"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.size() == 8
+
+
+def test_entries_are_scoped_to_api_key(cache_path):
+    cache = HTTPCache(cache_path)
+    first = BuzzsproutClient(api_key="first", http_cache=cache)
+    second = BuzzsproutClient(api_key="second", http_cache=cache)
+    url = first._podcasts_url()
+
+    assert first._cache_key(url) != second._cache_key(url)
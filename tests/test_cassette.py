@@ -0,0 +1,107 @@
+import json
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from buzzsprout_client import BuzzsproutClient, Cassette, RecordingSession, ReplaySession
+
+
+class StubAdapter(BaseAdapter):
+    """Answers every request with the next of ``responses``."""
+
+    def __init__(self, *responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        status, body, headers = self.responses.pop(0)
+        response = requests.Response()
+        response.status_code = status
+        response.reason = "OK" if status < 400 else "Error"
+        response.headers.update(headers)
+        response._content = body
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+EPISODES_URL = "https://www.buzzsprout.com/api/12345/episodes.json"
+
+
+def record(path, *responses):
+    cassette = Cassette(path)
+    session = RecordingSession(cassette)
+    adapter = StubAdapter(*responses)
+    client = BuzzsproutClient(api_key="test_key", session=session, adapter=adapter)
+    return client, cassette, adapter
+
+
+def test_record_then_replay(tmp_path):
+    path = str(tmp_path / "api.json.gz")
+    episodes = [{"id": 1, "title": "Episode"}]
+    client, cassette, adapter = record(
+        path,
+        (200, json.dumps(episodes).encode(), {"ETag": '"v1"', "Content-Encoding": "gzip"}),
+        (404, b'{"error":"not found"}', {}),
+    )
+    assert client.get_episodes(12345) == episodes
+    assert client.get_episode(12345, 999) is None
+    assert adapter.sent[0].headers["Authorization"] == "Token token=test_key"
+    cassette.save()
+
+    replay = BuzzsproutClient(api_key="test_key", session=ReplaySession(Cassette.load(path)))
+
+    assert replay.get_episodes(12345) == episodes
+    assert replay.get_episode(12345, 999) is None
+    assert list(replay.iter_episodes(12345, chunk_size=3)) == episodes
+    response = replay.session.get(EPISODES_URL)
+    assert response.headers["etag"] == '"v1"'
+    assert "Content-Encoding" not in response.headers
+
+
+def test_responses_replay_in_order_then_repeat():
+    client, cassette, _ = record(
+        None,
+        (200, b'{"id": 1, "title": "Old"}', {}),
+        (200, b'{"id": 1, "title": "New"}', {}),
+    )
+    client.get_podcast(1)
+    client.get_podcast(1)
+
+    replay = BuzzsproutClient(api_key="test_key", session=ReplaySession(cassette))
+
+    titles = [replay.get_podcast(1)["title"] for _ in range(3)]
+    assert titles == ["Old", "New", "New"]
+    cassette.rewind()
+    assert replay.get_podcast(1)["title"] == "Old"
+
+
+def test_errors_and_binary_bodies(tmp_path):
+    path = str(tmp_path / "api.json.gz")
+    client, cassette, _ = record(path, (500, b"\xff\xfe", {}))
+    with pytest.raises(requests.HTTPError):
+        client.get_podcasts()
+    cassette.save()
+
+    replay = BuzzsproutClient(api_key="test_key", session=ReplaySession(Cassette.load(path)))
+    with pytest.raises(requests.HTTPError):
+        replay.get_podcasts()
+    assert replay.session.get("https://www.buzzsprout.com/api/podcasts.json").content == b"\xff\xfe"
+
+
+def test_unrecorded_request_raises():
+    replay = BuzzsproutClient(api_key="test_key", session=ReplaySession(Cassette()))
+
+    with pytest.raises(LookupError):
+        replay.get_podcasts()
+
+
+def test_invalid_latency():
+    with pytest.raises(ValueError):
+        ReplaySession(Cassette(), latency="slow")
@@ -0,0 +1,143 @@
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+from buzzsprout_client.cli import main
+
+from .conftest import make_response
+
+
+@pytest.fixture
+def session():
+    session = Mock()
+    with patch('buzzsprout_client.client.requests.Session', return_value=session):
+        yield session
+
+
+def run(capsys, *argv):
+    code = main(["--api-key", "test_key", *argv])
+    return code, capsys.readouterr().out
+
+
+def test_list_podcasts_json(session, capsys):
+    session.get.return_value = make_response([{"id": 1}, {"id": 2}])
+
+    code, out = run(capsys, "list", "podcasts")
+
+    assert code == 0
+    assert json.loads(out) == [{"id": 1}, {"id": 2}]
+    session.get.assert_called_once_with("https://www.buzzsprout.com/api/podcasts.json")
+
+
+def test_list_episodes_ndjson_streams(session, capsys):
+    response = make_response(None)
+    response.iter_content.return_value = [b'[{"id": 1},', b' {"id": 2}]']
+    session.get.return_value = response
+
+    code, out = run(capsys, "--format", "ndjson", "list", "episodes", "12345")
+
+    assert out.splitlines() == ['{"id":1}', '{"id":2}']
+    assert session.get.call_args.kwargs == {"stream": True}
+
+
+def test_get_episode_not_found(session, capsys):
+    session.get.return_value = make_response(status_code=404)
+
+    code, out = run(capsys, "get", "episode", "12345", "67890")
+
+    assert code == 1
+    assert out == ""
+
+
+def test_create_and_update_parse_field_types(session, capsys):
+    session.post.return_value = make_response({"id": 3})
+    session.put.return_value = make_response({"id": 3})
+
+    run(capsys, "create", "12345", "--title", "New", "--audio-url", "https://example.com/a.mp3",
+        "--episode-number", "7", "--explicit", "yes")
+    code, out = run(capsys, "--format", "ndjson", "update", "12345", "3", "--private", "false")
+
+    data = session.post.call_args.kwargs["data"]
+    assert (data["title"], data["episode_number"], data["explicit"]) == ("New", 7, "true")
+    assert session.put.call_args.kwargs["data"] == {"private": "false"}
+    assert out == '{"id":3}\n'
+
+
+def test_sync(session, capsys, tmp_path):
+    podcasts = make_response([{"id": 1}])
+    episodes = make_response(None)
+    episodes.iter_content.return_value = [b'[{"id": 10, "title": "A"}]']
+    session.get.side_effect = [podcasts, episodes]
+
+    code, out = run(capsys, "sync", "--db", str(tmp_path / "mirror.sqlite"))
+
+    assert json.loads(out) == {"inserted": 1, "updated": 0, "unchanged": 0, "deleted": 0}
+
+
+def test_sync_missing_podcast(session, capsys, tmp_path):
+    session.get.return_value = make_response(status_code=404)
+
+    code = main(["--api-key", "test_key", "sync", "--db", str(tmp_path / "m.sqlite"), "--podcast", "42"])
+
+    assert code == 1
+    assert "Podcast 42 not found" in capsys.readouterr().err
+
+
+def test_ingest_resumes_from_journal(session, capsys, tmp_path):
+    (tmp_path / "one.mp3").write_bytes(b"a" * 2000)
+    (tmp_path / "two.mp3").write_bytes(b"a" * 1000)
+    manifest = tmp_path / "manifest.csv"
+    manifest.write_text("guid,title,audio_file\ng1,One,one.mp3\ng2,Two,two.mp3\n")
+    session.post.side_effect = [make_response({"id": 1}), make_response({"id": 2})]
+    argv = ["ingest", "12345", str(manifest), "--journal", str(tmp_path / "journal.sqlite")]
+
+    from buzzsprout_client.client import BuzzsproutClient
+
+    with patch.object(BuzzsproutClient, "_thread_session", lambda self: self.session):
+        code, out = run(capsys, *argv, "--workers", "1")
+        again, out_again = run(capsys, *argv)
+
+    lines = [json.loads(line) for line in out.splitlines()]
+    assert code == 0
+    assert [(line["guid"], line["bytes"]) for line in lines[:2]] == [("g1", 2000), ("g2", 1000)]
+    assert (lines[2]["created"], lines[2]["bytes_uploaded"]) == (2, 3000)
+    assert again == 0
+    assert json.loads(out_again)["already_done"] == 2
+    assert session.post.call_count == 2
+
+
+def test_http_errors_exit_non_zero(session, capsys):
+    import requests
+
+    session.get.return_value = make_response(status_code=500)
+    session.get.return_value.raise_for_status.side_effect = requests.HTTPError("500 Server Error")
+
+    assert main(["--api-key", "k", "list", "podcasts"]) == 1
+    assert "500 Server Error" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("argv", [
+    ["list", "podcasts"],
+    ["--api-key", "k", "list", "episodes"],
+    ["--api-key", "k", "create", "1", "--audio-url", "u"],
+    ["--api-key", "k", "create", "1", "--title", "No audio"],
+])
+def test_usage_errors(argv, monkeypatch):
+    monkeypatch.delenv("BUZZSPROUT_API_KEY", raising=False)
+    with pytest.raises(SystemExit) as exc:
+        main(argv)
+    assert exc.value.code == 2
+
+
+def test_import_and_help_do_not_load_requests():
+    code = (
+        "import sys, buzzsprout_client, buzzsprout_client.cli\n"
+        "assert 'requests' not in sys.modules, 'requests imported'\n"
+        "assert 'buzzsprout_client.client' not in sys.modules\n"
+    )
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=repo_root)
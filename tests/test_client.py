@@ -1,11 +1,18 @@
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import DEFAULT, Mock, patch
 from buzzsprout_client import BuzzsproutClient
 
 @pytest.fixture
 def mock_session():
     return Mock()
 
+def capture_files(sent):
+    """Side effect recording uploaded file contents before they are closed."""
+    def side_effect(*args, **kwargs):
+        sent.update({name: f.read() for name, f in (kwargs.get("files") or {}).items()})
+        return DEFAULT
+    return side_effect
+
 def test_client_initialization():
     client = BuzzsproutClient(api_key="test_key")
     assert client.api_key == "test_key"
@@ -239,6 +246,8 @@ def test_create_episode_with_files(mock_session, tmp_path):
     # Setup mock session
     mock_session.post.return_value.json.return_value = mock_response
     mock_session.post.return_value.raise_for_status = Mock()
+    sent_files = {}
+    mock_session.post.side_effect = capture_files(sent_files)
     
     with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
         client = BuzzsproutClient(api_key=test_key)
@@ -264,8 +273,8 @@ def test_create_episode_with_files(mock_session, tmp_path):
         mock_session.post.assert_called_once()
         args, kwargs = mock_session.post.call_args
         assert args[0] == expected_url
-        assert kwargs["files"]["audio_file"].read() == b"test audio"
-        assert kwargs["files"]["artwork_file"].read() == b"test artwork"
+        assert sent_files == {"audio_file": b"test audio", "artwork_file": b"test artwork"}
+        assert all(f.closed for f in kwargs["files"].values())
         
         # Verify the response
         assert episode == mock_response
@@ -308,7 +317,7 @@ def test_update_episode(mock_session):
         args, kwargs = mock_session.put.call_args
         assert args[0] == expected_url
         assert kwargs["data"]["title"] == "Updated Title"
-        assert kwargs["data"]["private"] is False
+        assert kwargs["data"]["private"] == "false"
         assert kwargs["data"]["audio_url"] == "https://www.buzzsprout.com/updated.mp3"
         
         # Verify the response
@@ -336,6 +345,8 @@ def test_update_episode_with_files(mock_session, tmp_path):
     # Setup mock session
     mock_session.put.return_value.json.return_value = mock_response
     mock_session.put.return_value.raise_for_status = Mock()
+    sent_files = {}
+    mock_session.put.side_effect = capture_files(sent_files)
     
     with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
         client = BuzzsproutClient(api_key=test_key)
@@ -355,8 +366,8 @@ def test_update_episode_with_files(mock_session, tmp_path):
         mock_session.put.assert_called_once()
         args, kwargs = mock_session.put.call_args
         assert args[0] == expected_url
-        assert kwargs["files"]["audio_file"].read() == b"new audio"
-        assert kwargs["files"]["artwork_file"].read() == b"new artwork"
+        assert sent_files == {"audio_file": b"new audio", "artwork_file": b"new artwork"}
+        assert all(f.closed for f in kwargs["files"].values())
         
         # Verify the response
         assert episode == mock_response
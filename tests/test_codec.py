@@ -0,0 +1,160 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from buzzsprout_client import Episode, HTTPCache
+from buzzsprout_client.codec import JSONCodec, OrjsonCodec, get_codec, select_fields
+
+from .conftest import make_client, make_response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+CODECS = [
+    "json",
+    pytest.param("orjson", marks=pytest.mark.skipif(orjson is None, reason="orjson not installed")),
+]
+
+EPISODES = [
+    {"id": 1, "title": "One", "description": "x" * 100, "duration": 60},
+    {"id": 2, "title": "Twö", "description": "y" * 100},
+]
+
+
+def make_raw_response(body, status_code=200, headers=None):
+    response = make_response(body, status_code, headers)
+    response.json.side_effect = AssertionError("response.json() must not be used")
+    return response
+
+
+def test_get_codec():
+    assert get_codec(None) is None
+    assert type(get_codec("json")) is JSONCodec
+    codec = JSONCodec()
+    assert get_codec(codec) is codec
+    assert type(get_codec("auto")) is (OrjsonCodec if orjson is not None else JSONCodec)
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_codecs_decode_bytes(name):
+    codec = get_codec(name)
+    body = json.dumps(EPISODES, ensure_ascii=False).encode("utf-8")
+
+    assert codec.loads(body) == EPISODES
+    assert codec.loads(body.decode()) == EPISODES
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_client_decodes_raw_content(name):
+    session = Mock()
+    session.get.return_value = make_raw_response(EPISODES)
+    client = make_client(session, codec=name)
+
+    assert client.get_episodes(12345) == EPISODES
+    assert client.codec.name == name
+
+
+def test_default_uses_response_json():
+    session = Mock()
+    session.get.return_value.status_code = 200
+    session.get.return_value.json.return_value = EPISODES
+    client = make_client(session)
+
+    assert client.codec is None
+    assert client.get_episodes(12345) == EPISODES
+
+
+def test_not_found_with_codec():
+    session = Mock()
+    session.get.return_value = make_raw_response(None, 404)
+    client = make_client(session, codec="json")
+
+    assert client.get_episode(12345, 1) is None
+
+
+def test_http_cache_body_decoded_with_codec(tmp_path):
+    session = Mock()
+    session.get.side_effect = [
+        make_raw_response(EPISODES, headers={"ETag": '"v1"'}),
+        make_raw_response(None, 304),
+    ]
+    decoded = []
+
+    class CountingCodec(JSONCodec):
+        def loads(self, data):
+            decoded.append(data)
+            return super().loads(data)
+
+    client = make_client(
+        session, codec=CountingCodec(), http_cache=HTTPCache(str(tmp_path / "c.sqlite"))
+    )
+
+    assert client.get_episodes(12345) == EPISODES
+    assert client.get_episodes(12345) == EPISODES
+    assert len(decoded) == 2
+
+
+def test_select_fields():
+    assert select_fields(EPISODES, ("id", "duration")) == [{"id": 1, "duration": 60}, {"id": 2}]
+    assert select_fields(EPISODES[0], ["title"]) == {"title": "One"}
+    assert select_fields(None, ["title"]) is None
+    assert select_fields(EPISODES, None) is EPISODES
+
+
+def test_get_episodes_with_fields():
+    session = Mock()
+    session.get.return_value = make_raw_response(EPISODES)
+    client = make_client(session, codec="auto", models=True)
+
+    episodes = client.get_episodes(12345, fields=("id", "title"))
+
+    assert [(episode.id, episode.title) for episode in episodes] == [(1, "One"), (2, "Twö")]
+    assert all(isinstance(episode, Episode) and episode.description is None for episode in episodes)
+
+
+def test_get_episode_with_fields():
+    session = Mock()
+    session.get.return_value = make_raw_response(EPISODES[0])
+    client = make_client(session, codec="auto")
+
+    assert client.get_episode(12345, 1, fields=["id", "duration"]) == {"id": 1, "duration": 60}
+
+
+def test_iter_episodes_with_fields():
+    session = Mock()
+    response = make_raw_response(None)
+    response.iter_content.return_value = [json.dumps(EPISODES).encode()]
+    session.get.return_value = response
+    client = make_client(session)
+    seen = []
+
+    def stop_when(episode):
+        seen.append(episode)
+        return False
+
+    assert list(client.iter_episodes(12345, stop_when=stop_when, fields=["id"])) == [
+        {"id": 1}, {"id": 2}
+    ]
+    assert seen == EPISODES
+
+
+def test_async_client_codec_and_fields():
+    httpx = pytest.importorskip("httpx")
+    import asyncio
+
+    from buzzsprout_client import AsyncBuzzsproutClient
+
+    async def main():
+        client = AsyncBuzzsproutClient(api_key="test_key", codec="auto")
+        client.session = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json=EPISODES))
+        )
+        async with client:
+            return await client.get_episodes(12345, fields=("id",))
+
+    assert asyncio.run(main()) == [{"id": 1}, {"id": 2}]
@@ -0,0 +1,88 @@
+from unittest.mock import Mock, patch
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from buzzsprout_client import BuzzsproutClient
+
+
+def test_pooled_adapter_is_mounted():
+    client = BuzzsproutClient(api_key="test_key", pool_maxsize=64, pool_block=True)
+
+    adapter = client.session.get_adapter("https://www.buzzsprout.com/api/podcasts.json")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == 64
+    assert adapter._pool_block is True
+
+
+def test_injected_session_is_used_as_is():
+    session = requests.Session()
+    custom = HTTPAdapter(pool_maxsize=3)
+    session.mount("https://", custom)
+
+    client = BuzzsproutClient(api_key="test_key", session=session)
+
+    assert client.session is session
+    assert session.get_adapter("https://www.buzzsprout.com") is custom
+    assert session.headers["Authorization"] == "Token token=test_key"
+
+
+def test_injected_adapter_is_mounted():
+    adapter = HTTPAdapter()
+
+    client = BuzzsproutClient(api_key="test_key", adapter=adapter)
+
+    assert client.session.get_adapter("https://www.buzzsprout.com") is adapter
+    assert client.session.get_adapter("http://localhost:8000") is adapter
+
+
+def test_keep_alive_disabled():
+    client = BuzzsproutClient(api_key="test_key", keep_alive=False)
+
+    assert client.session.headers["Connection"] == "close"
+
+
+def test_timeouts_for_metadata_and_uploads(tmp_path):
+    audio_file = tmp_path / "audio.mp3"
+    audio_file.write_bytes(b"audio")
+    mock_session = Mock()
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(
+            api_key="test_key",
+            timeout=(3.05, 10),
+            upload_timeout=(3.05, 600)
+        )
+        client.get_episode(12345, 1)
+        client.update_episode(12345, 1, title="New")
+        client.create_episode(12345, title="New", audio_file=str(audio_file))
+
+    assert mock_session.get.call_args.kwargs["timeout"] == (3.05, 10)
+    assert mock_session.put.call_args.kwargs["timeout"] == (3.05, 10)
+    assert mock_session.post.call_args.kwargs["timeout"] == (3.05, 600)
+
+
+def test_streamed_uploads_use_upload_timeout(tmp_path):
+    audio_file = tmp_path / "audio.mp3"
+    audio_file.write_bytes(b"audio")
+    mock_session = Mock()
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(
+            api_key="test_key",
+            stream_uploads=True,
+            timeout=10,
+            upload_timeout=600
+        )
+        client.update_episode(12345, 1, audio_file=str(audio_file))
+
+    assert mock_session.put.call_args.kwargs["timeout"] == 600
+
+
+def test_no_timeout_by_default():
+    mock_session = Mock()
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        BuzzsproutClient(api_key="test_key").get_podcasts()
+
+    assert "timeout" not in mock_session.get.call_args.kwargs
@@ -0,0 +1,104 @@
+import hashlib
+from unittest.mock import Mock
+
+import pytest
+
+from buzzsprout_client import UploadLedger
+from buzzsprout_client.dedup import file_digest
+
+from .conftest import make_client, make_response
+
+
+@pytest.fixture
+def audio(tmp_path):
+    path = tmp_path / "episode.mp3"
+    path.write_bytes(b"audio" * 1000)
+    return path
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return UploadLedger(str(tmp_path / "uploads.sqlite"))
+
+
+def make_ledger_client(ledger):
+    session = Mock()
+    session.put.return_value = make_response({"id": 67890})
+    session.post.return_value = make_response({"id": 67890})
+    return make_client(session, upload_ledger=ledger), session
+
+
+def test_file_digest_streams(audio):
+    digest, size = file_digest(str(audio), chunk_size=7)
+
+    assert size == 5000
+    assert digest == hashlib.blake2b(audio.read_bytes(), digest_size=32).hexdigest()
+
+
+def test_unchanged_file_is_skipped_but_metadata_sent(ledger, audio):
+    client, session = make_ledger_client(ledger)
+
+    client.update_episode(12345, 67890, audio_file=str(audio))
+    client.update_episode(12345, 67890, title="Renamed", audio_file=str(audio))
+
+    first, second = session.put.call_args_list
+    assert set(first.kwargs["files"]) == {"audio_file"}
+    assert second.kwargs["files"] is None
+    assert second.kwargs["data"] == {"title": "Renamed"}
+    assert ledger.stats.uploaded == 1
+    assert ledger.stats.skipped == 1
+    assert ledger.stats.bytes_saved == 5000
+
+
+def test_changed_file_and_force_upload_are_sent(ledger, audio):
+    client, session = make_ledger_client(ledger)
+    client.update_episode(12345, 67890, audio_file=str(audio))
+
+    client.update_episode(12345, 67890, audio_file=str(audio), force_upload=True)
+    audio.write_bytes(b"new audio")
+    client.update_episode(12345, 67890, audio_file=str(audio))
+
+    assert all(set(call.kwargs["files"]) == {"audio_file"} for call in session.put.call_args_list)
+    assert ledger.stats.skipped == 0
+    assert ledger.stats.bytes_uploaded == 5000 + 5000 + 9
+
+
+def test_ledger_is_per_episode_and_field(ledger, audio):
+    client, session = make_ledger_client(ledger)
+    client.update_episode(12345, 67890, audio_file=str(audio))
+
+    client.update_episode(12345, 67890, artwork_file=str(audio))
+    client.update_episode(12345, 11111, audio_file=str(audio))
+
+    assert ledger.stats.skipped == 0
+    assert ledger.get(12345, 67890, "artwork_file") == ledger.get(12345, 67890, "audio_file")
+
+
+def test_create_episode_records_upload(ledger, audio):
+    client, session = make_ledger_client(ledger)
+
+    client.create_episode(12345, "New", audio_file=str(audio))
+    client.update_episode(12345, 67890, audio_file=str(audio))
+
+    assert session.put.call_args.kwargs["files"] is None
+    assert ledger.stats.bytes_saved == 5000
+
+
+def test_failed_upload_is_not_recorded(ledger, audio):
+    client, session = make_ledger_client(ledger)
+    session.put.return_value.raise_for_status.side_effect = Exception("500")
+
+    with pytest.raises(Exception):
+        client.update_episode(12345, 67890, audio_file=str(audio))
+
+    assert ledger.get(12345, 67890, "audio_file") is None
+
+
+def test_ledger_persists_and_forgets(tmp_path, audio):
+    path = str(tmp_path / "uploads.sqlite")
+    UploadLedger(path).record(1, 2, "audio_file", "abc", 10)
+
+    ledger = UploadLedger(path)
+    assert ledger.get(1, 2, "audio_file") == "abc"
+    ledger.forget(1)
+    assert ledger.get(1, 2, "audio_file") is None
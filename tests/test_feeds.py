@@ -0,0 +1,166 @@
+import io
+import json
+import os
+import stat
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from buzzsprout_client import Episode, Podcast
+from buzzsprout_client.feeds import FeedCache, export_feed, write_feed
+
+ITUNES = "{http://www.itunes.com/dtds/podcast-1.0.dtd}"
+
+PODCAST = {
+    "id": 1,
+    "title": "Tom & Jerry's <Show>",
+    "author": "Muffin Man",
+    "description": "A show",
+    "website_address": "https://example.com",
+    "contact_email": "show@example.com",
+    "artwork_url": "https://example.com/art.jpg",
+    "language": "en-us",
+    "explicit": False,
+}
+
+
+def make_episodes():
+    return [
+        {"id": 10, "title": "One", "description": "<p>First</p>", "audio_url": "https://example.com/1.mp3?a=1&b=2",
+         "artwork_url": "https://example.com/1.jpg", "published_at": "2024-01-01T10:00:00-05:00",
+         "duration": 1800, "explicit": True, "episode_number": 1, "season_number": 2,
+         "tags": "news, weekly", "guid": "g-10", "artist": "Host", "private": False},
+        {"id": 11, "title": "Two", "duration": 60, "private": False},
+        {"id": 12, "title": "Secret", "private": True},
+    ]
+
+
+def render(fmt, episodes=None, **kwargs):
+    out = io.BytesIO()
+    stats = write_feed(out, PODCAST, episodes if episodes is not None else make_episodes(), fmt, **kwargs)
+    return out.getvalue(), stats
+
+
+def test_rss_feed():
+    body, stats = render("rss")
+
+    channel = ET.fromstring(body).find("channel")
+    assert channel.findtext("title") == PODCAST["title"]
+    assert channel.find(f"{ITUNES}owner").findtext(f"{ITUNES}email") == "show@example.com"
+    items = channel.findall("item")
+    assert [item.findtext("title") for item in items] == ["One", "Two"]
+    first = items[0]
+    assert first.findtext("description") == "<p>First</p>"
+    assert first.find("enclosure").get("url") == "https://example.com/1.mp3?a=1&b=2"
+    assert first.findtext("guid") == "g-10"
+    assert first.findtext("pubDate") == "Mon, 01 Jan 2024 10:00:00 -0500"
+    assert first.findtext(f"{ITUNES}duration") == "1800"
+    assert first.findtext(f"{ITUNES}explicit") == "true"
+    assert first.findtext(f"{ITUNES}episode") == "1"
+    assert first.findtext(f"{ITUNES}season") == "2"
+    assert first.find(f"{ITUNES}image").get("href") == "https://example.com/1.jpg"
+    assert items[1].findtext("guid") == "11"
+    assert (stats.rendered, stats.reused, stats.skipped) == (2, 0, 1)
+
+
+def test_json_feed():
+    body, _ = render("json", include_private=True)
+
+    feed = json.loads(body)
+    assert feed["version"] == "https://jsonfeed.org/version/1.1"
+    assert feed["title"] == PODCAST["title"]
+    assert [item["title"] for item in feed["items"]] == ["One", "Two", "Secret"]
+    first = feed["items"][0]
+    assert first["attachments"][0]["duration_in_seconds"] == 1800
+    assert first["tags"] == ["news", "weekly"]
+    assert first["_itunes"]["season"] == 2
+
+
+def test_empty_json_feed_is_valid():
+    body, _ = render("json", episodes=[])
+
+    assert json.loads(body)["items"] == []
+
+
+def test_models_are_accepted():
+    episodes = [Episode.from_dict(episode) for episode in make_episodes()]
+    body, _ = render("rss", episodes=iter(episodes))
+    out = io.BytesIO()
+    write_feed(out, Podcast.from_dict(PODCAST), [])
+
+    assert ET.fromstring(body).find("channel/item/title").text == "One"
+    assert ET.fromstring(out.getvalue()).findtext("channel/title") == PODCAST["title"]
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        render("atom")
+
+
+@pytest.mark.parametrize("fmt", ["rss", "json"])
+def test_incremental_regeneration(tmp_path, fmt):
+    cache = FeedCache(str(tmp_path / "feed.sqlite"))
+    episodes = make_episodes()
+    full, stats = render(fmt, episodes, cache=cache)
+    assert (stats.rendered, stats.reused) == (2, 0)
+
+    again, stats = render(fmt, episodes, cache=cache)
+    assert again == full
+    assert (stats.rendered, stats.reused) == (0, 2)
+
+    episodes[1] = dict(episodes[1], title="Two (edited)")
+    changed, stats = render(fmt, episodes, cache=cache)
+    assert (stats.rendered, stats.reused) == (1, 1)
+    assert b"Two (edited)" in changed
+    assert changed == render(fmt, episodes)[0]
+
+
+def test_removed_episodes_are_pruned(tmp_path):
+    cache = FeedCache(str(tmp_path / "feed.sqlite"))
+    render("rss", make_episodes(), cache=cache)
+    render("rss", make_episodes()[1:], cache=cache)
+
+    assert cache.get("rss", 1, 10) is None
+    assert cache.get("rss", 1, 11) is not None
+
+
+def test_export_feed_replaces_file_atomically(tmp_path):
+    path = tmp_path / "feed.xml"
+    path.write_bytes(b"old")
+
+    def broken():
+        yield make_episodes()[0]
+        raise RuntimeError("API failed")
+
+    with pytest.raises(RuntimeError):
+        export_feed(str(path), PODCAST, broken())
+    assert path.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["feed.xml"]
+
+    stats = export_feed(str(path), PODCAST, make_episodes())
+    assert stats.rendered == 2
+    assert ET.parse(str(path)).getroot().tag == "rss"
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_export_feed_file_mode(tmp_path):
+    path = tmp_path / "feed.xml"
+    umask = os.umask(0o022)
+    try:
+        export_feed(str(path), PODCAST, make_episodes())
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+    path.chmod(0o640)
+    export_feed(str(path), PODCAST, make_episodes())
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+
+def test_export_feed_leaves_the_umask_alone(tmp_path, monkeypatch):
+    def umask(mask):
+        raise AssertionError("the process umask must not be changed")
+
+    monkeypatch.setattr(os, "umask", umask)
+    export_feed(str(tmp_path / "feed.xml"), PODCAST, make_episodes())
+    export_feed(str(tmp_path / "feed.xml"), PODCAST, make_episodes())
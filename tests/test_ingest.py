@@ -0,0 +1,172 @@
+import json
+import threading
+
+import pytest
+
+from buzzsprout_client import IngestJournal
+from buzzsprout_client.ingest import IngestReport, ingest_episodes, read_manifest
+
+
+class FakeClient:
+    """Stands in for BuzzsproutClient, keeping created episodes in memory."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.created = []
+        self.lock = threading.Lock()
+
+    def create_episode(self, podcast_id, **fields):
+        if fields["guid"] in self.fail:
+            raise ConnectionError("network blip")
+        with self.lock:
+            episode = dict(fields, id=100 + len(self.created))
+            self.created.append(episode)
+        return episode
+
+    def iter_episodes(self, podcast_id):
+        return iter(list(self.created))
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = IngestJournal(str(tmp_path / "journal.sqlite"))
+    yield journal
+    journal.close()
+
+
+def make_entries(tmp_path, sizes):
+    entries = []
+    for i, size in enumerate(sizes):
+        path = tmp_path / f"ep{i}.mp3"
+        path.write_bytes(b"a" * size)
+        entries.append({"guid": f"g{i}", "title": f"Episode {i}", "audio_file": str(path)})
+    return entries
+
+
+def test_read_csv_manifest(tmp_path):
+    (tmp_path / "audio").mkdir()
+    manifest = tmp_path / "manifest.csv"
+    manifest.write_text(
+        "guid,title,audio_file,episode_number,explicit,description\n"
+        "g1,One,audio/one.mp3,1,true,\n"
+        "g2,Two,/srv/two.mp3,2,no,Second\n"
+    )
+
+    entries = read_manifest(str(manifest))
+
+    assert entries == [
+        {"guid": "g1", "title": "One", "audio_file": str(tmp_path / "audio" / "one.mp3"),
+         "episode_number": 1, "explicit": True},
+        {"guid": "g2", "title": "Two", "audio_file": "/srv/two.mp3",
+         "episode_number": 2, "explicit": False, "description": "Second"},
+    ]
+
+
+def test_read_jsonl_manifest(tmp_path):
+    manifest = tmp_path / "manifest.jsonl"
+    manifest.write_text(
+        json.dumps({"guid": "g1", "title": "One", "audio_url": "https://example.com/1.mp3"})
+        + "\n\n"
+    )
+
+    assert read_manifest(str(manifest)) == [
+        {"guid": "g1", "title": "One", "audio_url": "https://example.com/1.mp3"}
+    ]
+
+
+def test_manifest_rejects_unknown_fields(tmp_path):
+    manifest = tmp_path / "manifest.csv"
+    manifest.write_text("guid,title,colour\ng1,One,red\n")
+
+    with pytest.raises(ValueError, match="colour"):
+        read_manifest(str(manifest))
+
+
+def test_ingest_creates_largest_files_first(tmp_path, journal):
+    client = FakeClient()
+    entries = make_entries(tmp_path, [10, 300, 20])
+    seen = []
+
+    report = ingest_episodes(client, 1, entries, journal, max_workers=1, on_episode=seen.append)
+
+    assert [episode["guid"] for episode in client.created] == ["g1", "g2", "g0"]
+    assert [episode.guid for episode in report.created] == ["g1", "g2", "g0"]
+    assert seen == report.created
+    assert report.bytes_uploaded == 330
+    assert report.created[0].bytes == 300
+    assert report.ok
+    assert journal.entries(1) == {"g0": ("done", 102), "g1": ("done", 100), "g2": ("done", 101)}
+
+
+def test_parallel_ingest(tmp_path, journal):
+    client = FakeClient()
+    entries = make_entries(tmp_path, [100] * 20)
+
+    report = ingest_episodes(client, 1, entries, journal, max_workers=4)
+
+    assert sorted(episode["guid"] for episode in client.created) == sorted(f"g{i}" for i in range(20))
+    assert len(report.created) == 20
+    assert all(episode.seconds >= 0 for episode in report.created)
+
+
+def test_rerun_resumes_after_failures(tmp_path, journal):
+    entries = make_entries(tmp_path, [10, 20, 30])
+    client = FakeClient(fail={"g1"})
+
+    first = ingest_episodes(client, 1, entries, journal)
+    assert set(first.failed) == {"g1"}
+    assert isinstance(first.failed["g1"], ConnectionError)
+
+    client.fail.clear()
+    second = ingest_episodes(client, 1, entries, journal)
+
+    assert [episode.guid for episode in second.created] == ["g1"]
+    assert sorted(second.already_done) == ["g0", "g2"]
+    assert sorted(episode["guid"] for episode in client.created) == ["g0", "g1", "g2"]
+
+
+def test_interrupted_upload_is_not_duplicated(tmp_path, journal):
+    entries = make_entries(tmp_path, [10, 20])
+    client = FakeClient()
+    # A crash after the API created g0 but before the journal recorded it,
+    # and one while g1 was still uploading.
+    client.create_episode(1, **entries[0])
+    journal.begin(1, "g0")
+    journal.begin(1, "g1")
+
+    report = ingest_episodes(client, 1, entries, journal)
+
+    assert report.recovered == ["g0"]
+    assert [episode.guid for episode in report.created] == ["g1"]
+    assert [episode["guid"] for episode in client.created] == ["g0", "g1"]
+    assert journal.entries(1)["g0"] == ("done", 100)
+
+
+def test_journal_is_scoped_by_podcast(tmp_path, journal):
+    entries = make_entries(tmp_path, [10])
+    client = FakeClient()
+
+    ingest_episodes(client, 1, entries, journal)
+    report = ingest_episodes(client, 2, entries, journal)
+
+    assert len(report.created) == 1
+
+
+@pytest.mark.parametrize("change, message", [
+    (lambda entries: entries[0].pop("guid"), "no guid"),
+    (lambda entries: entries[1].update(guid="g0"), "Duplicate"),
+    (lambda entries: entries[1].update(audio_file="/missing.mp3"), "missing.mp3"),
+])
+def test_invalid_entries_upload_nothing(tmp_path, journal, change, message):
+    entries = make_entries(tmp_path, [10, 20])
+    change(entries)
+    client = FakeClient()
+
+    with pytest.raises(ValueError, match=message):
+        ingest_episodes(client, 1, entries, journal)
+    assert client.created == []
+
+
+def test_mb_per_second():
+    assert IngestReport(bytes_uploaded=5_000_000, elapsed=2.0).mb_per_second == 2.5
+    assert IngestReport().mb_per_second == 0.0
@@ -0,0 +1,103 @@
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from buzzsprout_client import MemoryCache, MetricsCollector, RateGovernor
+from buzzsprout_client.instrumentation import RequestEvent, endpoint_template
+
+from .conftest import make_client, make_response
+
+
+@pytest.mark.parametrize("path, template", [
+    ("/podcasts.json", "/podcasts.json"),
+    ("/podcasts/12345.json", "/podcasts/{podcast_id}.json"),
+    ("/12345/episodes.json", "/{podcast_id}/episodes.json"),
+    ("/12345/episodes/678.json", "/{podcast_id}/episodes/{episode_id}.json"),
+])
+def test_endpoint_template(path, template):
+    assert endpoint_template(path) == template
+
+
+def test_hooks_receive_events():
+    session = Mock()
+    session.get.return_value = make_response([{"id": 1}])
+    session.put.return_value = make_response({"id": 2}, headers={"Content-Length": "9"})
+    session.put.return_value.request.headers = {"Content-Length": "42"}
+    events = []
+    client = make_client(session, hooks=[events.append])
+
+    client.get_episodes(12345)
+    client.update_episode(12345, 2, title="New")
+
+    get, put = events
+    assert (get.method, get.endpoint, get.status, get.retries, get.cache) == (
+        "GET", "/{podcast_id}/episodes.json", 200, 0, None
+    )
+    assert get.response_bytes == len(b'[{"id": 1}]')
+    assert get.duration >= 0
+    assert (put.method, put.endpoint) == ("PUT", "/{podcast_id}/episodes/{episode_id}.json")
+    assert (put.request_bytes, put.response_bytes) == (42, 9)
+    session.get.assert_called_once_with("https://www.buzzsprout.com/api/12345/episodes.json")
+
+
+def test_error_event_is_emitted_and_exception_propagates():
+    session = Mock()
+    session.get.side_effect = requests.ConnectionError("down")
+    events = []
+    client = make_client(session)
+    client.add_hook(events.append)
+
+    with pytest.raises(requests.ConnectionError):
+        client.get_podcasts()
+
+    assert events[0].status is None
+    assert isinstance(events[0].error, requests.ConnectionError)
+
+
+def test_retries_and_cache_hits_are_reported():
+    session = Mock()
+    session.get.side_effect = [make_response(status_code=503), make_response({"id": 1})]
+    governor = RateGovernor(backoff_factor=0, sleep=lambda seconds: None)
+    events = []
+    client = make_client(session, governor=governor, cache=MemoryCache(), hooks=[events.append])
+
+    client.get_podcast(1)
+    client.get_podcast(1)
+
+    assert [(e.status, e.retries, e.cache) for e in events] == [(200, 1, None), (None, 0, "memory")]
+
+
+def test_remove_hook():
+    session = Mock()
+    session.get.return_value = make_response([])
+    events = []
+    client = make_client(session, hooks=[events.append])
+
+    client.remove_hook(events.append)
+    client.get_podcasts()
+
+    assert client.hooks == ()
+    assert events == []
+
+
+def test_metrics_collector_aggregates_per_endpoint():
+    collector = MetricsCollector(buckets=(0.1, 1.0))
+    for duration in (0.05, 0.2, 0.3, 2.0):
+        collector(RequestEvent("GET", "/podcasts.json", "url", 200, duration, response_bytes=10))
+    collector(RequestEvent("GET", "/{podcast_id}/episodes.json", "url", 500, 0.01))
+    collector(RequestEvent("GET", "/{podcast_id}/episodes.json", "url", 304, 0.01, cache="http"))
+
+    assert collector.endpoints() == ["GET /podcasts.json", "GET /{podcast_id}/episodes.json"]
+    podcasts = collector.snapshot()["GET /podcasts.json"]
+    assert podcasts["count"] == 4
+    assert podcasts["response_bytes"] == 40
+    assert podcasts["histogram"] == {"le_0.1": 1, "le_1": 2, "inf": 1}
+    assert podcasts["p50"] == 0.2
+    assert podcasts["p99"] == 2.0
+    assert podcasts["mean"] == pytest.approx(0.6375)
+    episodes = collector.get("GET /{podcast_id}/episodes.json")
+    assert (episodes.errors, episodes.cache_hits) == (1, 1)
+
+    collector.reset()
+    assert collector.snapshot() == {}
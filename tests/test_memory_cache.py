@@ -0,0 +1,118 @@
+import threading
+from unittest.mock import Mock
+
+from buzzsprout_client import MemoryCache
+
+from .conftest import make_client
+
+
+def test_hit_does_not_touch_session():
+    mock_session = Mock()
+    mock_session.get.return_value.json.return_value = {"id": 1, "title": "Episode"}
+    client = make_client(mock_session, cache=MemoryCache())
+
+    first = client.get_episode(12345, 1)
+    second = client.get_episode(12345, 1)
+
+    assert first == second == {"id": 1, "title": "Episode"}
+    assert mock_session.get.call_count == 1
+    assert client.cache.stats.hits == 1
+
+
+def test_returned_values_are_copies():
+    mock_session = Mock()
+    mock_session.get.return_value.json.return_value = {"id": 1, "title": "Podcast"}
+    client = make_client(mock_session, cache=MemoryCache())
+
+    client.get_podcast(12345)["title"] = "Changed"
+
+    assert client.get_podcast(12345)["title"] == "Podcast"
+
+
+def test_not_found_is_not_cached():
+    mock_session = Mock()
+    mock_session.get.return_value.status_code = 404
+    client = make_client(mock_session, cache=MemoryCache())
+
+    assert client.get_podcast(12345) is None
+    assert client.get_podcast(12345) is None
+    assert mock_session.get.call_count == 2
+
+
+def test_per_resource_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("buzzsprout_client.cache.time.monotonic", lambda: now[0])
+    mock_session = Mock()
+    mock_session.get.return_value.json.return_value = {"id": 1}
+    client = make_client(mock_session, cache=MemoryCache(ttl=60, ttls={"episode": 5}))
+
+    client.get_podcast(12345)
+    client.get_episode(12345, 1)
+    now[0] += 10
+    client.get_podcast(12345)
+    client.get_episode(12345, 1)
+
+    assert mock_session.get.call_count == 3
+
+
+def test_lru_bound():
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert len(cache) == 2
+
+
+def test_update_writes_through_and_invalidates_list():
+    mock_session = Mock()
+    mock_session.get.return_value.json.side_effect = [
+        [{"id": 1, "title": "Old"}],
+        {"id": 1, "title": "Old"},
+        [{"id": 1, "title": "New"}],
+    ]
+    mock_session.put.return_value.json.return_value = {"id": 1, "title": "New"}
+    client = make_client(mock_session, cache=MemoryCache())
+
+    client.get_episodes(12345)
+    client.get_episode(12345, 1)
+    client.update_episode(12345, 1, title="New")
+
+    assert client.get_episode(12345, 1) == {"id": 1, "title": "New"}
+    assert client.get_episodes(12345) == [{"id": 1, "title": "New"}]
+    assert mock_session.get.call_count == 3
+
+
+def test_create_invalidates_list():
+    mock_session = Mock()
+    mock_session.get.return_value.json.return_value = []
+    mock_session.post.return_value.json.return_value = {"id": 2, "title": "New"}
+    client = make_client(mock_session, cache=MemoryCache())
+
+    client.get_episodes(12345)
+    client.create_episode(12345, title="New", audio_url="https://example.com/a.mp3")
+    client.get_episodes(12345)
+
+    assert mock_session.get.call_count == 2
+    assert client.get_episode(12345, 2) == {"id": 2, "title": "New"}
+    assert mock_session.get.call_count == 2
+
+
+def test_thread_safety():
+    cache = MemoryCache(max_entries=50)
+
+    def worker(n):
+        for i in range(1000):
+            cache.set(f"{n}-{i % 100}", i)
+            cache.get(f"{n}-{(i * 7) % 100}")
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(cache) == 50
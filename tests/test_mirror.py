@@ -0,0 +1,114 @@
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from buzzsprout_client import Episode, EpisodeMirror
+
+PODCAST = {"id": 1, "title": "Podcast"}
+
+
+def make_episodes():
+    return [
+        {"id": 10, "title": "One", "guid": "g-10", "episode_number": 1, "season_number": 1,
+         "published_at": "2024-01-01T10:00:00-05:00", "tags": "news, weekly", "private": False},
+        {"id": 11, "title": "Two", "guid": "g-11", "episode_number": 2, "season_number": 1,
+         "published_at": "2024-02-01T10:00:00Z", "tags": "weekly", "private": True},
+        {"id": 12, "title": "Three", "guid": "g-12", "episode_number": 1, "season_number": 2,
+         "published_at": "2024-03-01T10:00:00Z", "tags": "", "private": False},
+    ]
+
+
+def make_client(episodes, models=False):
+    client = Mock()
+    client.models = models
+    client.get_podcasts.return_value = [PODCAST]
+    client.get_podcast.return_value = PODCAST
+    client.iter_episodes.side_effect = lambda podcast_id: iter(episodes)
+    return client
+
+
+@pytest.fixture
+def mirror_path(tmp_path):
+    return str(tmp_path / "mirror.sqlite")
+
+
+def test_sync_and_queries(mirror_path):
+    client = make_client(make_episodes())
+    mirror = EpisodeMirror(client, mirror_path)
+
+    stats = mirror.sync()
+
+    assert (stats.inserted, stats.updated, stats.unchanged, stats.deleted) == (3, 0, 0, 0)
+    client.iter_episodes.assert_called_once_with(1)
+    assert mirror.podcasts() == [PODCAST]
+    assert mirror.episode(11)["title"] == "Two"
+    assert mirror.episode_by_guid("g-12")["id"] == 12
+    assert mirror.episode_by_guid("missing") is None
+    assert [e["id"] for e in mirror.episodes()] == [12, 11, 10]
+    assert [e["id"] for e in mirror.episodes(private=True)] == [11]
+    assert [e["id"] for e in mirror.episodes_by_number(1, season_number=1)] == [10, 11]
+    assert [e["id"] for e in mirror.episodes_by_number(1, episode_number=1)] == [10, 12]
+    assert [e["id"] for e in mirror.episodes_tagged("weekly")] == [11, 10]
+    assert [e["id"] for e in mirror.episodes_tagged("news", podcast_id=2)] == []
+
+
+def test_published_range_compares_in_utc(mirror_path):
+    mirror = EpisodeMirror(make_client(make_episodes()), mirror_path)
+    mirror.sync()
+
+    # 10:00 -05:00 is 15:00 UTC
+    found = mirror.episodes_published_between("2024-01-01T15:00:00Z", datetime(2024, 3, 1, 10))
+    assert [e["id"] for e in found] == [11, 10]
+    found = mirror.episodes_published_between(start=datetime(2024, 1, 1, 15, 1, tzinfo=timezone.utc))
+    assert [e["id"] for e in found] == [12, 11]
+
+
+def test_resync_writes_only_changes(mirror_path):
+    episodes = make_episodes()
+    client = make_client(episodes)
+    mirror = EpisodeMirror(client, mirror_path)
+    mirror.sync()
+
+    episodes[0] = dict(episodes[0], title="One (edited)", tags="archive")
+    del episodes[2]
+    episodes.append({"id": 13, "title": "Four", "guid": "g-13"})
+    stats = mirror.sync()
+
+    assert (stats.inserted, stats.updated, stats.unchanged, stats.deleted) == (1, 1, 1, 1)
+    assert mirror.episode(10)["title"] == "One (edited)"
+    assert mirror.episode(12) is None
+    assert [e["id"] for e in mirror.episodes_tagged("news")] == []
+    assert [e["id"] for e in mirror.episodes_tagged("archive")] == [10]
+
+
+def test_mirror_persists_between_instances(mirror_path):
+    EpisodeMirror(make_client(make_episodes()), mirror_path).sync()
+
+    mirror = EpisodeMirror(make_client(make_episodes()), mirror_path)
+    assert mirror.episode_by_guid("g-10")["id"] == 10
+    assert mirror.sync().unchanged == 3
+
+
+def test_missing_podcast_raises(mirror_path):
+    client = make_client(make_episodes())
+    client.get_podcast.side_effect = lambda podcast_id: PODCAST if podcast_id == 1 else None
+    mirror = EpisodeMirror(client, mirror_path)
+
+    with pytest.raises(LookupError, match="Podcast 42 not found"):
+        mirror.sync(podcast_ids=[1, 42])
+    assert mirror.podcasts() == []
+    client.iter_episodes.assert_not_called()
+
+
+def test_returns_models_when_client_uses_them(mirror_path):
+    episodes = [Episode.from_dict(episode) for episode in make_episodes()]
+    client = make_client(episodes, models=True)
+    client.get_podcast.return_value = Mock(to_dict=Mock(return_value=PODCAST))
+    mirror = EpisodeMirror(client, mirror_path)
+
+    assert mirror.sync(podcast_ids=[1]).inserted == 3
+    client.get_podcast.assert_called_once_with(1)
+    episode = mirror.episode_by_guid("g-11")
+    assert isinstance(episode, Episode)
+    assert episode.published_at == datetime(2024, 2, 1, 10, tzinfo=timezone.utc)
@@ -0,0 +1,118 @@
+import pickle
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from buzzsprout_client import BuzzsproutClient, Episode, Podcast
+from buzzsprout_client.models import parse_episode_field
+
+EPISODE = {
+    "id": 788881,
+    "title": "Too small or too big?",
+    "audio_url": "https://www.buzzsprout.com/140447/788881-filename.mp3",
+    "artwork_url": "https://storage.buzzsprout.com/variants/abc",
+    "description": "",
+    "summary": "",
+    "artist": "Muffin Man",
+    "tags": "",
+    "published_at": "2019-09-12T03:00:00.000-04:00",
+    "duration": 12362,
+    "hq": True,
+    "guid": "Buzzsprout788881",
+    "inactive_at": None,
+    "episode_number": 5,
+    "season_number": 5,
+    "explicit": False,
+    "private": False,
+    "total_plays": 150
+}
+
+
+def test_episode_fields():
+    episode = Episode.from_dict(EPISODE)
+
+    assert episode.id == 788881
+    assert episode.title == "Too small or too big?"
+    assert episode.total_plays == 150
+    assert episode.inactive_at is None
+    assert not hasattr(episode, "__dict__")
+
+
+def test_published_at_is_parsed_lazily():
+    episode = Episode.from_dict(EPISODE)
+
+    assert episode._published_at_parsed is not episode.published_at
+    assert episode.published_at == datetime(
+        2019, 9, 12, 3, tzinfo=timezone(timedelta(hours=-4))
+    )
+    assert episode._published_at_parsed is episode.published_at
+
+
+def test_repeated_strings_are_interned():
+    first = Episode.from_dict(dict(EPISODE, artist="".join(["Muffin", " Man"])))
+    second = Episode.from_dict(dict(EPISODE, artist="".join(["Muffin ", "Man"])))
+
+    assert first.artist is second.artist
+
+
+def test_round_trip():
+    episode = Episode.from_dict(dict(EPISODE, new_field="kept"))
+
+    assert episode.new_field == "kept"
+    assert episode.to_dict() == dict(EPISODE, new_field="kept")
+    assert Episode.from_dict(episode.to_dict()) == episode
+    assert pickle.loads(pickle.dumps(episode)) == episode
+
+
+def test_to_payload():
+    payload = Episode.from_dict(EPISODE).to_payload()
+
+    assert payload["title"] == EPISODE["title"]
+    assert payload["published_at"] == EPISODE["published_at"]
+    assert "id" not in payload
+    assert "total_plays" not in payload
+    assert "inactive_at" not in payload
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError):
+        Episode.from_dict(EPISODE).unknown
+
+
+def test_client_returns_models():
+    mock_session = Mock()
+    mock_session.get.return_value.json.return_value = [EPISODE]
+    mock_session.put.return_value.json.return_value = EPISODE
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key", models=True)
+        episodes = client.get_episodes(12345)
+        updated = client.update_episode(12345, 788881, **episodes[0].to_payload())
+
+    assert episodes == [Episode.from_dict(EPISODE)]
+    assert updated == episodes[0]
+    args, kwargs = mock_session.put.call_args
+    assert kwargs["data"]["artist"] == "Muffin Man"
+
+
+def test_client_returns_podcast_model():
+    mock_session = Mock()
+    mock_session.get.return_value.json.return_value = {"id": 1, "title": "Show"}
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        podcast = BuzzsproutClient(api_key="test_key", models=True).get_podcast(1)
+
+    assert isinstance(podcast, Podcast)
+    assert podcast.title == "Show"
+
+
+def test_parse_episode_field():
+    assert parse_episode_field("episode_number", "7") == 7
+    assert parse_episode_field("explicit", "Yes") is True
+    assert parse_episode_field("private", "off") is False
+    assert parse_episode_field("title", "42") == "42"
+    with pytest.raises(ValueError, match="true or false"):
+        parse_episode_field("private", "maybe")
+    with pytest.raises(ValueError, match="integer"):
+        parse_episode_field("duration", "long")
@@ -0,0 +1,192 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from buzzsprout_client import ClientPool, MemoryCache
+
+
+class EchoAdapter(BaseAdapter):
+    """Answers every request with its Authorization header."""
+
+    def __init__(self, delay=0.0, set_cookie=False):
+        super().__init__()
+        self.delay = delay
+        self.set_cookie = set_cookie
+        self.sent = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.sent.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps({"authorization": request.headers["Authorization"]}).encode()
+        if self.set_cookie:
+            tenant = request.headers["Authorization"].split("=", 1)[1]
+            response.headers["Set-Cookie"] = f"_session={tenant}; Path=/"
+            response.raw = FakeRaw(response.headers)
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+class FakeRaw:
+    """Just enough of a urllib3 response for requests to extract cookies."""
+
+    def __init__(self, headers):
+        self._original_response = self
+        self.msg = self
+        self.headers = headers
+
+    def get_all(self, name, default=None):
+        value = self.headers.get(name)
+        return [value] if value is not None else default
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_clients_are_reused_per_key():
+    pool = ClientPool(adapter=EchoAdapter())
+
+    first = pool.client("key-a")
+
+    assert pool.client("key-a") is first
+    assert pool.client("key-b") is not first
+    assert (pool.stats.created, pool.stats.hits) == (2, 1)
+    assert len(pool) == 2
+
+
+def test_each_request_carries_its_tenants_credentials():
+    adapter = EchoAdapter(delay=0.001)
+    pool = ClientPool(adapter=adapter)
+    keys = [f"key-{i}" for i in range(8)]
+
+    def fetch(i):
+        key = keys[i % len(keys)]
+        return key, pool.client(key).get_podcasts()
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(fetch, range(200)))
+
+    for key, body in results:
+        assert body == {"authorization": f"Token token={key}"}
+    assert len(adapter.sent) == 200
+
+
+def test_tenants_share_one_transport():
+    adapter = EchoAdapter()
+    pool = ClientPool(adapter=adapter)
+
+    pool.client("key-a").get_podcasts()
+    pool.client("key-b").get_podcasts()
+
+    url = "https://www.buzzsprout.com/api/podcasts.json"
+    assert pool.session.get_adapter(url) is adapter
+    assert pool._thread_session().get_adapter(url) is adapter
+    assert len(adapter.sent) == 2
+
+
+def test_cookies_do_not_leak_between_tenants():
+    adapter = EchoAdapter(set_cookie=True)
+    pool = ClientPool(adapter=adapter)
+
+    pool.client("key-a").get_podcasts()
+    pool.client("key-b").get_podcasts()
+    pool.client("key-a").get_podcasts()
+
+    assert [request.headers.get("Cookie") for request in adapter.sent] == [None, None, None]
+    assert len(pool._thread_session().cookies) == 0
+
+
+def test_least_recently_used_tenant_is_evicted():
+    pool = ClientPool(max_tenants=2, adapter=EchoAdapter())
+    pool.client("a")
+    pool.client("b")
+    pool.client("a")
+
+    pool.client("c")
+
+    assert "b" not in pool
+    assert "a" in pool and "c" in pool
+    assert pool.stats.evicted == 1
+
+
+def test_idle_tenants_are_evicted():
+    clock = Clock()
+    pool = ClientPool(idle_timeout=60, clock=clock, adapter=EchoAdapter())
+    pool.client("a")
+    clock.now = 30
+    pool.client("b")
+
+    clock.now = 70
+    pool.client("b")
+
+    assert "a" not in pool
+    assert "b" in pool
+
+
+def test_evicted_client_keeps_working():
+    pool = ClientPool(max_tenants=1, adapter=EchoAdapter())
+    client = pool.client("a")
+    pool.client("b")
+
+    assert client.get_podcasts() == {"authorization": "Token token=a"}
+
+
+def test_per_tenant_rate_limits():
+    pool = ClientPool(rate=5, burst=2, adapter=EchoAdapter())
+
+    a, b = pool.client("a"), pool.client("b")
+
+    assert a.governor is not b.governor
+    assert a.governor.rate == 5
+    assert ClientPool(adapter=EchoAdapter()).client("a").governor is None
+
+
+def test_aggregate_concurrency_cap():
+    adapter = EchoAdapter(delay=0.01)
+    pool = ClientPool(max_concurrency=3, adapter=adapter)
+
+    with ThreadPoolExecutor(max_workers=12) as executor:
+        list(executor.map(lambda i: pool.client(f"key-{i % 4}").get_podcasts(), range(36)))
+
+    assert adapter.max_in_flight == 3
+
+
+def test_client_options_are_passed_on():
+    cache = MemoryCache()
+    adapter = EchoAdapter()
+    pool = ClientPool(adapter=adapter, cache=cache, models=False)
+
+    pool.client("a").get_podcasts()
+    pool.client("a").get_podcasts()
+    pool.client("b").get_podcasts()
+
+    # Cache entries are scoped by account, so only the repeat was served from it
+    assert len(adapter.sent) == 2
+
+
+def test_reserved_options_are_rejected():
+    with pytest.raises(ValueError, match="thread_safe"):
+        ClientPool(thread_safe=True)
@@ -0,0 +1,171 @@
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from buzzsprout_client import BuzzsproutClient, RateGovernor
+from buzzsprout_client.ratelimit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_governor(clock, **kwargs):
+    return RateGovernor(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def response(status, headers=None):
+    result = Mock()
+    result.status_code = status
+    result.headers = headers or {}
+    return result
+
+
+def test_token_bucket_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=2, clock=clock, sleep=clock.sleep)
+
+    for _ in range(6):
+        bucket.acquire()
+
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_token_bucket_is_shared_across_threads():
+    bucket = TokenBucket(rate=1000, burst=1)
+    counter = []
+
+    def worker():
+        for _ in range(20):
+            bucket.acquire()
+            counter.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(counter) == 80
+
+
+def test_retries_get_on_server_error():
+    clock = FakeClock()
+    governor = make_governor(clock, backoff_factor=1)
+    responses = [response(502), response(503), response(200)]
+
+    result = governor.send("GET", lambda: responses.pop(0))
+
+    assert result.status_code == 200
+    assert governor.stats.retries == 2
+    assert 0.5 <= clock.sleeps[0] <= 1
+    assert 1 <= clock.sleeps[1] <= 2
+
+
+def test_does_not_retry_post_on_server_error():
+    governor = make_governor(FakeClock())
+    responses = [response(500), response(200)]
+
+    assert governor.send("POST", lambda: responses.pop(0)).status_code == 500
+
+
+def test_retries_post_on_429_honoring_retry_after():
+    clock = FakeClock()
+    governor = make_governor(clock)
+    responses = [response(429, {"Retry-After": "7"}), response(201)]
+
+    assert governor.send("POST", lambda: responses.pop(0)).status_code == 201
+    assert clock.now >= 7
+    assert governor.stats.throttled == 1
+
+
+def test_long_retry_after_is_not_waited_for():
+    clock = FakeClock()
+    governor = make_governor(clock, max_backoff=60)
+    attempts = []
+
+    def attempt():
+        attempts.append(1)
+        return response(429, {"Retry-After": "86400"})
+
+    assert governor.send("GET", attempt).status_code == 429
+    assert len(attempts) == 1
+    assert clock.now == 0
+    governor.bucket.acquire()
+    assert clock.sleeps == []
+
+
+def test_gives_up_after_max_retries():
+    governor = make_governor(FakeClock(), max_retries=2)
+    attempts = []
+
+    def attempt():
+        attempts.append(1)
+        return response(503)
+
+    assert governor.send("GET", attempt).status_code == 503
+    assert len(attempts) == 3
+
+
+def test_retries_connection_errors_for_idempotent_methods():
+    governor = make_governor(FakeClock())
+    outcomes = [requests.ConnectionError(), response(200)]
+
+    def attempt():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert governor.send("GET", attempt, (requests.ConnectionError,)).status_code == 200
+    with pytest.raises(requests.ConnectionError):
+        governor.send("POST", lambda: (_ for _ in ()).throw(requests.ConnectionError()),
+                      (requests.ConnectionError,))
+
+
+def test_rate_adapts():
+    governor = make_governor(FakeClock(), rate=10, min_rate=1, rate_increase=1)
+
+    governor._adapt(429)
+    governor._adapt(429)
+    assert governor.rate == 2.5
+    for _ in range(20):
+        governor._adapt(200)
+    assert governor.rate == 10
+
+
+def test_retry_after_http_date():
+    assert RateGovernor.retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert RateGovernor.retry_after("garbage") is None
+    assert RateGovernor.retry_after("2.5") == 2.5
+
+
+def test_client_retries_and_rewinds_files(tmp_path):
+    audio_file = tmp_path / "audio.mp3"
+    audio_file.write_bytes(b"audio")
+    clock = FakeClock()
+    mock_session = Mock()
+    sent = []
+
+    def put(url, data=None, files=None):
+        sent.append(files["audio_file"].read())
+        return response(503) if len(sent) == 1 else Mock(status_code=200, headers={})
+
+    mock_session.put.side_effect = put
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key", governor=make_governor(clock))
+        client.update_episode(12345, 1, audio_file=str(audio_file))
+
+    assert sent == [b"audio", b"audio"]
@@ -0,0 +1,205 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from buzzsprout_client.singleflight import AsyncSingleFlight, SingleFlight
+
+from .conftest import make_client, make_response
+
+
+def client_with_get(get, **kwargs):
+    session = Mock()
+    session.get.side_effect = get
+    return make_client(session, **kwargs), session
+
+
+def run_threads(target, count):
+    results, errors = [], []
+
+    def work():
+        try:
+            results.append(target())
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=work) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def slow_response(body=None, error=None):
+    def get(url, **kwargs):
+        time.sleep(0.1)
+        if error is not None:
+            raise error
+        return make_response(body)
+    return get
+
+
+def test_concurrent_identical_gets_share_one_request():
+    client, session = client_with_get(slow_response({"id": 67890, "tags": ["a"]}), coalesce=True)
+
+    results, errors = run_threads(lambda: client.get_episode(12345, 67890), 8)
+
+    assert errors == []
+    assert session.get.call_count == 1
+    assert results == [{"id": 67890, "tags": ["a"]}] * 8
+    # Every caller gets its own copy
+    assert len({id(result) for result in results}) == 8
+    assert client.singleflight.stats.requests == 1
+    assert client.singleflight.stats.coalesced == 7
+
+
+def test_first_caller_changing_its_result_does_not_affect_waiters():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fetch():
+        started.set()
+        time.sleep(0.05)
+        return [{"id": 1}, {"id": 2}]
+
+    def first():
+        result = flight.do("key", fetch)
+        for episode in result:
+            episode["extra"] = 1
+        result.clear()
+        return result
+
+    leader = threading.Thread(target=first)
+    leader.start()
+    started.wait()
+    results, _ = run_threads(lambda: flight.do("key", fetch), 4)
+    leader.join()
+
+    assert results == [[{"id": 1}, {"id": 2}]] * 4
+
+
+def test_errors_are_shared():
+    client, session = client_with_get(slow_response(error=requests.ConnectionError("down")), coalesce=True)
+
+    results, errors = run_threads(lambda: client.get_episodes(12345), 5)
+
+    assert results == []
+    assert len(errors) == 5
+    assert all(isinstance(error, requests.ConnectionError) for error in errors)
+    assert session.get.call_count == 1
+
+
+def test_different_urls_and_later_calls_are_not_coalesced():
+    client, session = client_with_get(slow_response([]), coalesce=True)
+
+    run_threads(lambda: client.get_episodes(1), 1)
+    run_threads(lambda: client.get_episodes(1), 1)
+    run_threads(lambda: client.get_episodes(2), 1)
+
+    assert session.get.call_count == 3
+    assert client.singleflight.stats.coalesced == 0
+
+
+def test_disabled_by_default():
+    client, session = client_with_get(slow_response([]))
+
+    run_threads(lambda: client.get_episodes(1), 3)
+
+    assert client.singleflight is None
+    assert session.get.call_count == 3
+
+
+def test_single_flight_runs_again_after_failure():
+    flight = SingleFlight()
+
+    with pytest.raises(ValueError):
+        flight.do("key", Mock(side_effect=ValueError))
+
+    assert flight.do("key", lambda: 42) == 42
+
+
+def test_async_client_coalesces():
+    httpx = pytest.importorskip("httpx")
+    from buzzsprout_client import AsyncBuzzsproutClient
+
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=[{"id": 1}])
+
+    async def main():
+        client = AsyncBuzzsproutClient(api_key="test_key", coalesce=True)
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            results = await asyncio.gather(*(client.get_episodes(12345) for _ in range(6)))
+        return client, results
+
+    client, results = asyncio.run(main())
+    assert len(calls) == 1
+    assert results == [[{"id": 1}]] * 6
+    assert client.singleflight.stats.coalesced == 5
+
+
+def test_async_cancelling_the_first_caller_leaves_the_call_running():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"id": 1}
+
+    async def main():
+        first = asyncio.ensure_future(asyncio.wait_for(flight.do("key", fetch), 0.01))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(flight.do("key", fetch))
+        with pytest.raises(asyncio.TimeoutError):
+            await first
+        result = await waiter
+        return result, dict(flight._calls)
+
+    result, pending = asyncio.run(main())
+    assert result == {"id": 1}
+    assert calls == [1]
+    assert pending == {}
+
+
+def test_async_errors_are_shared():
+    flight = AsyncSingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(
+            flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+        )
+
+    errors = asyncio.run(main())
+    assert [type(error) for error in errors] == [ValueError, ValueError]
+    assert flight.stats.requests == 1
+
+
+def test_async_callers_get_independent_results():
+    flight = AsyncSingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return [{"id": 1}]
+
+    async def first():
+        result = await flight.do("key", fetch)
+        result.clear()
+        return result
+
+    async def main():
+        return await asyncio.gather(first(), flight.do("key", fetch), flight.do("key", fetch))
+
+    assert asyncio.run(main()) == [[], [{"id": 1}], [{"id": 1}]]
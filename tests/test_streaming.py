@@ -0,0 +1,106 @@
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from buzzsprout_client import BuzzsproutClient
+from buzzsprout_client.streaming import JSONArrayParser, iter_json_array, published_before
+
+EPISODES = [
+    {"id": 3, "title": "Žluťoučký kůň", "published_at": "2021-03-01T03:00:00.000-04:00"},
+    {"id": 2, "title": "Second", "published_at": "2020-06-01T03:00:00.000-04:00", "duration": 12362},
+    {"id": 1, "title": "First", "published_at": "2019-09-12T03:00:00.000-04:00", "tags": ""},
+]
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, 100000])
+def test_iter_json_array_any_chunking(size):
+    body = json.dumps(EPISODES, ensure_ascii=False, indent=2).encode()
+
+    assert list(iter_json_array(chunked(body, size))) == EPISODES
+
+
+def test_numbers_split_across_chunks():
+    assert list(iter_json_array([b"[12", b"34, 5", b"6]"])) == [1234, 56]
+
+
+def test_empty_array():
+    assert list(iter_json_array([b" [ ", b"] "])) == []
+
+
+def test_elements_are_returned_as_they_complete():
+    parser = JSONArrayParser()
+
+    assert parser.feed(b'[{"id": 1}, {"id"') == [{"id": 1}]
+    assert parser.feed(b': 2}]') == [{"id": 2}]
+    assert parser.close() == []
+
+
+@pytest.mark.parametrize("body", [b'{"id": 1}', b'[{"id": 1}', b'[1] 2', b'[1; 2]'])
+def test_invalid_input(body):
+    with pytest.raises(ValueError):
+        list(iter_json_array([body]))
+
+
+def test_published_before():
+    predicate = published_before(datetime(2020, 1, 1))
+
+    assert predicate(EPISODES[2])
+    assert not predicate(EPISODES[1])
+    assert not predicate({"id": 4})
+
+
+def make_streaming_session(body, chunk_size=16):
+    mock_session = Mock()
+    response = mock_session.get.return_value
+    response.iter_content.side_effect = lambda size: iter(chunked(body, chunk_size))
+    return mock_session
+
+
+def test_client_iter_episodes():
+    mock_session = make_streaming_session(json.dumps(EPISODES).encode())
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key")
+        episodes = list(client.iter_episodes(12345))
+
+    assert episodes == EPISODES
+    mock_session.get.assert_called_once_with(
+        "https://www.buzzsprout.com/api/12345/episodes.json", stream=True
+    )
+    mock_session.get.return_value.close.assert_called_once()
+
+
+def test_client_iter_episodes_stop_when():
+    mock_session = make_streaming_session(json.dumps(EPISODES).encode())
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key")
+        episodes = list(client.iter_episodes(
+            12345, stop_when=published_before(datetime(2021, 1, 1))
+        ))
+
+    assert [episode["id"] for episode in episodes] == [3]
+    mock_session.get.return_value.close.assert_called_once()
+
+
+def test_async_client_iter_episodes():
+    httpx = pytest.importorskip("httpx")
+    from buzzsprout_client import AsyncBuzzsproutClient
+
+    def handler(request):
+        return httpx.Response(200, content=json.dumps(EPISODES).encode())
+
+    async def main():
+        client = AsyncBuzzsproutClient(api_key="test_key")
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            return [episode async for episode in client.iter_episodes(12345)]
+
+    assert asyncio.run(main()) == EPISODES
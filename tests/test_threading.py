@@ -0,0 +1,183 @@
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from buzzsprout_client import BuzzsproutClient, Cassette, ReplaySession
+
+LATENCY = 0.01
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, body):
+        self.server.peers.add(self.client_address)
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        podcast_id, episode_id = re.search(r"/(\d+)/episodes/(\d+)\.json", self.path).groups()
+        self._reply({
+            "id": int(episode_id),
+            "podcast_id": int(podcast_id),
+            "authorization": self.headers["Authorization"],
+        })
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        boundary = self.headers["Content-Type"].split("boundary=", 1)[1].encode()
+        audio = None
+        for part in body.split(b"--" + boundary):
+            head, _, content = part.partition(b"\r\n\r\n")
+            if b'name="audio_file"' in head:
+                audio = content[:-2].decode()
+        self._reply({"id": 1, "audio": audio})
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.daemon_threads = True
+    httpd.peers = set()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def make_client(server, **kwargs):
+    client = BuzzsproutClient(api_key="test_key", thread_safe=True, **kwargs)
+    client.base_url = f"http://127.0.0.1:{server.server_address[1]}/api"
+    client.session.trust_env = False
+    return client
+
+
+def run_gets(client, threads, calls):
+    def call(i):
+        return i, client.get_episode(i % 7, i)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(call, range(calls)))
+    return results, time.perf_counter() - started
+
+
+def test_threads_get_own_sessions_sharing_one_pool():
+    client = BuzzsproutClient(api_key="test_key", thread_safe=True)
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(client._thread_session()))
+    thread.start()
+    thread.join()
+    sessions.append(client._thread_session())
+
+    assert sessions[0] is not sessions[1]
+    assert client._thread_session() is sessions[1]
+    url = "https://www.buzzsprout.com/api/podcasts.json"
+    adapter = client.session.get_adapter(url)
+    assert all(session.get_adapter(url) is adapter for session in sessions)
+    assert all(session.headers["Authorization"] == "Token token=test_key" for session in sessions)
+
+
+def test_default_mode_uses_the_session_directly():
+    client = BuzzsproutClient(api_key="test_key")
+
+    assert client._thread_session() is client.session
+
+
+def test_other_sessions_are_used_as_they_are():
+    recorded = requests.Response()
+    recorded.status_code = 200
+    recorded._content = b'[{"id": 1}]'
+    cassette = Cassette()
+    cassette.record("GET", "https://www.buzzsprout.com/api/1/episodes.json", recorded, 0.0)
+    session = ReplaySession(cassette)
+    client = BuzzsproutClient(api_key="test_key", session=session, thread_safe=True)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda i: client.get_episodes(1), range(8)))
+
+    assert results == [[{"id": 1}]] * 8
+    assert client._thread_session() is session
+
+
+def test_concurrent_results_match_their_requests(server):
+    client = make_client(server, pool_maxsize=8, pool_block=True)
+
+    results, _ = run_gets(client, threads=32, calls=320)
+
+    for i, episode in results:
+        assert episode == {"id": i, "podcast_id": i % 7, "authorization": "Token token=test_key"}
+    # 32 threads took turns on the 8 pooled connections.
+    assert len(server.peers) <= 8
+
+
+def test_throughput_scales_with_threads(server):
+    client = make_client(server, pool_maxsize=16)
+    run_gets(client, threads=16, calls=16)  # open the connections
+
+    _, single = run_gets(client, threads=1, calls=20)
+    _, many = run_gets(client, threads=16, calls=160)
+
+    speedup = (160 / many) / (20 / single)
+    assert speedup > 4
+
+
+def test_concurrent_uploads_close_their_files(server, tmp_path, monkeypatch):
+    client = make_client(server)
+    opened = []
+    open_files = client._open_files
+
+    def spy(*args):
+        files = open_files(*args)
+        opened.extend(files.values())
+        return files
+
+    monkeypatch.setattr(client, "_open_files", spy)
+    paths = []
+    for i in range(16):
+        path = tmp_path / f"audio-{i}.mp3"
+        path.write_text(f"audio {i} " * 1000)
+        paths.append(path)
+
+    def upload(i):
+        return client.create_episode(1, title=f"Episode {i}", audio_file=str(paths[i]))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        episodes = list(executor.map(upload, range(16)))
+
+    assert [episode["audio"] for episode in episodes] == [f"audio {i} " * 1000 for i in range(16)]
+    assert len(opened) == 16
+    assert all(f.closed for f in opened)
+
+
+def test_files_are_closed_when_the_request_fails(tmp_path, monkeypatch):
+    client = BuzzsproutClient(api_key="test_key", thread_safe=True)
+    client.base_url = "http://127.0.0.1:9/api"
+    client.session.trust_env = False
+    opened = []
+    open_files = client._open_files
+    monkeypatch.setattr(
+        client, "_open_files", lambda *args: opened.append(open_files(*args)) or opened[-1]
+    )
+    path = tmp_path / "audio.mp3"
+    path.write_bytes(b"audio")
+
+    with pytest.raises(requests.ConnectionError):
+        client.create_episode(1, title="Episode", audio_file=str(path))
+    assert opened[0]["audio_file"].closed
@@ -0,0 +1,204 @@
+import email
+from unittest.mock import Mock, patch
+
+import pytest
+
+from buzzsprout_client import BuzzsproutClient
+from buzzsprout_client.uploads import MultipartEncoder
+
+
+def parse_multipart(encoder):
+    body = b"".join(encoder)
+    message = email.message_from_bytes(
+        f"Content-Type: {encoder.content_type}\r\n\r\n".encode() + body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): part
+        for part in message.get_payload()
+    }
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / "audio.mp3"
+    path.write_bytes(bytes(range(256)) * 1000)
+    return path
+
+
+def test_encoder_body(audio_file):
+    encoder = MultipartEncoder(
+        {"title": "Episode", "explicit": False, "guid": None},
+        {"audio_file": str(audio_file)},
+        chunk_size=4096
+    )
+
+    parts = parse_multipart(encoder)
+
+    assert parts["title"].get_payload(decode=True) == b"Episode"
+    assert parts["explicit"].get_payload(decode=True) == b"False"
+    assert "guid" not in parts
+    assert parts["audio_file"].get_filename() == "audio.mp3"
+    assert parts["audio_file"].get_content_type() == "audio/mpeg"
+    assert parts["audio_file"].get_payload(decode=True) == audio_file.read_bytes()
+
+
+def test_encoder_length_matches_body(audio_file):
+    encoder = MultipartEncoder({"title": "Episode"}, {"audio_file": str(audio_file)})
+
+    assert len(encoder) == len(b"".join(encoder))
+    assert encoder.headers["Content-Length"] == str(len(encoder))
+    # Iterating again produces the same body, so requests can be retried
+    assert len(encoder) == len(b"".join(encoder))
+
+
+def test_encoder_chunks_are_bounded(audio_file):
+    encoder = MultipartEncoder({}, {"audio_file": str(audio_file)}, chunk_size=1000)
+
+    assert max(len(chunk) for chunk in encoder) <= 1000
+
+
+def test_encoder_progress(audio_file):
+    progress = []
+    encoder = MultipartEncoder(
+        {"title": "Episode"},
+        {"audio_file": str(audio_file)},
+        chunk_size=65536,
+        progress=lambda sent, total: progress.append((sent, total))
+    )
+
+    b"".join(encoder)
+
+    assert progress[-1] == (len(encoder), len(encoder))
+    assert [sent for sent, _ in progress] == sorted(sent for sent, _ in progress)
+
+
+def test_encoder_closes_file_when_aborted(audio_file):
+    encoder = MultipartEncoder({}, {"audio_file": str(audio_file)}, chunk_size=10)
+    opened = []
+    real_open = open
+
+    def tracking_open(*args, **kwargs):
+        f = real_open(*args, **kwargs)
+        opened.append(f)
+        return f
+
+    with patch("builtins.open", tracking_open):
+        chunks = iter(encoder)
+        next(chunks)
+        next(chunks)
+        chunks.close()
+
+    assert opened and all(f.closed for f in opened)
+
+
+def test_client_streams_when_enabled(audio_file):
+    mock_session = Mock()
+    mock_session.post.return_value.json.return_value = {"id": 1}
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key", stream_uploads=True)
+        episode = client.create_episode(
+            podcast_id=12345,
+            title="Episode",
+            audio_file=str(audio_file)
+        )
+
+    assert episode == {"id": 1}
+    args, kwargs = mock_session.post.call_args
+    assert "files" not in kwargs
+    assert isinstance(kwargs["data"], MultipartEncoder)
+    assert kwargs["headers"]["Content-Type"].startswith("multipart/form-data; boundary=")
+    parts = parse_multipart(kwargs["data"])
+    assert parts["audio_file"].get_payload(decode=True) == audio_file.read_bytes()
+
+
+def test_client_progress_implies_streaming(audio_file):
+    mock_session = Mock()
+    mock_session.put.return_value.json.return_value = {"id": 1}
+    progress = Mock()
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key")
+        client.update_episode(
+            podcast_id=12345,
+            episode_id=1,
+            audio_file=str(audio_file),
+            progress=progress
+        )
+
+    args, kwargs = mock_session.put.call_args
+    b"".join(kwargs["data"])
+    assert progress.called
+
+
+def test_client_without_files_does_not_stream():
+    mock_session = Mock()
+    mock_session.put.return_value.json.return_value = {"id": 1}
+
+    with patch('buzzsprout_client.client.requests.Session', return_value=mock_session):
+        client = BuzzsproutClient(api_key="test_key", stream_uploads=True)
+        client.update_episode(podcast_id=12345, episode_id=1, title="New")
+
+    args, kwargs = mock_session.put.call_args
+    assert kwargs["data"] == {"title": "New"}
+    assert kwargs["files"] is None
+
+
+def test_encoder_reports_progress_after_each_chunk_is_taken(audio_file):
+    progress = []
+    encoder = MultipartEncoder(
+        {}, {"audio_file": str(audio_file)}, chunk_size=65536,
+        progress=lambda sent, total: progress.append(sent)
+    )
+    chunks = iter(encoder)
+
+    first = next(chunks)
+
+    assert progress == []
+    next(chunks)
+    assert progress == [len(first)]
+
+
+def test_async_encoder_reads_in_executor(audio_file):
+    import asyncio
+    import threading
+
+    encoder = MultipartEncoder({"title": "Episode"}, {"audio_file": str(audio_file)}, chunk_size=65536)
+    reader_threads = set()
+    real_open = open
+
+    class TrackingFile:
+        def __init__(self, f):
+            self.f = f
+
+        def read(self, size):
+            reader_threads.add(threading.get_ident())
+            return self.f.read(size)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self.f.close()
+
+    async def collect():
+        return b"".join([chunk async for chunk in encoder]), threading.get_ident()
+
+    with patch("builtins.open", lambda *args, **kwargs: TrackingFile(real_open(*args, **kwargs))):
+        body, loop_thread = asyncio.run(collect())
+
+    assert body == b"".join(encoder)
+    assert reader_threads and loop_thread not in reader_threads
+
+
+def test_encoder_escapes_header_parameters(tmp_path):
+    path = tmp_path / 'a"b\r\nX-Injected: 1.mp3'
+    path.write_bytes(b"audio")
+    encoder = MultipartEncoder({'ti"tle': "Episode"}, {"audio_file": str(path)})
+
+    body = b"".join(encoder)
+
+    assert b"\r\nX-Injected" not in body
+    assert b'filename="a%22b%0D%0AX-Injected: 1.mp3"' in body
+    assert b'name="ti%22tle"' in body
+    assert len(encoder) == len(body)
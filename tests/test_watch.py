@@ -0,0 +1,158 @@
+import threading
+
+import pytest
+
+from buzzsprout_client import EpisodeWatcher
+from buzzsprout_client.watch import EpisodeEvent
+
+
+class FakeClient:
+    def __init__(self):
+        self.episodes = {1: [{"id": 10, "title": "One", "total_plays": 5}], 2: []}
+        self.calls = []
+
+    def get_episodes(self, podcast_id):
+        self.calls.append(podcast_id)
+        return [dict(episode) for episode in self.episodes[podcast_id]]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def client():
+    return FakeClient()
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def make_watcher(client, clock, tmp_path, **kwargs):
+    kwargs.setdefault("min_interval", 10)
+    kwargs.setdefault("max_interval", 80)
+    return EpisodeWatcher(client, str(tmp_path / "watch.sqlite"), [1, 2], clock=clock, **kwargs)
+
+
+def test_first_poll_is_a_silent_baseline(client, clock, tmp_path):
+    watcher = make_watcher(client, clock, tmp_path)
+
+    assert watcher.poll(1) == []
+
+
+def test_emit_existing(client, clock, tmp_path):
+    watcher = make_watcher(client, clock, tmp_path, emit_existing=True)
+
+    assert watcher.poll(1) == [
+        EpisodeEvent("created", 1, 10, {"id": 10, "title": "One"})
+    ]
+
+
+def test_created_updated_deleted(client, clock, tmp_path):
+    watcher = make_watcher(client, clock, tmp_path)
+    watcher.poll(1)
+
+    client.episodes[1] = [
+        {"id": 10, "title": "One (edited)", "total_plays": 5, "private": True},
+        {"id": 11, "title": "Two"},
+    ]
+    assert watcher.poll(1) == [
+        EpisodeEvent(
+            "updated", 1, 10,
+            {"title": "One (edited)", "private": True},
+            {"title": "One", "private": None},
+        ),
+        EpisodeEvent("created", 1, 11, {"id": 11, "title": "Two"}),
+    ]
+
+    client.episodes[1] = [{"id": 11, "title": "Two"}]
+    assert watcher.poll(1) == [
+        EpisodeEvent("deleted", 1, 10, {}, {"id": 10, "title": "One (edited)", "private": True})
+    ]
+    assert watcher.poll(1) == []
+
+
+def test_ignored_fields_do_not_trigger_updates(client, clock, tmp_path):
+    watcher = make_watcher(client, clock, tmp_path)
+    watcher.poll(1)
+
+    client.episodes[1][0]["total_plays"] = 500
+
+    assert watcher.poll(1) == []
+
+
+def test_state_survives_restart(client, clock, tmp_path):
+    watcher = make_watcher(client, clock, tmp_path)
+    watcher.poll(1)
+    watcher.close()
+
+    client.episodes[1].append({"id": 11, "title": "Two"})
+    restarted = make_watcher(client, clock, tmp_path)
+
+    assert [event.episode_id for event in restarted.poll(1)] == [11]
+
+
+def test_interval_backs_off_while_quiet_and_resets_on_change(client, clock, tmp_path):
+    watcher = make_watcher(client, clock, tmp_path)
+    watcher.poll(1)
+    assert watcher.interval(1) == 10
+
+    intervals = []
+    for _ in range(5):
+        watcher.poll(1)
+        intervals.append(watcher.interval(1))
+    assert intervals == [20, 40, 80, 80, 80]
+    assert watcher.next_poll(1) == clock.now + 80
+
+    client.episodes[1].append({"id": 11})
+    watcher.poll(1)
+    assert watcher.interval(1) == 10
+
+
+def test_poll_due_skips_podcasts_not_due(client, clock, tmp_path):
+    watcher = make_watcher(client, clock, tmp_path)
+    watcher.poll_due()
+    watcher.poll(1)  # podcast 1 now waits 20s, podcast 2 still 10s
+    client.calls.clear()
+
+    clock.now += 10
+    watcher.poll_due()
+
+    assert client.calls == [2]
+
+
+def test_watch_yields_events_and_sleeps_until_due(client, clock, tmp_path):
+    watcher = make_watcher(client, clock, tmp_path)
+    stop = threading.Event()
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock.sleep(seconds)
+        if len(sleeps) == 2:
+            client.episodes[2].append({"id": 20, "title": "New"})
+
+    events = []
+    for event in watcher.watch(stop, sleep=sleep):
+        events.append(event)
+        stop.set()
+
+    assert [(event.kind, event.podcast_id, event.episode_id) for event in events] == [
+        ("created", 2, 20)
+    ]
+    # Both podcasts were quiet after the first wait, so the second is longer
+    assert sleeps == [10, 20]
+
+
+def test_invalid_intervals(client, clock, tmp_path):
+    with pytest.raises(ValueError):
+        make_watcher(client, clock, tmp_path, min_interval=100, max_interval=10)